@@ -22,11 +22,17 @@ def main():
     print(f"📡 Grinding {len(custom_feeds)} feeds...\n")
 
     # Note: This example won't work in environments without internet access
-    # In production, replace this with the actual grinder
+    # Feeds are fetched concurrently and each one is brewed as soon as it
+    # has been parsed, while the remaining feeds are still downloading
     grinder = Grinder(custom_feeds)
-    articles = grinder.grind()
+    barista = Barista(SimpleBarista())
+
+    processed = []
+    for batch in barista.brew_stream(grinder.stream()):
+        processed.extend(batch)
+        print(f"✓ Brewed {len(batch)} articles from {batch[0]['source']}")
 
-    if not articles:
+    if not processed:
         print("⚠️  No articles found. This might be due to:")
         print("   - No internet connection")
         print("   - RSS feeds are not accessible")
@@ -36,13 +42,6 @@ def main():
         )
         return
 
-    print(f"✓ Ground {len(articles)} articles")
-    print("🤖 Processing with SimpleBarista...")
-
-    # Process articles
-    barista = Barista(SimpleBarista())
-    processed = barista.brew(articles)
-
     print(f"✓ Processed {len(processed)} articles")
     print("☕ Launching TUI...\n")
 
@@ -10,7 +10,6 @@ Before running this example:
 """
 
 import os
-from dotenv import load_dotenv
 from examples.demo import create_mock_articles
 from moka_news.barista import Barista, OpenAIBarista, SimpleBarista
 from moka_news.cup import serve
@@ -20,6 +19,8 @@ def main():
     """Example using OpenAI for summaries"""
 
     # Load environment variables
+    from dotenv import load_dotenv
+
     load_dotenv()
 
     print("☕ MoKa News - OpenAI Example\n")
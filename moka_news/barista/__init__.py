@@ -3,98 +3,997 @@ The Barista - AI Agent for Content Processing
 Generates titles and summaries using AI APIs (OpenAI/Anthropic)
 """
 
+from __future__ import annotations
+
 import os
+import re
+import asyncio
+import importlib
+import importlib.util
+import json
+import random
+import shutil
+import signal
 import subprocess
-from typing import Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
+from typing import Any, AsyncIterable, Iterable, Iterator
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit
 from abc import ABC, abstractmethod
 from moka_news.logger import get_logger
+from moka_news.config import DEFAULT_PROMPTS
+from moka_news.barista.cache import ExactCache, SemanticCache
+from moka_news.barista.ratelimit import RateLimiter
 from moka_news.constants import (
     DEFAULT_AI_MODELS,
     MAX_CONTENT_LENGTH,
     MAX_TOKENS,
     SUMMARY_TRUNCATE_LENGTH,
+    NO_SUMMARY_TEXT,
     TITLE_MAX_LENGTH,
-    CLI_VERSION_CHECK_TIMEOUT,
-    CLI_GENERATION_TIMEOUT
+    CLI_GENERATION_TIMEOUT,
+    CLI_BATCH_TIMEOUT_PER_ARTICLE,
+    CLI_MAX_PARALLEL,
+    HTTP_TIMEOUT,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    SDK_CLIENT_CACHE_SIZE,
+    BREW_MAX_WORKERS,
+    BREW_BATCH_SIZE,
+    PASSTHROUGH_MIN_SUMMARY_LENGTH,
+    TRACKING_QUERY_PARAMS,
+    API_MAX_ATTEMPTS,
+    API_RETRY_INITIAL_DELAY,
+    API_RETRY_MAX_DELAY,
+    API_RETRY_STATUS_CODES,
+    MULTI_PROVIDER_STRATEGIES,
+    MULTI_PROVIDER_COOLDOWN,
+    SIMPLE_SUMMARY_CACHE_SIZE,
+    PROMPT_SUFFIX_CACHE_SIZE,
+    OFFLINE_BATCH_MIN_ARTICLES,
+    OFFLINE_BATCH_MAX_ARTICLES,
+    OFFLINE_BATCH_POLL_INTERVAL,
+    OFFLINE_BATCH_TIMEOUT,
 )
 
 logger = get_logger(__name__)
 
+# orjson parses large batched responses noticeably faster when available
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Decodes the first JSON value in a string and reports where it ended
+_JSON_DECODER = json.JSONDecoder()
+
+# Non-empty TITLE:/SUMMARY: lines in an AI response; the value is captured
+# without surrounding whitespace so no per-match strip() is needed
+_RESPONSE_RE = re.compile(
+    r"^[ \t]*(TITLE|SUMMARY):[ \t]*(\S.*?)[ \t\r]*$", re.MULTILINE
+)
+
+# A non-empty TITLE:/SUMMARY: line that has been fully received
+_COMPLETE_LINE_RE = re.compile(r"^[ \t]*(TITLE|SUMMARY):[ \t]*\S.*\n", re.MULTILINE)
+
+# Used when the custom prompts do not set a system message
+_DEFAULT_SYSTEM_MESSAGE = DEFAULT_PROMPTS["system_message"]
 
-def _build_prompt(article: Dict[str, Any], keywords: list = None, prompts: Dict[str, str] = None, max_content_length: int = MAX_CONTENT_LENGTH) -> str:
+
+def _build_prompt(
+    article: dict[str, Any],
+    keywords: list | None = None,
+    prompts: dict[str, str] | None = None,
+    max_content_length: int = MAX_CONTENT_LENGTH,
+) -> str:
     """
     Build a prompt for summary generation with optional keywords
-    
+
     Args:
         article: Article dictionary with title and summary
         keywords: Optional list of keywords to focus on
         prompts: Optional dictionary with custom prompts (user_prompt, keywords_section, format_section)
         max_content_length: Maximum characters of content to include (default: 1500)
-        
+
     Returns:
         Formatted prompt string
     """
+    article_part, stable_part = _prompt_parts(
+        article, keywords, prompts, max_content_length
+    )
+    return article_part + stable_part
+
+
+def _prompt_parts(
+    article: dict[str, Any],
+    keywords: list | None = None,
+    prompts: dict[str, str] | None = None,
+    max_content_length: int = MAX_CONTENT_LENGTH,
+) -> tuple[str, str]:
+    """
+    The two halves of _build_prompt: the article part and the stable tail
+
+    The tail (keywords and format sections) is identical for every article
+    of a run, which lets providers with prompt caching send it separately.
+
+    Args:
+        article: Article dictionary with title and summary
+        keywords: Optional list of keywords to focus on
+        prompts: Optional dictionary with custom prompts
+        max_content_length: Maximum characters of content to include
+
+    Returns:
+        Tuple of (article part, stable tail)
+    """
     # Use default prompts if not provided
     if prompts is None:
-        from moka_news.config import DEFAULT_PROMPTS
         prompts = DEFAULT_PROMPTS
-    
+
     # Build the base prompt using the template with placeholders
-    # Configurable content truncation for better context and higher quality summaries
+    # Configurable content truncation for better context and higher quality
+    # summaries. This is the only slice on the success path; the shorter
+    # fallback slice is only taken by _fallback when the provider fails.
     base_prompt = prompts.get("user_prompt", "").format(
-        title=article['title'],
-        content=article['summary'][:max_content_length]
+        title=article["title"], content=article["summary"][:max_content_length]
+    )
+
+    # The keywords and format sections are the same for every article in a
+    # run, so they are rendered once and reused
+    return base_prompt, _prompt_suffix(
+        tuple(keywords or ()),
+        prompts.get("keywords_section") or "",
+        prompts.get("format_section") or "",
     )
-    
-    # Add keywords section if keywords are provided
-    if keywords and len(keywords) > 0:
-        keywords_str = ", ".join(keywords)
-        keywords_template = prompts.get("keywords_section", "")
-        if keywords_template:
-            base_prompt += keywords_template.format(keywords=keywords_str)
-    
-    # Add format section
-    format_template = prompts.get("format_section", "")
-    if format_template:
-        base_prompt += format_template
-    
-    return base_prompt
-
-
-def _parse_ai_response(content: str, article: Dict[str, Any]) -> Dict[str, str]:
+
+
+@lru_cache(maxsize=PROMPT_SUFFIX_CACHE_SIZE)
+def _prompt_suffix(
+    keywords: tuple[str, ...], keywords_template: str, format_template: str
+) -> str:
+    """
+    Render the article-independent tail of a prompt
+
+    Args:
+        keywords: Keywords to focus on (empty for none)
+        keywords_template: Template with a {keywords} placeholder
+        format_template: Output format instructions
+
+    Returns:
+        Keywords section (if any) followed by the format section
+    """
+    suffix = ""
+    if keywords and keywords_template:
+        suffix = keywords_template.format(keywords=", ".join(keywords))
+    return suffix + format_template
+
+
+def _parse_ai_response(content: str, article: dict[str, Any]) -> dict[str, str]:
     """
     Parse AI response to extract title and summary
-    
+
     Args:
         content: AI response content with TITLE: and SUMMARY: markers
         article: Original article dict for fallback values
-        
+
     Returns:
         Dictionary with 'title' and 'summary' keys
     """
-    lines = content.strip().split("\n")
-    result = {
-        "title": article.get("title", "No Title"),
-        "summary": article.get("summary", "")[:SUMMARY_TRUNCATE_LENGTH]
+    # Single C-level scan; later markers win, as with the old line-by-line loop
+    parsed = dict(match.groups() for match in _RESPONSE_RE.finditer(content))
+    if "TITLE" in parsed and "SUMMARY" in parsed:
+        return {"title": parsed["TITLE"], "summary": parsed["SUMMARY"]}
+
+    fallback = _fallback(article)
+    return _Fallback(
+        title=parsed.get("TITLE", fallback["title"]),
+        summary=parsed.get("SUMMARY", fallback["summary"]),
+    )
+
+
+class _Fallback(dict):
+    """
+    A result, or processed article, that did not fully come from the provider
+
+    Behaves like a plain dict for callers; the brew paths check for it so a
+    provider error or an unparseable response is never written to the
+    response caches and is retried on the next brew.
+    """
+
+
+def _fallback(article: dict[str, Any]) -> dict[str, str]:
+    """
+    Result used when the AI provider fails or its response cannot be parsed
+
+    Args:
+        article: Original article dictionary
+
+    Returns:
+        Dictionary with the original title and a truncated summary
+    """
+    return _Fallback(
+        title=article.get("title", "No Title"),
+        summary=(article.get("summary") or "")[:SUMMARY_TRUNCATE_LENGTH],
+    )
+
+
+def _read_stream(pieces: Iterable[str | None]) -> str:
+    """
+    Accumulate streamed response text
+
+    Stops consuming the stream once both the TITLE and SUMMARY lines are
+    complete, since _parse_ai_response ignores anything after them.
+
+    Args:
+        pieces: Text deltas as they arrive from the provider
+
+    Returns:
+        Response text received so far
+    """
+    buffer = ""
+    for piece in pieces:
+        if not piece:
+            continue
+        buffer += piece
+        if "\n" in piece and _response_complete(buffer):
+            break
+    return buffer
+
+
+async def _read_stream_async(pieces: AsyncIterable[str | None]) -> str:
+    """Async counterpart of _read_stream"""
+    buffer = ""
+    async for piece in pieces:
+        if not piece:
+            continue
+        buffer += piece
+        if "\n" in piece and _response_complete(buffer):
+            break
+    return buffer
+
+
+def _response_complete(buffer: str) -> bool:
+    """Whether both the TITLE and SUMMARY lines have been fully received"""
+    return len({match.group(1) for match in _COMPLETE_LINE_RE.finditer(buffer)}) == 2
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a failed API call
+
+    Honors a Retry-After header on rate-limit responses, otherwise uses
+    exponential backoff with full jitter.
+
+    Args:
+        error: Exception raised by the provider SDK
+        attempt: Number of attempts made so far (1-based)
+
+    Returns:
+        Delay in seconds
+    """
+    retry_after = _retry_after(error)
+    if retry_after is not None:
+        return min(retry_after, API_RETRY_MAX_DELAY)
+    backoff = min(API_RETRY_INITIAL_DELAY * 2 ** (attempt - 1), API_RETRY_MAX_DELAY)
+    return random.uniform(0, backoff)
+
+
+def _retry_after(error: Exception) -> float | None:
+    """
+    Seconds the provider asked us to wait before retrying, if it said
+
+    Reads retry-after-ms (sent by OpenAI, more precise) and Retry-After,
+    which may hold either seconds or an HTTP date.
+
+    Args:
+        error: Exception raised by the provider SDK
+
+    Returns:
+        Delay in seconds, or None when the response carries no hint
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) if response is not None else None
+    # Mistral exceptions carry the response headers themselves
+    headers = headers or getattr(error, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(float(retry_after_ms) / 1000, 0.0)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(retry_at.timestamp() - time.time(), 0.0)
+    return None
+
+
+def _is_transient(error: BaseException, retryable: tuple) -> bool:
+    """
+    Whether a failed API call is worth retrying
+
+    Errors carrying an HTTP status of their own (Mistral's http_status)
+    only count for the statuses in API_RETRY_STATUS_CODES, as the same
+    exception type is raised for bad requests.
+
+    Args:
+        error: Exception raised by the provider SDK
+        retryable: Exception types the provider treats as transient
+
+    Returns:
+        True if the call may succeed when repeated
+    """
+    if not isinstance(error, retryable):
+        return False
+    status = getattr(error, "http_status", None)
+    return status is None or status in API_RETRY_STATUS_CODES
+
+
+def _call_with_retries(call, retryable: tuple, limiter: RateLimiter | None = None):
+    """
+    Call a provider API, retrying transient failures
+
+    Args:
+        call: Zero-argument callable performing the request
+        retryable: Exception types worth retrying (rate limits, timeouts,
+                   connection errors, 5xx responses); anything else, such
+                   as a bad request or a bug, is raised immediately
+        limiter: Optional RateLimiter held for each attempt, so the slot is
+                 handed back while waiting to retry
+
+    Returns:
+        Whatever call returns
+    """
+    for attempt in range(1, API_MAX_ATTEMPTS + 1):
+        try:
+            if limiter is None:
+                return call()
+            with limiter:
+                return call()
+        except retryable as e:
+            if attempt == API_MAX_ATTEMPTS or not _is_transient(e, retryable):
+                raise
+            delay = _retry_delay(e, attempt)
+            logger.warning(
+                f"Transient API error ({type(e).__name__}), retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+
+
+async def _call_with_retries_async(
+    call, retryable: tuple, limiter: RateLimiter | None = None
+):
+    """
+    Async counterpart of _call_with_retries
+
+    Args:
+        call: Zero-argument coroutine function performing the request
+        retryable: Exception types worth retrying
+        limiter: Optional RateLimiter held for each attempt
+
+    Returns:
+        Whatever call returns
+    """
+    for attempt in range(1, API_MAX_ATTEMPTS + 1):
+        try:
+            if limiter is None:
+                return await call()
+            async with limiter:
+                return await call()
+        except retryable as e:
+            if attempt == API_MAX_ATTEMPTS or not _is_transient(e, retryable):
+                raise
+            delay = _retry_delay(e, attempt)
+            logger.warning(
+                f"Transient API error ({type(e).__name__}), retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+
+def _poll_until(fetch, done, poll_interval: float, timeout: float):
+    """
+    Call fetch until done(result) is true
+
+    Args:
+        fetch: Zero-argument callable returning the current state
+        done: Predicate telling whether the state is final
+        poll_interval: Seconds between calls
+        timeout: Seconds before giving up
+
+    Returns:
+        The final state
+
+    Raises:
+        TimeoutError: If the state is still not final after timeout seconds
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        state = fetch()
+        if done(state):
+            return state
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Still waiting after {timeout:.0f}s")
+        time.sleep(poll_interval)
+
+
+def _build_http_client():
+    """
+    Build a pooled HTTP client for the OpenAI/Anthropic SDKs
+
+    A keep-alive pool lets the concurrent requests issued by Barista.brew
+    reuse TCP/TLS connections instead of renegotiating them.
+    HTTP/2 is enabled when the optional h2 package is installed.
+
+    Returns:
+        httpx.Client instance, or None to let the SDK use its own default
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+
+    return httpx.Client(**_http_client_options(httpx))
+
+
+@lru_cache(maxsize=None)
+def _shared_http_client():
+    """
+    Process-wide pooled HTTP client shared by every sync SDK client
+
+    OpenAI and Anthropic clients for any API key send their requests
+    through this one pool (httpx.Client is thread-safe), so connections
+    and TLS sessions are reused across providers and Barista instances.
+
+    Returns:
+        httpx.Client instance, or None when httpx is not installed
+    """
+    return _build_http_client()
+
+
+def _build_async_http_client():
+    """
+    Async counterpart of _build_http_client for AsyncOpenAI/AsyncAnthropic
+
+    With HTTP/2 the coroutines gathered by Barista.brew_async are
+    multiplexed over a few connections instead of opening one each.
+
+    Returns:
+        httpx.AsyncClient instance, or None to let the SDK use its own default
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+
+    return httpx.AsyncClient(**_http_client_options(httpx))
+
+
+def _http_client_options(httpx) -> dict[str, Any]:
+    """Pool settings shared by the sync and async HTTP clients"""
+    try:
+        import h2  # noqa: F401
+
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return {
+        "http2": http2,
+        "timeout": HTTP_TIMEOUT,
+        "limits": httpx.Limits(
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=HTTP_MAX_CONNECTIONS,
+        ),
     }
-    
-    for line in lines:
-        if line.startswith("TITLE:"):
-            result["title"] = line.replace("TITLE:", "").strip()
-        elif line.startswith("SUMMARY:"):
-            result["summary"] = line.replace("SUMMARY:", "").strip()
-    
-    return result
+
+
+@lru_cache(maxsize=None)
+def _sdk(module: str, package: str):
+    """
+    Import a provider SDK module once per process
+
+    SDKs stay optional and are only imported when their provider is
+    created, so startup does not pay for SDKs that are not used. A failed
+    import is not cached and is retried on the next call.
+
+    Args:
+        module: Module to import (e.g. "google.generativeai")
+        package: pip package providing it, for the error message
+
+    Returns:
+        The imported module
+
+    Raises:
+        ImportError: If the package is not installed
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(
+            f"{package} package is required. Install with: pip install {package}"
+        ) from None
+
+
+def _require_sdk(module: str, package: str) -> None:
+    """
+    Check that a provider SDK is installed without importing it
+
+    Providers call this from __init__ so a missing package is still
+    reported at construction, while the import itself (hundreds of ms for
+    google-generativeai and its gRPC stack) is deferred to the first
+    request. Runs served entirely from the cache never pay for it.
+
+    Args:
+        module: Module to look up (e.g. "google.generativeai")
+        package: pip package providing it, for the error message
+
+    Raises:
+        ImportError: If the package is not installed
+    """
+    try:
+        found = importlib.util.find_spec(module) is not None
+    except ImportError:
+        # A missing parent package (e.g. "google") raises instead of returning None
+        found = False
+    if not found:
+        raise ImportError(
+            f"{package} package is required. Install with: pip install {package}"
+        )
+
+
+# SDK clients are shared per API key, so every provider instance in the
+# process reuses one connection pool. Failed imports are not cached.
+@lru_cache(maxsize=SDK_CLIENT_CACHE_SIZE)
+def _openai_client(api_key: str | None):
+    openai = _sdk("openai", "openai")
+    # Retries are handled by _call_with_retries
+    return openai.OpenAI(
+        api_key=api_key, http_client=_shared_http_client(), max_retries=0
+    )
+
+
+@lru_cache(maxsize=SDK_CLIENT_CACHE_SIZE)
+def _anthropic_client(api_key: str | None):
+    anthropic = _sdk("anthropic", "anthropic")
+    return anthropic.Anthropic(
+        api_key=api_key, http_client=_shared_http_client(), max_retries=0
+    )
+
+
+@lru_cache(maxsize=SDK_CLIENT_CACHE_SIZE)
+def _gemini_model(api_key: str | None):
+    genai = _sdk("google.generativeai", "google-generativeai")
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel("gemini-pro")
+
+
+@lru_cache(maxsize=SDK_CLIENT_CACHE_SIZE)
+def _mistral_client(api_key: str | None):
+    return _sdk("mistralai.client", "mistralai").MistralClient(api_key=api_key)
+
+
+_BATCH_INSTRUCTIONS = """For each article below, generate:
+1. A concise, engaging title (max 80 characters)
+2. A brief summary (approximately 200-250 characters)
+
+Respond with JSON only, in this exact shape:
+{"articles": [{"id": <article id>, "title": "<title>", "summary": "<summary>"}]}
+"""
+
+
+# Tool definition that makes Anthropic return batch results as schema-checked JSON
+_BATCH_TOOL = {
+    "name": "submit_summaries",
+    "description": "Submit the title and summary generated for each article.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "articles": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "title": {"type": "string"},
+                        "summary": {"type": "string"},
+                    },
+                    "required": ["id", "title", "summary"],
+                },
+            },
+        },
+        "required": ["articles"],
+    },
+}
+
+
+def _batch_prompt_compatible(prompts: dict[str, str] | None) -> bool:
+    """
+    Whether prompts can be served by the fixed batch instructions
+
+    _build_batch_prompt replaces user_prompt and format_section with
+    _BATCH_INSTRUCTIONS, which mirror the defaults. Custom versions of
+    either must reach the model, so those runs use per-article requests.
+
+    Args:
+        prompts: Prompts configured for the Barista, if any
+
+    Returns:
+        True if user_prompt and format_section are the defaults
+    """
+    if not prompts:
+        return True
+    return all(
+        prompts.get(name, DEFAULT_PROMPTS[name]) == DEFAULT_PROMPTS[name]
+        for name in ("user_prompt", "format_section")
+    )
+
+
+def _build_batch_prompt(
+    articles: list[dict[str, Any]],
+    keywords: list | None = None,
+    prompts: dict[str, str] | None = None,
+    max_content_length: int = MAX_CONTENT_LENGTH,
+) -> str:
+    """
+    Build a single prompt asking for titles and summaries of several articles
+
+    Args:
+        articles: List of article dictionaries with title and summary
+        keywords: Optional list of keywords to focus on
+        prompts: Optional dictionary with custom prompts (only keywords_section
+            is used; see _batch_prompt_compatible)
+        max_content_length: Maximum characters of content to include per article
+
+    Returns:
+        Formatted prompt string
+    """
+    if prompts is None:
+        prompts = DEFAULT_PROMPTS
+
+    parts = [_BATCH_INSTRUCTIONS]
+
+    keywords_template = prompts.get("keywords_section", "")
+    if keywords and keywords_template:
+        parts.append(keywords_template.format(keywords=", ".join(keywords)) + "\n")
+
+    parts.append("\nARTICLES:\n")
+    parts.extend(
+        f"[{i}] Title: {article['title']}\nContent: {article['summary'][:max_content_length]}\n\n"
+        for i, article in enumerate(articles)
+    )
+    return "".join(parts)
+
+
+def _parse_batch_response(
+    content: str, articles: list[dict[str, Any]]
+) -> list[dict[str, str]]:
+    """
+    Parse a batched JSON response back into per-article results
+
+    Args:
+        content: AI response content containing the JSON payload
+        articles: Articles the batch was built from, in prompt order
+
+    Returns:
+        List of dictionaries with 'title' and 'summary' keys, one per article
+
+    Raises:
+        ValueError: If the response is not valid JSON or misses an article
+    """
+    start = min(
+        (i for i in (content.find("{"), content.find("[")) if i >= 0), default=-1
+    )
+    if start < 0:
+        raise ValueError("No JSON found in batch response")
+
+    try:
+        data = _json_loads(content[start:])
+    except ValueError:
+        # Trailing text after the JSON (a closing ``` fence, a remark):
+        # decode just the first value rather than failing the whole batch
+        data = _JSON_DECODER.raw_decode(content, start)[0]
+    return _batch_results(data, articles)
+
+
+def _batch_results(data: Any, articles: list[dict[str, Any]]) -> list[dict[str, str]]:
+    """
+    Map decoded batch output ({"articles": [...]} or a bare list) back to articles
+
+    Args:
+        data: Decoded JSON payload or tool input
+        articles: Articles the batch was built from, in prompt order
+
+    Returns:
+        List of dictionaries with 'title' and 'summary' keys, one per article
+
+    Raises:
+        ValueError: If an article is missing from the payload
+    """
+    items = data.get("articles", []) if isinstance(data, dict) else data
+
+    by_id = {}
+    for item in items:
+        try:
+            by_id[int(item["id"])] = item
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    results = []
+    for i in range(len(articles)):
+        item = by_id.get(i)
+        if not item or not item.get("title") or not item.get("summary"):
+            raise ValueError(f"Batch response is missing article {i}")
+        results.append(
+            {
+                "title": str(item["title"]).strip(),
+                "summary": str(item["summary"]).strip(),
+            }
+        )
+
+    return results
 
 
 class AIProvider(ABC):
     """Abstract base class for AI providers"""
 
-    @abstractmethod
-    def generate_summary(self, article: Dict[str, Any], keywords: list = None, prompts: Dict[str, str] = None, max_content_length: int = MAX_CONTENT_LENGTH, max_tokens: int = MAX_TOKENS) -> Dict[str, str]:
+    # Whether generate_summary_batch packs several articles into one request
+    supports_batch = False
+
+    # Whether generate_summary_offline submits to a discounted provider Batch API
+    supports_offline_batch = False
+
+    # Human readable name used in log messages
+    display_name = "AI provider"
+
+    # Exceptions from _call_llm that are transient (rate limits, timeouts,
+    # 5xx responses) rather than a problem with the request itself
+    _retryable: tuple[type, ...] = ()
+
+    def generate_summary(
+        self,
+        article: dict[str, Any],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> dict[str, str]:
         """
         Generate a summary and improved title for an article
 
+        Builds the prompt, sends it with _call_llm and parses the TITLE/SUMMARY
+        markers. Any error falls back to the original title and a truncated
+        summary. Providers only implement _call_llm (and optionally
+        _call_llm_async); those that skip the model, like SimpleBarista,
+        override this method as well.
+
+        Args:
+            article: Article dictionary with title, link, summary
+            keywords: Optional list of keywords to focus the summary on
+            prompts: Optional dictionary with custom prompts
+            max_content_length: Maximum characters of content to include
+            max_tokens: Maximum tokens for AI response
+
+        Returns:
+            Dictionary with 'title' and 'summary' keys
+        """
+        try:
+            prompt = self._prompt(article, keywords, prompts, max_content_length)
+            return _parse_ai_response(
+                self._call_llm(prompt, prompts, max_tokens), article
+            )
+        except subprocess.TimeoutExpired:
+            logger.error(f"{self.display_name} timeout")
+            return _fallback(article)
+        except Exception as e:
+            logger.error(
+                f"Error generating summary with {self.display_name}: {e}", exc_info=True
+            )
+            return _fallback(article)
+
+    def _prompt(
+        self,
+        article: dict[str, Any],
+        keywords: list | None,
+        prompts: dict[str, str] | None,
+        max_content_length: int,
+    ):
+        """
+        Prompt handed to _call_llm
+
+        Providers that send the stable part of the prompt separately (for
+        prompt caching) override this together with _call_llm.
+        """
+        return _build_prompt(article, keywords, prompts, max_content_length)
+
+    @abstractmethod
+    def _call_llm(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        """
+        Send a prompt to the model and return the raw response text
+
+        Args:
+            prompt: Prompt built by _build_prompt
+            prompts: Custom prompts (for the system message), if any
+            max_tokens: Maximum tokens for AI response
+
+        Returns:
+            Response text containing TITLE: and SUMMARY: lines
+        """
+
+    async def _call_llm_async(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        """Coroutine version of _call_llm; runs it in the loop's default executor by default"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._call_llm, prompt, prompts, max_tokens
+        )
+
+    def generate_summary_batch(
+        self,
+        articles: list[dict[str, Any]],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> list[dict[str, str]]:
+        """
+        Generate summaries and improved titles for several articles
+
+        The default implementation calls generate_summary once per article;
+        providers that can answer many articles in one request override it.
+
+        Args:
+            articles: List of article dictionaries
+            keywords: Optional list of keywords to focus the summaries on
+            prompts: Optional dictionary with custom prompts
+            max_content_length: Maximum characters of content to include per article
+            max_tokens: Maximum tokens for AI response per article
+
+        Returns:
+            List of dictionaries with 'title' and 'summary' keys, in input order
+        """
+        return [
+            self.generate_summary(
+                article, keywords, prompts, max_content_length, max_tokens
+            )
+            for article in articles
+        ]
+
+    def generate_summary_offline(
+        self,
+        articles: list[dict[str, Any]],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> list[dict[str, str]]:
+        """
+        Generate summaries through the provider's offline Batch API
+
+        Offline batches are billed at a discount but may take up to 24 hours,
+        so this is meant for non-interactive runs. Runs larger than
+        OFFLINE_BATCH_MAX_ARTICLES are split into several batches, all
+        submitted before any is polled so they are processed side by side.
+        Articles a batch could not answer are retried with generate_summary.
+        Providers without an offline Batch API (supports_offline_batch is
+        False) answer through generate_summary_batch instead.
+
+        Args:
+            articles: List of article dictionaries
+            keywords: Optional list of keywords to focus the summaries on
+            prompts: Optional dictionary with custom prompts
+            max_content_length: Maximum characters of content to include per article
+            max_tokens: Maximum tokens for AI response per article
+
+        Returns:
+            List of dictionaries with 'title' and 'summary' keys, in input order
+        """
+        if not self.supports_offline_batch:
+            return self.generate_summary_batch(
+                articles, keywords, prompts, max_content_length, max_tokens
+            )
+
+        chunks = [
+            articles[i : i + OFFLINE_BATCH_MAX_ARTICLES]
+            for i in range(0, len(articles), OFFLINE_BATCH_MAX_ARTICLES)
+        ]
+        batch_ids = []
+        for chunk in chunks:
+            batch_id = self.submit_batch(
+                chunk, keywords, prompts, max_content_length, max_tokens
+            )
+            logger.info(
+                f"Submitted offline batch {batch_id} with {len(chunk)} articles"
+            )
+            batch_ids.append(batch_id)
+
+        results: list[dict[str, str] | None] = []
+        for batch_id, chunk in zip(batch_ids, chunks):
+            self.poll_batch(batch_id)
+            results.extend(self.collect_results(batch_id, chunk))
+        return [
+            (
+                result
+                if result is not None
+                else self.generate_summary(
+                    article, keywords, prompts, max_content_length, max_tokens
+                )
+            )
+            for article, result in zip(articles, results)
+        ]
+
+    # Offline Batch API hooks, implemented only when supports_offline_batch is True
+
+    def submit_batch(
+        self,
+        articles: list[dict[str, Any]],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> str:
+        """Submit articles to the offline Batch API and return the batch id"""
+        raise NotImplementedError(f"{type(self).__name__} has no offline Batch API")
+
+    def poll_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = OFFLINE_BATCH_POLL_INTERVAL,
+        timeout: float = OFFLINE_BATCH_TIMEOUT,
+    ):
+        """Block until an offline batch has finished processing"""
+        raise NotImplementedError(f"{type(self).__name__} has no offline Batch API")
+
+    def collect_results(
+        self, batch_id: str, articles: list[dict[str, Any]]
+    ) -> list[dict[str, str] | None]:
+        """Results of a finished offline batch, None for articles it did not answer"""
+        raise NotImplementedError(f"{type(self).__name__} has no offline Batch API")
+
+    async def aclose(self):
+        """Close the async SDK client (and its connection pool), if one was opened"""
+        client = getattr(self, "_async_client", None)
+        if client is not None:
+            self._async_client = None
+            await client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+        return False
+
+    async def generate_summary_async(
+        self,
+        article: dict[str, Any],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> dict[str, str]:
+        """
+        Coroutine version of generate_summary
+
+        Awaits _call_llm_async, which providers with an async SDK client or
+        subprocess implement natively. A subclass that overrides
+        generate_summary itself has it run in the loop's default executor.
+
         Args:
             article: Article dictionary with title, link, summary
             keywords: Optional list of keywords to focus the summary on
@@ -105,362 +1004,1420 @@ class AIProvider(ABC):
         Returns:
             Dictionary with 'title' and 'summary' keys
         """
+        if type(self).generate_summary is not AIProvider.generate_summary:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                self.generate_summary,
+                article,
+                keywords,
+                prompts,
+                max_content_length,
+                max_tokens,
+            )
+
+        try:
+            prompt = self._prompt(article, keywords, prompts, max_content_length)
+            return _parse_ai_response(
+                await self._call_llm_async(prompt, prompts, max_tokens), article
+            )
+        except subprocess.TimeoutExpired:
+            logger.error(f"{self.display_name} timeout")
+            return _fallback(article)
+        except Exception as e:
+            logger.error(
+                f"Error generating summary with {self.display_name}: {e}", exc_info=True
+            )
+            return _fallback(article)
+
+    async def generate_summary_batch_async(
+        self,
+        articles: list[dict[str, Any]],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> list[dict[str, str]]:
+        """
+        Coroutine version of generate_summary_batch
+
+        Args:
+            articles: List of article dictionaries
+            keywords: Optional list of keywords to focus the summaries on
+            prompts: Optional dictionary with custom prompts
+            max_content_length: Maximum characters of content to include per article
+            max_tokens: Maximum tokens for AI response per article
+
+        Returns:
+            List of dictionaries with 'title' and 'summary' keys, in input order
+        """
+        if not self.supports_batch:
+            return list(
+                await asyncio.gather(
+                    *(
+                        self.generate_summary_async(
+                            article, keywords, prompts, max_content_length, max_tokens
+                        )
+                        for article in articles
+                    )
+                )
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            self.generate_summary_batch,
+            articles,
+            keywords,
+            prompts,
+            max_content_length,
+            max_tokens,
+        )
+
+
+class OpenAIBarista(AIProvider):
+    """OpenAI-based content processor"""
+
+    supports_batch = True
+    supports_offline_batch = True
+    display_name = "OpenAI"
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_concurrent: int | None = None,
+        rpm: int | None = None,
+        stream: bool = True,
+    ):
+        """
+        Initialize OpenAI provider
+
+        Args:
+            api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            max_concurrent: Maximum requests in flight at once
+            rpm: Maximum requests per minute, spaced evenly
+            stream: Stream single-article responses and stop reading once
+                TITLE and SUMMARY are complete (disable for gateways that
+                do not support streaming)
+        """
+        self.rate_limiter = (
+            RateLimiter(max_concurrent, rpm) if max_concurrent or rpm else None
+        )
+        self.stream = stream
+        _require_sdk("openai", "openai")
+        self._api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self._async_client = None
+
+    @cached_property
+    def client(self):
+        """Shared OpenAI client, built on first use"""
+        return _openai_client(self._api_key)
+
+    @cached_property
+    def _retryable(self) -> tuple[type, ...]:
+        """Rate limits, timeouts, dropped connections and 5xx responses"""
+        openai = _sdk("openai", "openai")
+        return (
+            openai.RateLimitError,
+            openai.APITimeoutError,
+            openai.APIConnectionError,
+            openai.InternalServerError,
+        )
+
+    def _get_async_client(self):
+        """Lazily create the AsyncOpenAI client used by generate_summary_async"""
+        if self._async_client is None:
+            openai = _sdk("openai", "openai")
+            self._async_client = openai.AsyncOpenAI(
+                api_key=self._api_key,
+                http_client=_build_async_http_client(),
+                max_retries=0,
+            )
+        return self._async_client
+
+    def _completion_kwargs(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> dict[str, Any]:
+        """Request parameters shared by the sync and async single-article calls"""
+        system_message = (prompts or {}).get("system_message", _DEFAULT_SYSTEM_MESSAGE)
+        return {
+            "model": DEFAULT_AI_MODELS["openai"],
+            "messages": [
+                {
+                    "role": "system",
+                    "content": system_message,
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.7,
+            "stream": self.stream,
+        }
+
+    def _call_llm(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        """Stream a chat completion, hanging up once TITLE and SUMMARY have arrived"""
+        request = self._completion_kwargs(prompt, prompts, max_tokens)
+
+        def call_api() -> str:
+            if not self.stream:
+                return (
+                    self.client.chat.completions.create(**request)
+                    .choices[0]
+                    .message.content
+                )
+            stream = self.client.chat.completions.create(**request)
+            try:
+                return _read_stream(
+                    chunk.choices[0].delta.content for chunk in stream if chunk.choices
+                )
+            finally:
+                stream.close()
+
+        return _call_with_retries(call_api, self._retryable, self.rate_limiter)
+
+    async def _call_llm_async(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        """Stream a chat completion with the AsyncOpenAI client"""
+        request = self._completion_kwargs(prompt, prompts, max_tokens)
+        client = self._get_async_client()
+
+        async def call_api() -> str:
+            if not self.stream:
+                response = await client.chat.completions.create(**request)
+                return response.choices[0].message.content
+            stream = await client.chat.completions.create(**request)
+            try:
+                return await _read_stream_async(
+                    chunk.choices[0].delta.content
+                    async for chunk in stream
+                    if chunk.choices
+                )
+            finally:
+                await stream.close()
+
+        return await _call_with_retries_async(
+            call_api, self._retryable, self.rate_limiter
+        )
+
+    def generate_summary_batch(
+        self,
+        articles: list[dict[str, Any]],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> list[dict[str, str]]:
+        """Generate summaries for several articles with a single OpenAI request"""
+        try:
+            prompt = _build_batch_prompt(
+                articles, keywords, prompts, max_content_length
+            )
+
+            system_message = (prompts or {}).get(
+                "system_message", _DEFAULT_SYSTEM_MESSAGE
+            )
+
+            response = _call_with_retries(
+                lambda: self.client.chat.completions.create(
+                    model=DEFAULT_AI_MODELS["openai"],
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": system_message,
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    max_tokens=max_tokens * len(articles),
+                    temperature=0.7,
+                    response_format={"type": "json_object"},
+                ),
+                self._retryable,
+                self.rate_limiter,
+            )
+
+            return _parse_batch_response(response.choices[0].message.content, articles)
+        except Exception as e:
+            logger.warning(
+                f"OpenAI batch request failed, falling back to per-article calls: {e}",
+                exc_info=True,
+            )
+            return super().generate_summary_batch(
+                articles, keywords, prompts, max_content_length, max_tokens
+            )
+
+    def submit_batch(
+        self,
+        articles: list[dict[str, Any]],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> str:
+        """Upload one chat completion request per article to the OpenAI Batch API"""
+        lines = []
+        for i, article in enumerate(articles):
+            body = self._completion_kwargs(
+                _build_prompt(article, keywords, prompts, max_content_length),
+                prompts,
+                max_tokens,
+            )
+            del body["stream"]
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": str(i),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": body,
+                    }
+                )
+            )
+
+        upload = self.client.files.create(
+            file=("moka-news-batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    def poll_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = OFFLINE_BATCH_POLL_INTERVAL,
+        timeout: float = OFFLINE_BATCH_TIMEOUT,
+    ):
+        """Block until an OpenAI batch is completed, failed, expired or cancelled"""
+        return _poll_until(
+            lambda: self.client.batches.retrieve(batch_id),
+            lambda batch: batch.status
+            in ("completed", "failed", "expired", "cancelled"),
+            poll_interval,
+            timeout,
+        )
+
+    def collect_results(
+        self, batch_id: str, articles: list[dict[str, Any]]
+    ) -> list[dict[str, str] | None]:
+        """Download an OpenAI batch's output file and map it back by custom_id"""
+        results: list[dict[str, str] | None] = [None] * len(articles)
+        batch = self.client.batches.retrieve(batch_id)
+        if not batch.output_file_id:
+            return results
+
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            i = int(record["custom_id"])
+            content = response["body"]["choices"][0]["message"]["content"]
+            results[i] = _parse_ai_response(content, articles[i])
+        return results
+
+
+class AnthropicBarista(AIProvider):
+    """Anthropic-based content processor"""
+
+    supports_batch = True
+    supports_offline_batch = True
+    display_name = "Anthropic"
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_concurrent: int | None = None,
+        rpm: int | None = None,
+        stream: bool = True,
+    ):
+        """
+        Initialize Anthropic provider
+
+        Args:
+            api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            max_concurrent: Maximum requests in flight at once
+            rpm: Maximum requests per minute, spaced evenly
+            stream: Stream single-article responses and stop reading once
+                TITLE and SUMMARY are complete (disable for gateways that
+                do not support streaming)
+        """
+        self.rate_limiter = (
+            RateLimiter(max_concurrent, rpm) if max_concurrent or rpm else None
+        )
+        self.stream = stream
+        _require_sdk("anthropic", "anthropic")
+        self._api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        self._async_client = None
+
+    @cached_property
+    def client(self):
+        """Shared Anthropic client, built on first use"""
+        return _anthropic_client(self._api_key)
+
+    @cached_property
+    def _retryable(self) -> tuple[type, ...]:
+        """Rate limits, timeouts, dropped connections and 5xx responses"""
+        anthropic = _sdk("anthropic", "anthropic")
+        return (
+            anthropic.RateLimitError,
+            anthropic.APITimeoutError,
+            anthropic.APIConnectionError,
+            anthropic.InternalServerError,
+        )
+
+    def _get_async_client(self):
+        """Lazily create the AsyncAnthropic client used by generate_summary_async"""
+        if self._async_client is None:
+            anthropic = _sdk("anthropic", "anthropic")
+            self._async_client = anthropic.AsyncAnthropic(
+                api_key=self._api_key,
+                http_client=_build_async_http_client(),
+                max_retries=0,
+            )
+        return self._async_client
+
+    def _prompt(
+        self,
+        article: dict[str, Any],
+        keywords: list | None,
+        prompts: dict[str, str] | None,
+        max_content_length: int,
+    ) -> tuple[str, str]:
+        """Article part and stable tail, so the tail can be cached"""
+        return _prompt_parts(article, keywords, prompts, max_content_length)
+
+    def _message_kwargs(
+        self, prompt, prompts: dict[str, str] | None, max_tokens: int
+    ) -> dict[str, Any]:
+        """
+        Request parameters with the stable instructions in a cached system block
+
+        The system message plus the keywords/format sections are the same for
+        every article, so they are marked for prompt caching and only the
+        article part is billed at the full input rate. Prefixes below the
+        model's minimum cacheable length are simply not cached.
+
+        Args:
+            prompt: (article part, stable tail) from _prompt, or a plain prompt
+            prompts: Custom prompts (for the system message), if any
+            max_tokens: Maximum tokens for AI response
+
+        Returns:
+            Keyword arguments for messages.create / messages.stream
+        """
+        article_part, stable_part = (
+            prompt if isinstance(prompt, tuple) else (prompt, "")
+        )
+        system_message = (prompts or {}).get("system_message", _DEFAULT_SYSTEM_MESSAGE)
+        return {
+            "model": DEFAULT_AI_MODELS["anthropic"],
+            "max_tokens": max_tokens,
+            "system": [
+                {
+                    "type": "text",
+                    "text": system_message + stable_part,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+            "messages": [{"role": "user", "content": article_part}],
+        }
+
+    def _call_llm(self, prompt, prompts: dict[str, str] | None, max_tokens: int) -> str:
+        """Stream a message, hanging up once TITLE and SUMMARY have arrived"""
+        request = self._message_kwargs(prompt, prompts, max_tokens)
+
+        def call_api() -> str:
+            if not self.stream:
+                response = self.client.messages.create(**request)
+                _log_cache_usage(response.usage)
+                return response.content[0].text
+            # Leaving the stream context closes the connection, so stopping
+            # early saves the tokens that would be discarded anyway
+            with self.client.messages.stream(**request) as stream:
+                content = _read_stream(stream.text_stream)
+                _log_cache_usage(
+                    getattr(stream.current_message_snapshot, "usage", None)
+                )
+                return content
+
+        return _call_with_retries(call_api, self._retryable, self.rate_limiter)
+
+    async def _call_llm_async(
+        self, prompt, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        """Stream a message with the AsyncAnthropic client"""
+        request = self._message_kwargs(prompt, prompts, max_tokens)
+        client = self._get_async_client()
+
+        async def call_api() -> str:
+            if not self.stream:
+                response = await client.messages.create(**request)
+                _log_cache_usage(response.usage)
+                return response.content[0].text
+            async with client.messages.stream(**request) as stream:
+                content = await _read_stream_async(stream.text_stream)
+                _log_cache_usage(
+                    getattr(stream.current_message_snapshot, "usage", None)
+                )
+                return content
+
+        return await _call_with_retries_async(
+            call_api, self._retryable, self.rate_limiter
+        )
+
+    def generate_summary_batch(
+        self,
+        articles: list[dict[str, Any]],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> list[dict[str, str]]:
+        """Generate summaries for several articles with a single Anthropic request"""
+        try:
+            prompt = _build_batch_prompt(
+                articles, keywords, prompts, max_content_length
+            )
+
+            # Forcing the tool call gets JSON that already matches _BATCH_TOOL's schema
+            response = _call_with_retries(
+                lambda: self.client.messages.create(
+                    model=DEFAULT_AI_MODELS["anthropic"],
+                    max_tokens=max_tokens * len(articles),
+                    messages=[{"role": "user", "content": prompt}],
+                    tools=[_BATCH_TOOL],
+                    tool_choice={"type": "tool", "name": _BATCH_TOOL["name"]},
+                ),
+                self._retryable,
+                self.rate_limiter,
+            )
+
+            for block in response.content:
+                if block.type == "tool_use":
+                    return _batch_results(block.input, articles)
+            return _parse_batch_response(response.content[0].text, articles)
+        except Exception as e:
+            logger.warning(
+                f"Anthropic batch request failed, falling back to per-article calls: {e}",
+                exc_info=True,
+            )
+            return super().generate_summary_batch(
+                articles, keywords, prompts, max_content_length, max_tokens
+            )
+
+    def submit_batch(
+        self,
+        articles: list[dict[str, Any]],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> str:
+        """Submit one message request per article to the Anthropic Message Batches API"""
+        batch = self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": str(i),
+                    "params": self._message_kwargs(
+                        self._prompt(article, keywords, prompts, max_content_length),
+                        prompts,
+                        max_tokens,
+                    ),
+                }
+                for i, article in enumerate(articles)
+            ]
+        )
+        return batch.id
+
+    def poll_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = OFFLINE_BATCH_POLL_INTERVAL,
+        timeout: float = OFFLINE_BATCH_TIMEOUT,
+    ):
+        """Block until an Anthropic message batch has ended"""
+        return _poll_until(
+            lambda: self.client.messages.batches.retrieve(batch_id),
+            lambda batch: batch.processing_status == "ended",
+            poll_interval,
+            timeout,
+        )
+
+    def collect_results(
+        self, batch_id: str, articles: list[dict[str, Any]]
+    ) -> list[dict[str, str] | None]:
+        """Stream an Anthropic batch's results and map them back by custom_id"""
+        results: list[dict[str, str] | None] = [None] * len(articles)
+        for entry in self.client.messages.batches.results(batch_id):
+            if entry.result.type != "succeeded":
+                continue
+            i = int(entry.custom_id)
+            results[i] = _parse_ai_response(
+                entry.result.message.content[0].text, articles[i]
+            )
+        return results
+
+
+def _log_cache_usage(usage):
+    """Log Anthropic prompt cache reads/writes, to check the cached prefix is hit"""
+    if usage is None:
+        return
+    read = getattr(usage, "cache_read_input_tokens", None) or 0
+    written = getattr(usage, "cache_creation_input_tokens", None) or 0
+    if read or written:
+        logger.debug(
+            f"Anthropic prompt cache: {read} tokens read, {written} tokens written"
+        )
+
+
+class GeminiBarista(AIProvider):
+    """Google Gemini-based content processor"""
+
+    display_name = "Gemini"
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_concurrent: int | None = None,
+        rpm: int | None = None,
+    ):
+        """
+        Initialize Gemini provider
+
+        Args:
+            api_key: Google API key (defaults to GEMINI_API_KEY env var)
+            max_concurrent: Maximum requests in flight at once
+            rpm: Maximum requests per minute, spaced evenly
+        """
+        self.rate_limiter = (
+            RateLimiter(max_concurrent, rpm) if max_concurrent or rpm else None
+        )
+        _require_sdk("google.generativeai", "google-generativeai")
+        self._api_key = api_key or os.getenv("GEMINI_API_KEY")
+
+    @cached_property
+    def model(self):
+        """Shared Gemini model, built on first use"""
+        return _gemini_model(self._api_key)
+
+    @cached_property
+    def _retryable(self) -> tuple[type, ...]:
+        """Quota, availability, deadline and 5xx errors"""
+        google_exceptions = _sdk("google.api_core.exceptions", "google-generativeai")
+        return (
+            google_exceptions.ResourceExhausted,
+            google_exceptions.ServiceUnavailable,
+            google_exceptions.DeadlineExceeded,
+            google_exceptions.InternalServerError,
+        )
+
+    def _call_llm(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        """Generate content with Google Gemini"""
+        response = _call_with_retries(
+            lambda: self.model.generate_content(prompt),
+            self._retryable,
+            self.rate_limiter,
+        )
+        return response.text
+
+    async def _call_llm_async(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        """Generate content with Gemini's native async API"""
+        response = await _call_with_retries_async(
+            lambda: self.model.generate_content_async(prompt),
+            self._retryable,
+            self.rate_limiter,
+        )
+        return response.text
+
+
+class MistralBarista(AIProvider):
+    """Mistral AI-based content processor"""
+
+    display_name = "Mistral"
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_concurrent: int | None = None,
+        rpm: int | None = None,
+        stream: bool = True,
+    ):
+        """
+        Initialize Mistral provider
+
+        Args:
+            api_key: Mistral API key (defaults to MISTRAL_API_KEY env var)
+            max_concurrent: Maximum requests in flight at once
+            rpm: Maximum requests per minute, spaced evenly
+            stream: Stream responses and stop reading once TITLE and
+                SUMMARY are complete (disable for gateways that do not
+                support streaming)
+        """
+        self.rate_limiter = (
+            RateLimiter(max_concurrent, rpm) if max_concurrent or rpm else None
+        )
+        self.stream = stream
+        _require_sdk("mistralai", "mistralai")
+        self._api_key = api_key or os.getenv("MISTRAL_API_KEY")
+        self._async_client = None
+
+    @cached_property
+    def client(self):
+        """Shared Mistral client, built on first use"""
+        return _mistral_client(self._api_key)
+
+    @cached_property
+    def _retryable(self) -> tuple[type, ...]:
+        """Dropped connections, timeouts, and API errors with a 429 or 5xx status"""
+        exceptions = _sdk("mistralai.exceptions", "mistralai")
+        # MistralAPIStatusException subclasses MistralAPIException; _is_transient
+        # checks http_status so 4xx client errors are still raised at once
+        return (exceptions.MistralConnectionException, exceptions.MistralAPIException)
+
+    def _get_async_client(self):
+        """Lazily create the MistralAsyncClient used by generate_summary_async"""
+        if self._async_client is None:
+            async_client = _sdk("mistralai.async_client", "mistralai")
+            self._async_client = async_client.MistralAsyncClient(api_key=self._api_key)
+        return self._async_client
+
+    def _chat_kwargs(self, prompt: str, max_tokens: int) -> dict[str, Any]:
+        """Request parameters shared by the sync and async calls"""
+        return {
+            "model": DEFAULT_AI_MODELS["mistral"],
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": 0.7,
+        }
+
+    def _call_llm(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        """Stream a chat response from Mistral AI, hanging up once TITLE and SUMMARY have arrived"""
+        request = self._chat_kwargs(prompt, max_tokens)
+
+        def call_api() -> str:
+            if not self.stream:
+                return self.client.chat(**request).choices[0].message.content
+            stream = self.client.chat_stream(**request)
+            try:
+                return _read_stream(
+                    chunk.choices[0].delta.content for chunk in stream if chunk.choices
+                )
+            finally:
+                stream.close()
+
+        return _call_with_retries(call_api, self._retryable, self.rate_limiter)
+
+    async def _call_llm_async(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        """Stream a chat response with the MistralAsyncClient"""
+        request = self._chat_kwargs(prompt, max_tokens)
+        client = self._get_async_client()
+
+        async def call_api() -> str:
+            if not self.stream:
+                response = await client.chat(**request)
+                return response.choices[0].message.content
+            stream = client.chat_stream(**request)
+            try:
+                return await _read_stream_async(
+                    chunk.choices[0].delta.content
+                    async for chunk in stream
+                    if chunk.choices
+                )
+            finally:
+                await stream.aclose()
+
+        return await _call_with_retries_async(
+            call_api, self._retryable, self.rate_limiter
+        )
+
+
+@lru_cache(maxsize=SIMPLE_SUMMARY_CACHE_SIZE)
+def _simple_summary(title: str, summary: str | None) -> tuple[str, str]:
+    """Truncated title and summary, memoized for articles seen repeatedly"""
+    return (
+        title[:TITLE_MAX_LENGTH],
+        summary[:SUMMARY_TRUNCATE_LENGTH] if summary else NO_SUMMARY_TEXT,
+    )
+
+
+class SimpleBarista(AIProvider):
+    """Simple non-AI processor for testing without API keys"""
+
+    def generate_summary(
+        self,
+        article: dict[str, Any],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> dict[str, str]:
+        """Generate a simple summary by truncating the content"""
+        title, summary = _simple_summary(
+            article.get("title", "No Title"), article.get("summary")
+        )
+        return {"title": title, "summary": summary}
+
+    def _call_llm(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        """SimpleBarista has no model to send prompts to; generate_summary never calls this"""
+        raise TypeError(f"{type(self).__name__} does not call a model")
+
+
+class _CLIBarista(AIProvider):
+    """
+    Base class for providers driven through a command line tool
+
+    Each CLI invocation pays process start-up and authentication costs, so
+    batches of articles are answered by a single invocation instead of one
+    process per article. The supported CLIs have no framed interactive
+    mode to keep a single process alive across prompts, so batching is how
+    start-up is amortized.
+
+    Async brews run CLI processes concurrently, capped at max_concurrent
+    so a large brew does not start one process per article at once.
+    """
+
+    supports_batch = True
+    display_name = "CLI"
+    _retryable = (subprocess.TimeoutExpired,)
+
+    def __init__(self, max_concurrent: int | None = None):
+        """
+        Initialize the CLI provider
+
+        Args:
+            max_concurrent: Maximum CLI processes running at once (defaults
+                to the MOKA_CLI_PARALLEL env var, then CLI_MAX_PARALLEL)
+        """
+        if not max_concurrent:
+            max_concurrent = int(os.getenv("MOKA_CLI_PARALLEL") or CLI_MAX_PARALLEL)
+        self.rate_limiter = RateLimiter(max_concurrent)
+
+    @abstractmethod
+    def _command(self, prompt: str) -> list:
+        """Build the argument list that sends prompt to the CLI"""
+
+    def _run_cli(self, prompt: str, timeout: float = CLI_GENERATION_TIMEOUT) -> str:
+        """
+        Run the CLI once and return its output
+
+        Args:
+            prompt: Prompt to send
+            timeout: Seconds to wait for the CLI to answer
+
+        Raises:
+            subprocess.TimeoutExpired: If the CLI does not answer in time
+            RuntimeError: If the CLI exits with an error
+        """
+        # Binary pipes, decoded once, as in _run_cli_async
+        with self.rate_limiter:
+            result = subprocess.run(
+                self._command(prompt),
+                capture_output=True,
+                timeout=timeout,
+            )
+
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"{self.display_name} error: {result.stderr.decode('utf-8', errors='replace')}"
+            )
+
+        return result.stdout.decode("utf-8", errors="replace")
+
+    async def _run_cli_async(
+        self, prompt: str, timeout: float = CLI_GENERATION_TIMEOUT
+    ) -> str:
+        """
+        Run the CLI once without blocking the event loop
+
+        The CLI runs in its own session so that on timeout the whole process
+        group is killed, including helpers it spawned (node, python, ...).
+
+        Raises:
+            subprocess.TimeoutExpired: If the CLI does not answer in time
+            RuntimeError: If the CLI exits with an error
+        """
+        command = self._command(prompt)
+        async with self.rate_limiter:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                _kill_process_group(process)
+                await process.wait()
+                raise subprocess.TimeoutExpired(command, timeout)
+
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"{self.display_name} error: {stderr.decode('utf-8', errors='replace')}"
+            )
+
+        return stdout.decode("utf-8", errors="replace")
+
+    def _call_llm(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        return self._run_cli(prompt)
+
+    async def _call_llm_async(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        return await self._run_cli_async(prompt)
+
+    def generate_summary_batch(
+        self,
+        articles: list[dict[str, Any]],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> list[dict[str, str]]:
+        """Generate summaries for several articles with a single CLI invocation"""
+        if len(articles) == 1:
+            return [
+                self.generate_summary(
+                    articles[0], keywords, prompts, max_content_length, max_tokens
+                )
+            ]
+
+        try:
+            prompt = _build_batch_prompt(
+                articles, keywords, prompts, max_content_length
+            )
+            return _parse_batch_response(
+                self._run_cli(prompt, _batch_timeout(len(articles))), articles
+            )
+        except Exception as e:
+            logger.warning(
+                f"{self.display_name} batch request failed, falling back to per-article calls: {e}",
+                exc_info=True,
+            )
+            return super().generate_summary_batch(
+                articles, keywords, prompts, max_content_length, max_tokens
+            )
+
+    async def generate_summary_batch_async(
+        self,
+        articles: list[dict[str, Any]],
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+    ) -> list[dict[str, str]]:
+        """Generate summaries for several articles with a single awaited CLI invocation"""
+        if len(articles) == 1:
+            return [
+                await self.generate_summary_async(
+                    articles[0], keywords, prompts, max_content_length, max_tokens
+                )
+            ]
+
+        try:
+            prompt = _build_batch_prompt(
+                articles, keywords, prompts, max_content_length
+            )
+            return _parse_batch_response(
+                await self._run_cli_async(prompt, _batch_timeout(len(articles))),
+                articles,
+            )
+        except Exception as e:
+            logger.warning(
+                f"{self.display_name} batch request failed, falling back to per-article calls: {e}",
+                exc_info=True,
+            )
+            return list(
+                await asyncio.gather(
+                    *(
+                        self.generate_summary_async(
+                            article, keywords, prompts, max_content_length, max_tokens
+                        )
+                        for article in articles
+                    )
+                )
+            )
+
+
+def _batch_timeout(count: int) -> float:
+    """Timeout for one CLI invocation answering count articles"""
+    return CLI_GENERATION_TIMEOUT + CLI_BATCH_TIMEOUT_PER_ARTICLE * (count - 1)
+
+
+@lru_cache(maxsize=None)
+def _cli_available(name: str) -> bool:
+    """Whether an executable is on PATH, checked once per process without spawning it"""
+    return shutil.which(name) is not None
+
+
+def _kill_process_group(process):
+    """Kill a subprocess started with start_new_session=True and everything it spawned"""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
         pass
 
 
-class OpenAIBarista(AIProvider):
-    """OpenAI-based content processor"""
+class GitHubCopilotCLIBarista(_CLIBarista):
+    """GitHub Copilot CLI-based content processor"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    display_name = "GitHub Copilot CLI"
+
+    def __init__(self, max_concurrent: int | None = None):
         """
-        Initialize OpenAI provider
+        Initialize GitHub Copilot CLI provider
 
         Args:
-            api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            max_concurrent: Maximum CLI processes running at once
         """
-        try:
-            import openai
-
-            self.client = openai.OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
-        except ImportError:
-            raise ImportError(
-                "openai package is required. Install with: pip install openai"
+        if not _cli_available("gh"):
+            raise RuntimeError(
+                "GitHub CLI (gh) is not installed. Install from: https://cli.github.com/"
             )
+        super().__init__(max_concurrent)
 
-    def generate_summary(self, article: Dict[str, Any], keywords: list = None, prompts: Dict[str, str] = None, max_content_length: int = MAX_CONTENT_LENGTH, max_tokens: int = MAX_TOKENS) -> Dict[str, str]:
-        """Generate summary using OpenAI"""
-        try:
-            prompt = _build_prompt(article, keywords, prompts, max_content_length)
-            
-            # Get system message from prompts or use default
-            if prompts is None:
-                from moka_news.config import DEFAULT_PROMPTS
-                prompts = DEFAULT_PROMPTS
-            
-            system_message = prompts.get("system_message", "You are a news editor creating engaging titles and summaries.")
-
-            response = self.client.chat.completions.create(
-                model=DEFAULT_AI_MODELS["openai"],
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_message,
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=max_tokens,
-                temperature=0.7,
-            )
+    def _command(self, prompt: str) -> list:
+        # Note: --allow-all-tools is required for non-interactive mode.
+        # This allows the CLI to run without prompting for tool permissions.
+        # The prompt is read-only (text analysis) so this is safe.
+        return ["gh", "copilot", "-p", prompt, "--allow-all-tools"]
 
-            content = response.choices[0].message.content
-            return _parse_ai_response(content, article)
-        except ImportError as e:
-            logger.error(f"OpenAI library not installed: {e}")
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
-        except Exception as e:
-            logger.error(f"Error generating summary with OpenAI: {e}", exc_info=True)
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
 
+class GeminiCLIBarista(_CLIBarista):
+    """Gemini CLI-based content processor using gcloud"""
 
-class AnthropicBarista(AIProvider):
-    """Anthropic-based content processor"""
+    display_name = "Gemini CLI"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, max_concurrent: int | None = None):
         """
-        Initialize Anthropic provider
+        Initialize Gemini CLI provider
 
         Args:
-            api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            max_concurrent: Maximum CLI processes running at once
         """
-        try:
-            import anthropic
-
-            self.client = anthropic.Anthropic(
-                api_key=api_key or os.getenv("ANTHROPIC_API_KEY")
-            )
-        except ImportError:
-            raise ImportError(
-                "anthropic package is required. Install with: pip install anthropic"
+        if not _cli_available("gcloud"):
+            raise RuntimeError(
+                "gcloud CLI is not installed. Install from: https://cloud.google.com/sdk/docs/install"
             )
+        super().__init__(max_concurrent)
 
-    def generate_summary(self, article: Dict[str, Any], keywords: list = None, prompts: Dict[str, str] = None, max_content_length: int = MAX_CONTENT_LENGTH, max_tokens: int = MAX_TOKENS) -> Dict[str, str]:
-        """Generate summary using Anthropic"""
-        try:
-            prompt = _build_prompt(article, keywords, prompts, max_content_length)
-
-            response = self.client.messages.create(
-                model=DEFAULT_AI_MODELS["anthropic"],
-                max_tokens=max_tokens,
-                messages=[{"role": "user", "content": prompt}],
-            )
+    def _command(self, prompt: str) -> list:
+        return [
+            "gcloud",
+            "ai",
+            "models",
+            "generate-content",
+            f"--model={DEFAULT_AI_MODELS['gemini']}",
+            f"--prompt={prompt}",
+        ]
 
-            content = response.content[0].text
-            return _parse_ai_response(content, article)
-        except ImportError as e:
-            logger.error(f"Anthropic library not installed: {e}")
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
-        except Exception as e:
-            logger.error(f"Error generating summary with Anthropic: {e}", exc_info=True)
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
 
+class MistralCLIBarista(_CLIBarista):
+    """Mistral CLI-based content processor"""
 
-class GeminiBarista(AIProvider):
-    """Google Gemini-based content processor"""
+    display_name = "Mistral CLI"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, max_concurrent: int | None = None):
         """
-        Initialize Gemini provider
+        Initialize Mistral CLI provider
 
         Args:
-            api_key: Google API key (defaults to GEMINI_API_KEY env var)
+            max_concurrent: Maximum CLI processes running at once
         """
-        try:
-            import google.generativeai as genai
-
-            genai.configure(api_key=api_key or os.getenv("GEMINI_API_KEY"))
-            self.model = genai.GenerativeModel("gemini-pro")
-        except ImportError:
-            raise ImportError(
-                "google-generativeai package is required. Install with: pip install google-generativeai"
+        if not _cli_available("mistral"):
+            raise RuntimeError(
+                "Mistral CLI is not installed. Install with: pip install mistralai-cli or from: https://docs.mistral.ai/cli/"
             )
+        super().__init__(max_concurrent)
 
-    def generate_summary(self, article: Dict[str, Any], keywords: list = None, prompts: Dict[str, str] = None, max_content_length: int = MAX_CONTENT_LENGTH, max_tokens: int = MAX_TOKENS) -> Dict[str, str]:
-        """Generate summary using Google Gemini"""
-        try:
-            prompt = _build_prompt(article, keywords, prompts, max_content_length)
+    def _command(self, prompt: str) -> list:
+        return ["mistral", "chat", "--model", "mistral-tiny", "--message", prompt]
 
-            response = self.model.generate_content(prompt)
-            content = response.text
-            return _parse_ai_response(content, article)
-        except ImportError as e:
-            logger.error(f"Google Gemini library not installed: {e}")
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
-        except Exception as e:
-            logger.error(f"Error generating summary with Gemini: {e}", exc_info=True)
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
 
+class MultiBarista(AIProvider):
+    """
+    Spreads articles across several AI providers
+
+    Each article goes to one provider picked by the strategy: round_robin
+    stripes articles across all providers, least_loaded picks the one with
+    the fewest requests in flight, and failover always starts with the
+    first. A provider whose call fails with one of its _retryable errors
+    (after its own retries) is skipped for its Retry-After delay, or
+    MULTI_PROVIDER_COOLDOWN seconds, and the article is sent to the next
+    one; any other error is raised as it would be by a single provider.
+    Each provider keeps its own rate limiter, so the usable throughput is
+    the sum of their quotas.
+    """
 
-class MistralBarista(AIProvider):
-    """Mistral AI-based content processor"""
+    display_name = "Multi-provider"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, providers: list[AIProvider], strategy: str = "round_robin"):
         """
-        Initialize Mistral provider
+        Initialize the multi-provider
 
         Args:
-            api_key: Mistral API key (defaults to MISTRAL_API_KEY env var)
-        """
-        try:
-            from mistralai.client import MistralClient
+            providers: AI providers calling a model (not SimpleBarista)
+            strategy: One of "round_robin", "least_loaded" or "failover"
 
-            self.client = MistralClient(api_key=api_key or os.getenv("MISTRAL_API_KEY"))
-        except ImportError:
-            raise ImportError(
-                "mistralai package is required. Install with: pip install mistralai"
+        Raises:
+            ValueError: If there are no providers, the strategy is unknown or
+                a provider does not send its prompts through _call_llm
+        """
+        if not providers:
+            raise ValueError("MultiBarista needs at least one provider")
+        if strategy not in MULTI_PROVIDER_STRATEGIES:
+            raise ValueError(
+                f"Unknown strategy {strategy!r}, expected one of {', '.join(MULTI_PROVIDER_STRATEGIES)}"
             )
-
-    def generate_summary(self, article: Dict[str, Any], keywords: list = None, prompts: Dict[str, str] = None, max_content_length: int = MAX_CONTENT_LENGTH, max_tokens: int = MAX_TOKENS) -> Dict[str, str]:
-        """Generate summary using Mistral AI"""
-        try:
-            prompt = _build_prompt(article, keywords, prompts, max_content_length)
-
-            response = self.client.chat(
-                model=DEFAULT_AI_MODELS["mistral"],
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=max_tokens,
-                temperature=0.7,
+        for provider in providers:
+            # Articles are routed per _call_llm, which such providers bypass
+            if type(provider).generate_summary is not AIProvider.generate_summary:
+                raise ValueError(
+                    f"{type(provider).__name__} does not call a model and cannot be combined"
+                )
+        self.providers = list(providers)
+        self.strategy = strategy
+        self._lock = threading.Lock()
+        self._next = 0
+        self._in_flight = [0] * len(self.providers)
+        self._cold_until = [0.0] * len(self.providers)
+
+    @property
+    def _retryable(self) -> tuple[type, ...]:
+        """Errors any of the providers treats as transient"""
+        return tuple(
+            {error for provider in self.providers for error in provider._retryable}
+        )
+
+    def _order(self) -> list[int]:
+        """Provider indices to try for the next article, cooling providers last"""
+        count = len(self.providers)
+        with self._lock:
+            if self.strategy == "round_robin":
+                start = self._next
+                self._next = (self._next + 1) % count
+                order = [(start + i) % count for i in range(count)]
+            elif self.strategy == "least_loaded":
+                order = sorted(range(count), key=self._in_flight.__getitem__)
+            else:
+                order = list(range(count))
+            now = time.monotonic()
+            # Stable sort: warm providers keep the strategy's order
+            order.sort(key=lambda i: self._cold_until[i] > now)
+        return order
+
+    def _acquire(self, index: int):
+        with self._lock:
+            self._in_flight[index] += 1
+
+    def _release(self, index: int, error: Exception | None = None):
+        with self._lock:
+            self._in_flight[index] -= 1
+            if error is not None:
+                cooldown = _retry_after(error) or MULTI_PROVIDER_COOLDOWN
+                self._cold_until[index] = time.monotonic() + cooldown
+        if error is not None:
+            logger.warning(
+                f"{self.providers[index].display_name} failed ({type(error).__name__}), "
+                f"routing to the next provider"
             )
 
-            content = response.choices[0].message.content
-            return _parse_ai_response(content, article)
-        except ImportError as e:
-            logger.error(f"Mistral library not installed: {e}")
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
-        except Exception as e:
-            logger.error(f"Error generating summary with Mistral: {e}", exc_info=True)
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
-
-
-class SimpleBarista(AIProvider):
-    """Simple non-AI processor for testing without API keys"""
-
-    def generate_summary(self, article: Dict[str, Any], keywords: list = None, prompts: Dict[str, str] = None, max_content_length: int = MAX_CONTENT_LENGTH, max_tokens: int = MAX_TOKENS) -> Dict[str, str]:
-        """Generate a simple summary by truncating the content"""
-        return {
-            "title": article.get("title", "No Title")[:TITLE_MAX_LENGTH],
-            "summary": (
-                article.get("summary", "No summary available.")[:SUMMARY_TRUNCATE_LENGTH]
-                if article.get("summary")
-                else "No summary available."
-            ),
-        }
+    def _call_llm(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        """Send the prompt to the first provider in _order() that answers"""
+        error: Exception | None = None
+        for index in self._order():
+            self._acquire(index)
+            try:
+                content = self.providers[index]._call_llm(prompt, prompts, max_tokens)
+            except BaseException as e:
+                if not _is_transient(e, self.providers[index]._retryable):
+                    self._release(index)
+                    raise
+                error = e
+                self._release(index, e)
+                continue
+            self._release(index)
+            return content
+        raise error
+
+    async def _call_llm_async(
+        self, prompt: str, prompts: dict[str, str] | None, max_tokens: int
+    ) -> str:
+        """Coroutine version of _call_llm using each provider's _call_llm_async"""
+        error: Exception | None = None
+        for index in self._order():
+            self._acquire(index)
+            try:
+                content = await self.providers[index]._call_llm_async(
+                    prompt, prompts, max_tokens
+                )
+            except BaseException as e:
+                if not _is_transient(e, self.providers[index]._retryable):
+                    self._release(index)
+                    raise
+                error = e
+                self._release(index, e)
+                continue
+            self._release(index)
+            return content
+        raise error
+
+    async def aclose(self):
+        """Close the async clients of every provider"""
+        for provider in self.providers:
+            await provider.aclose()
+
+
+def _needs_rewrite(article: dict[str, Any], passthrough: bool) -> bool:
+    """
+    Whether an article has to go through the AI provider
 
+    Articles without a summary never do, as there is nothing to summarize.
+    With passthrough enabled, articles whose own title and summary already
+    fit the output limits are reused as they are.
 
-class GitHubCopilotCLIBarista(AIProvider):
-    """GitHub Copilot CLI-based content processor"""
+    Args:
+        article: Article dictionary with title and summary
+        passthrough: Whether concise articles may skip the provider
 
-    def __init__(self):
-        """Initialize GitHub Copilot CLI provider"""
-        # Check if gh CLI is available
-        try:
-            result = subprocess.run(
-                ["gh", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=CLI_VERSION_CHECK_TIMEOUT,
-            )
-            if result.returncode != 0:
-                raise RuntimeError("GitHub CLI (gh) is not available")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            raise RuntimeError(
-                "GitHub CLI (gh) is not installed. Install from: https://cli.github.com/"
-            )
+    Returns:
+        True if the article should be summarized
+    """
+    # isspace() instead of strip() avoids copying long summaries
+    summary = article.get("summary") or ""
+    if not summary or summary.isspace():
+        return False
+    return not (
+        passthrough
+        and len(article.get("title") or "") <= TITLE_MAX_LENGTH
+        and PASSTHROUGH_MIN_SUMMARY_LENGTH <= len(summary) <= SUMMARY_TRUNCATE_LENGTH
+    )
 
-    def generate_summary(self, article: Dict[str, Any], keywords: list = None, prompts: Dict[str, str] = None, max_content_length: int = MAX_CONTENT_LENGTH, max_tokens: int = MAX_TOKENS) -> Dict[str, str]:
-        """Generate summary using GitHub Copilot CLI"""
-        try:
-            prompt = _build_prompt(article, keywords, prompts, max_content_length)
 
-            # Run gh copilot with the prompt
-            # Note: --allow-all-tools is required for non-interactive mode.
-            # This allows the CLI to run without prompting for tool permissions.
-            # The prompt is read-only (text analysis) so this is safe.
-            result = subprocess.run(
-                [
-                    "gh",
-                    "copilot",
-                    "-p",
-                    prompt,
-                    "--allow-all-tools",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=CLI_GENERATION_TIMEOUT,
-            )
+def _dedup_key(article: dict[str, Any]) -> str:
+    """
+    Key identifying the same story across feeds
 
-            if result.returncode != 0:
-                raise RuntimeError(f"GitHub Copilot CLI error: {result.stderr}")
+    Combines the normalized title with the link minus its scheme, fragment
+    and tracking parameters (utm_* and TRACKING_QUERY_PARAMS). The rest of
+    the query string is kept, since it often names the item itself
+    (watch?v=..., article.php?id=...).
+    """
+    title = " ".join(article.get("title", "").lower().split())
+    link = article.get("link")
+    if not link:
+        return title
+    parts = urlsplit(link)
+    query = urlencode(
+        sorted(
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not name.startswith("utm_") and name not in TRACKING_QUERY_PARAMS
+        )
+    )
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}?{query}\n{title}"
 
-            content = result.stdout
-            return _parse_ai_response(content, article)
-        except subprocess.TimeoutExpired:
-            logger.error("GitHub Copilot CLI timeout")
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
-        except Exception as e:
-            logger.error(f"Error generating summary with GitHub Copilot CLI: {e}", exc_info=True)
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
 
+class _BrewPlan:
+    """
+    Articles of one brew() call that still need the AI provider
 
-class GeminiCLIBarista(AIProvider):
-    """Gemini CLI-based content processor using gcloud"""
+    Concise articles are passed through, republished duplicates are grouped
+    behind one representative, and cache hits are filled in up front.
+    brew() and brew_async() only differ in how pending() is dispatched.
+    """
 
-    def __init__(self):
-        """Initialize Gemini CLI provider"""
-        # Check if gcloud CLI is available
-        try:
-            result = subprocess.run(
-                ["gcloud", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=CLI_VERSION_CHECK_TIMEOUT,
-            )
-            if result.returncode != 0:
-                raise RuntimeError("gcloud CLI is not available")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            raise RuntimeError(
-                "gcloud CLI is not installed. Install from: https://cloud.google.com/sdk/docs/install"
+    def __init__(self, barista: Barista, articles: list):
+        self.barista = barista
+        self.articles = articles
+        self.processed: list[dict[str, Any] | None] = [None] * len(articles)
+        self.duplicates: dict[int, list[int]] = {}
+        self.keys: dict[int, bytes] = {}
+        self.misses: list[int] = []
+
+        passthrough = barista.passthrough_short and not barista.keywords
+        groups: dict[str, list[int]] = {}
+        for i, article in enumerate(articles):
+            if _needs_rewrite(article, passthrough):
+                groups.setdefault(_dedup_key(article), []).append(i)
+            else:
+                summary = article.get("summary") or ""
+                self.processed[i] = _with_result(
+                    article,
+                    {
+                        "title": article.get("title", "No Title"),
+                        # Same placeholder SimpleBarista shows for an empty feed summary
+                        "summary": (
+                            summary
+                            if summary and not summary.isspace()
+                            else NO_SUMMARY_TEXT
+                        ),
+                    },
+                )
+        self.passed_through = len(articles) - sum(
+            len(indices) for indices in groups.values()
+        )
+        barista.passed_through += self.passed_through
+        if self.passed_through:
+            logger.info(
+                f"Passed through {self.passed_through}/{len(articles)} articles without calling the AI provider"
             )
 
-    def generate_summary(self, article: Dict[str, Any], keywords: list = None, prompts: Dict[str, str] = None, max_content_length: int = MAX_CONTENT_LENGTH, max_tokens: int = MAX_TOKENS) -> Dict[str, str]:
-        """Generate summary using gcloud CLI with Gemini"""
-        try:
-            prompt = _build_prompt(article, keywords, prompts, max_content_length)
+        leaders = []
+        for indices in groups.values():
+            leaders.append(indices[0])
+            if len(indices) > 1:
+                self.duplicates[indices[0]] = indices[1:]
+
+        cached: dict[int, dict[str, str]] = {}
+        if barista.exact_cache is not None:
+            namespace = barista._cache_namespace()
+            for i in leaders:
+                self.keys[i] = ExactCache.key(articles[i], namespace)
+                hit = barista.exact_cache.get(self.keys[i])
+                if hit is not None:
+                    cached[i] = hit
+
+        if barista.cache is not None:
+            lookup = [i for i in leaders if i not in cached]
+            for i, hit in zip(
+                lookup, barista.cache.get_many([articles[i] for i in lookup])
+            ):
+                if hit is not None:
+                    cached[i] = hit
+
+        for i in leaders:
+            if i in cached:
+                self.processed[i] = _with_result(articles[i], cached[i])
+            else:
+                self.misses.append(i)
+
+    def pending(self) -> list:
+        """Articles to send to the provider"""
+        return [self.articles[i] for i in self.misses]
+
+    def complete(self, results: list) -> list:
+        """
+        Merge provider results, update the caches and fill in duplicates
 
-            # Run gcloud with Gemini
-            result = subprocess.run(
-                [
-                    "gcloud",
-                    "ai",
-                    "models",
-                    "generate-content",
-                    f"--model={DEFAULT_AI_MODELS['gemini']}",
-                    f"--prompt={prompt}",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=CLI_GENERATION_TIMEOUT,
-            )
+        Args:
+            results: Processed articles for pending(), in the same order
 
-            if result.returncode != 0:
-                raise RuntimeError(f"Gemini CLI error: {result.stderr}")
+        Returns:
+            Processed articles in input order
+        """
+        barista = self.barista
+        new_articles = []
+        new_entries = []
+        for i, processed_article in zip(self.misses, results):
+            self.processed[i] = processed_article
+            if isinstance(processed_article, _Fallback):
+                # Provider failed: keep the fallback out of the caches so
+                # the article is summarized again once the provider recovers
+                continue
+            result = _result_of(processed_article)
+            new_articles.append(self.articles[i])
+            new_entries.append(result)
+            if barista.exact_cache is not None:
+                barista.exact_cache.put(self.keys[i], result)
+
+        if new_entries:
+            if barista.exact_cache is not None:
+                barista.exact_cache.flush()
+            if barista.cache is not None:
+                barista.cache.put_many(new_articles, new_entries)
+                barista.cache.save()
+
+        for leader, indices in self.duplicates.items():
+            result = _result_of(self.processed[leader])
+            for i in indices:
+                self.processed[i] = _with_result(self.articles[i], result)
+        return self.processed
+
+
+def _normalize_keywords(keywords: Iterable[str] | None) -> list[str]:
+    """
+    Keywords stripped and de-duplicated, in the configured order
 
-            content = result.stdout
-            return _parse_ai_response(content, article)
-        except subprocess.TimeoutExpired:
-            logger.error("Gemini CLI timeout")
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
-        except Exception as e:
-            logger.error(f"Error generating summary with Gemini CLI: {e}", exc_info=True)
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
+    The order is kept because it reaches the prompt as written; the exact
+    cache key sorts keywords itself (see Barista._cache_namespace), so
+    reordered configs still share ExactCache entries.
 
+    Args:
+        keywords: Keywords as configured
 
-class MistralCLIBarista(AIProvider):
-    """Mistral CLI-based content processor"""
+    Returns:
+        Keywords without blanks or repeats, first occurrence first
+    """
+    return list(dict.fromkeys(k.strip() for k in keywords or () if k and k.strip()))
 
-    def __init__(self):
-        """Initialize Mistral CLI provider"""
-        # Check if mistral CLI is available
-        try:
-            result = subprocess.run(
-                ["mistral", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=CLI_VERSION_CHECK_TIMEOUT,
-            )
-            if result.returncode != 0:
-                raise RuntimeError("Mistral CLI is not available")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            raise RuntimeError(
-                "Mistral CLI is not installed. Install with: pip install mistralai-cli or from: https://docs.mistral.ai/cli/"
-            )
 
-    def generate_summary(self, article: Dict[str, Any], keywords: list = None, prompts: Dict[str, str] = None, max_content_length: int = MAX_CONTENT_LENGTH, max_tokens: int = MAX_TOKENS) -> Dict[str, str]:
-        """Generate summary using Mistral CLI"""
-        try:
-            prompt = _build_prompt(article, keywords, prompts, max_content_length)
+def _with_result(article: dict[str, Any], result: dict[str, str]) -> dict[str, Any]:
+    """
+    Copy of article with ai_title/ai_summary taken from result's title/summary
 
-            # Run mistral CLI
-            result = subprocess.run(
-                [
-                    "mistral",
-                    "chat",
-                    "--model",
-                    "mistral-tiny",
-                    "--message",
-                    prompt,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=CLI_GENERATION_TIMEOUT,
-            )
+    Every brew path, including the error fallbacks, builds its output here,
+    so the caller's article dicts are never modified and the same list can
+    be brewed concurrently.
+    """
+    processed = {
+        **article,
+        "ai_title": result["title"],
+        "ai_summary": result["summary"],
+    }
+    return _Fallback(processed) if isinstance(result, _Fallback) else processed
 
-            if result.returncode != 0:
-                raise RuntimeError(f"Mistral CLI error: {result.stderr}")
 
-            content = result.stdout
-            return _parse_ai_response(content, article)
-        except subprocess.TimeoutExpired:
-            logger.error("Mistral CLI timeout")
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
-        except Exception as e:
-            logger.error(f"Error generating summary with Mistral CLI: {e}", exc_info=True)
-            return {"title": article["title"], "summary": article["summary"][:SUMMARY_TRUNCATE_LENGTH]}
+def _result_of(processed_article: dict[str, Any]) -> dict[str, str]:
+    """Title/summary result of a processed article, keeping the fallback mark"""
+    result = {
+        "title": processed_article["ai_title"],
+        "summary": processed_article["ai_summary"],
+    }
+    return _Fallback(result) if isinstance(processed_article, _Fallback) else result
 
 
 class Barista:
     """Main Barista class that coordinates AI processing"""
 
-    def __init__(self, provider: Optional[AIProvider] = None, keywords: list = None, prompts: Dict[str, str] = None, max_content_length: int = MAX_CONTENT_LENGTH, max_tokens: int = MAX_TOKENS):
+    def __init__(
+        self,
+        provider: AIProvider | None = None,
+        keywords: list | None = None,
+        prompts: dict[str, str] | None = None,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        max_tokens: int = MAX_TOKENS,
+        max_workers: int = BREW_MAX_WORKERS,
+        batch_size: int = BREW_BATCH_SIZE,
+        cache: SemanticCache | None = None,
+        exact_cache: ExactCache | None = None,
+        passthrough_short: bool = True,
+        mode: str = "interactive",
+    ):
         """
         Initialize the Barista with an AI provider
 
@@ -470,103 +2427,486 @@ class Barista:
             prompts: Optional dictionary with custom prompts
             max_content_length: Maximum characters of content to include
             max_tokens: Maximum tokens for AI response
+            max_workers: Maximum number of articles processed concurrently
+            batch_size: Articles packed into one request for providers that support batching
+            cache: Optional SemanticCache consulted before calling the provider
+            exact_cache: Optional ExactCache consulted before the semantic cache
+            passthrough_short: Reuse titles and summaries that already fit the
+                               length limits instead of calling the provider
+                               (only when no keywords are set)
+            mode: "interactive" for real-time requests, or "batch" to send large
+                  runs through the provider's discounted offline Batch API
         """
         self.provider = provider or SimpleBarista()
-        self.keywords = keywords or []
+        self.keywords = _normalize_keywords(keywords)
         self.prompts = prompts
         self.max_content_length = max_content_length
         self.max_tokens = max_tokens
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        # Batched requests use fixed instructions, so custom prompts go one article per request
+        self._batching = (
+            self.provider.supports_batch
+            and batch_size > 1
+            and _batch_prompt_compatible(prompts)
+        )
+        self.cache = cache
+        self.exact_cache = exact_cache
+        self.passthrough_short = passthrough_short
+        # Articles answered without the provider because they needed no rewrite
+        self.passed_through = 0
+        self.mode = mode
+        self._executor: ThreadPoolExecutor | None = None
+        # Provider calls being awaited by brew_async, keyed by _dedup_key
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the worker pool, reused across brew() calls"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="barista"
+            )
+        return self._executor
+
+    def close(self):
+        """Shut down the worker pool, if one was started"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _process_one(self, article: dict[str, Any]) -> dict[str, Any]:
+        """
+        Process a single article through the AI provider
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            Processed article with ai_title and ai_summary fields
+        """
+        try:
+            enhanced = self.provider.generate_summary(
+                article,
+                self.keywords,
+                self.prompts,
+                self.max_content_length,
+                self.max_tokens,
+            )
+        except Exception as e:
+            logger.error(f"Error processing article: {e}", exc_info=True)
+            enhanced = _fallback(article)
+        return _with_result(article, enhanced)
+
+    def _process_serial(self, articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Process articles one after another on the calling thread
+
+        This is the per-article Python loop (SimpleBarista runs every article
+        through it), so the provider method and settings are bound to locals
+        once rather than looked up on self for each article.
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            Processed articles in input order
+        """
+        generate = self.provider.generate_summary
+        settings = (
+            self.keywords,
+            self.prompts,
+            self.max_content_length,
+            self.max_tokens,
+        )
+        processed = []
+        append = processed.append
+        for article in articles:
+            try:
+                append(_with_result(article, generate(article, *settings)))
+            except Exception as e:
+                logger.error(f"Error processing article: {e}", exc_info=True)
+                append(_with_result(article, _fallback(article)))
+        return processed
+
+    async def _process_one_async(self, article: dict[str, Any]) -> dict[str, Any]:
+        """Async counterpart of _process_one"""
+        try:
+            enhanced = await self.provider.generate_summary_async(
+                article,
+                self.keywords,
+                self.prompts,
+                self.max_content_length,
+                self.max_tokens,
+            )
+        except Exception as e:
+            logger.error(f"Error processing article: {e}", exc_info=True)
+            enhanced = _fallback(article)
+        return _with_result(article, enhanced)
+
+    async def _process_batch_async(
+        self, articles: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Async counterpart of _process_batch"""
+        try:
+            enhanced = await self.provider.generate_summary_batch_async(
+                articles,
+                self.keywords,
+                self.prompts,
+                self.max_content_length,
+                self.max_tokens,
+            )
+        except Exception as e:
+            logger.error(f"Error processing article batch: {e}", exc_info=True)
+            return list(
+                await asyncio.gather(
+                    *(self._process_one_async(article) for article in articles)
+                )
+            )
+
+        return [
+            _with_result(article, result) for article, result in zip(articles, enhanced)
+        ]
+
+    def _process_batch(self, articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Process several articles with a single provider request
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            Processed articles, falling back to per-article processing on error
+        """
+        try:
+            enhanced = self.provider.generate_summary_batch(
+                articles,
+                self.keywords,
+                self.prompts,
+                self.max_content_length,
+                self.max_tokens,
+            )
+        except Exception as e:
+            logger.error(f"Error processing article batch: {e}", exc_info=True)
+            return [self._process_one(article) for article in articles]
+
+        return [
+            _with_result(article, result) for article, result in zip(articles, enhanced)
+        ]
 
     def brew(self, articles: list) -> list:
         """
         Process a list of articles through the AI provider
 
+        Articles without a summary, and articles whose title and summary
+        already fit the length limits when no keywords are set, are passed
+        through unchanged (counted in passed_through). Articles
+        republished by several feeds are summarized once and the result is
+        shared. Articles found in the exact or semantic cache are
+        answered without calling the provider. Network-bound providers are
+        called concurrently from a thread pool; providers that support
+        batching receive batch_size articles per request. The returned list
+        keeps the order of the input articles.
+
         Args:
             articles: List of article dictionaries
 
         Returns:
             List of processed articles with enhanced titles and summaries
         """
-        processed = []
+        plan = _BrewPlan(self, articles)
+        return plan.complete(self._dispatch(plan.pending()))
 
-        for article in articles:
+    async def brew_async(self, articles: list) -> list:
+        """
+        Process a list of articles through the AI provider from a coroutine
+
+        Same pipeline as brew(), but provider calls are awaited concurrently
+        with asyncio.gather using the provider's generate_summary_async.
+        An article that an overlapping brew_async call on the same event
+        loop is already summarizing waits for that result instead of being
+        sent again.
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            List of processed articles with enhanced titles and summaries
+        """
+        plan = _BrewPlan(self, articles)
+        return plan.complete(await self._dispatch_inflight(plan.pending()))
+
+    async def _dispatch_inflight(self, articles: list) -> list:
+        """
+        _dispatch_async, sharing provider calls with overlapping brew_async calls
+
+        Args:
+            articles: Articles still needing the provider (unique within the call)
+
+        Returns:
+            Processed articles in input order
+        """
+        loop = asyncio.get_running_loop()
+        keys = [_dedup_key(article) for article in articles]
+        owned: list[int] = []
+        waiting: dict[int, asyncio.Future] = {}
+        for i, key in enumerate(keys):
+            future = self._inflight.get(key)
+            if future is not None and future.get_loop() is loop:
+                waiting[i] = future
+            else:
+                self._inflight[key] = loop.create_future()
+                owned.append(i)
+
+        results: list[dict[str, Any] | None] = [None] * len(articles)
+        try:
+            processed = await self._dispatch_async([articles[i] for i in owned])
+            for i, processed_article in zip(owned, processed):
+                results[i] = processed_article
+                self._inflight[keys[i]].set_result(_result_of(processed_article))
+        except BaseException as e:
+            for i in owned:
+                future = self._inflight[keys[i]]
+                if not future.done():
+                    future.set_exception(e)
+                    # Mark the exception as retrieved when nobody is waiting
+                    future.exception()
+            raise
+        finally:
+            for i in owned:
+                self._inflight.pop(keys[i], None)
+
+        # Owned calls are finished before waiting, so overlapping brews cannot deadlock
+        for i, future in waiting.items():
+            results[i] = _with_result(articles[i], await future)
+        return results
+
+    def brew_stream(
+        self, batches: Iterable[list[dict[str, Any]]]
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Process articles as they arrive, one batch at a time
+
+        Pairs with Grinder.stream(): each feed is brewed as soon as it has
+        been parsed while the grinder keeps fetching the remaining feeds, so
+        the total time approaches the slower of the two stages rather than
+        their sum. Deduplication only applies within a batch.
+
+        Args:
+            batches: Iterable of article lists (e.g. one per feed)
+
+        Yields:
+            List of processed articles for each input batch
+        """
+        for articles in batches:
+            yield self.brew(articles)
+
+    def _cache_namespace(self) -> str:
+        """
+        Context that must match for an exact cache hit
+
+        Everything besides the article that shapes the response: provider,
+        keywords (in any order), custom prompts and the length limits.
+        """
+        return "|".join(
+            (
+                type(self.provider).__name__,
+                ",".join(sorted(self.keywords)),
+                json.dumps(self.prompts, sort_keys=True) if self.prompts else "",
+                str(self.max_content_length),
+                str(self.max_tokens),
+            )
+        )
+
+    def _dispatch(self, articles: list) -> list:
+        """Send articles to the provider, concurrently where it helps"""
+        if (
+            self.mode == "batch"
+            and self.provider.supports_offline_batch
+            and len(articles) >= OFFLINE_BATCH_MIN_ARTICLES
+        ):
             try:
-                enhanced = self.provider.generate_summary(
-                    article, 
-                    self.keywords, 
+                enhanced = self.provider.generate_summary_offline(
+                    articles,
+                    self.keywords,
                     self.prompts,
                     self.max_content_length,
-                    self.max_tokens
+                    self.max_tokens,
                 )
-                processed_article = article.copy()
-                processed_article["ai_title"] = enhanced["title"]
-                processed_article["ai_summary"] = enhanced["summary"]
-                processed.append(processed_article)
+                return [
+                    _with_result(article, result)
+                    for article, result in zip(articles, enhanced)
+                ]
             except Exception as e:
-                logger.error(f"Error processing article: {e}", exc_info=True)
-                article["ai_title"] = article["title"]
-                article["ai_summary"] = article["summary"][:SUMMARY_TRUNCATE_LENGTH]
-                processed.append(article)
+                logger.error(
+                    f"Offline batch failed, falling back to real-time requests: {e}",
+                    exc_info=True,
+                )
 
-        return processed
+        # SimpleBarista does no I/O, so a thread pool would only add overhead
+        if (
+            isinstance(self.provider, SimpleBarista)
+            or len(articles) <= 1
+            or self.max_workers <= 1
+        ):
+            return self._process_serial(articles)
+
+        if self._batching:
+            batches = [
+                articles[i : i + self.batch_size]
+                for i in range(0, len(articles), self.batch_size)
+            ]
+            return [
+                article
+                for batch in self._run_parallel(self._process_batch, batches)
+                for article in batch
+            ]
+
+        return self._run_parallel(self._process_one, articles)
+
+    async def _dispatch_async(self, articles: list) -> list:
+        """
+        Send articles to the provider as concurrent coroutines
+
+        At most max_workers requests are awaited at once, matching the
+        thread pool used by brew(); the provider's rate limiter still
+        applies on top.
+        """
+        if not articles:
+            return []
+
+        semaphore = asyncio.Semaphore(max(1, self.max_workers))
+
+        async def bounded(process, item):
+            async with semaphore:
+                return await process(item)
+
+        if self._batching and len(articles) > 1:
+            batches = [
+                articles[i : i + self.batch_size]
+                for i in range(0, len(articles), self.batch_size)
+            ]
+            results = await asyncio.gather(
+                *(bounded(self._process_batch_async, batch) for batch in batches)
+            )
+            return [article for batch in results for article in batch]
+
+        return list(
+            await asyncio.gather(
+                *(bounded(self._process_one_async, article) for article in articles)
+            )
+        )
+
+    def _run_parallel(self, func, items: list) -> list:
+        """
+        Run func over items on the worker pool
+
+        Results are written into a preallocated list as each future finishes,
+        so fast calls are collected immediately while input order is kept.
+        """
+        executor = self._get_executor()
+        results = [None] * len(items)
+        futures = {executor.submit(func, item): i for i, item in enumerate(items)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+        return results
 
 
-def create_ai_provider(provider_name: str, config: Dict[str, Any]) -> Optional[AIProvider]:
+def create_ai_provider(provider_name: str, config: dict[str, Any]) -> AIProvider | None:
     """
     Create an AI provider instance
-    
+
     Args:
-        provider_name: Name of AI provider ('openai', 'anthropic', 'gemini', 'mistral', 
-                      'copilot-cli', 'gemini-cli', 'mistral-cli', 'simple')
+        provider_name: Name of AI provider ('openai', 'anthropic', 'gemini', 'mistral',
+                      'copilot-cli', 'gemini-cli', 'mistral-cli', 'simple'), or
+                      several comma-separated names to spread articles across
         config: Configuration dictionary with api_keys section
-    
+
     Returns:
         AI provider instance, or None if provider cannot be initialized
     """
+    # Several providers, e.g. "openai,anthropic", share the articles
+    if "," in provider_name:
+        providers = [
+            provider
+            for provider in (
+                create_ai_provider(name.strip(), config)
+                for name in provider_name.split(",")
+            )
+            if provider is not None and not isinstance(provider, SimpleBarista)
+        ]
+        if len(providers) <= 1:
+            return providers[0] if providers else None
+        try:
+            return MultiBarista(
+                providers, config.get("ai", {}).get("strategy", "round_robin")
+            )
+        except ValueError as e:
+            logger.error(f"Failed to initialize {provider_name}: {e}")
+            return None
+
     # Map of provider names to their env var names
     api_providers = {
         "openai": ("OPENAI_API_KEY", OpenAIBarista),
         "anthropic": ("ANTHROPIC_API_KEY", AnthropicBarista),
         "gemini": ("GEMINI_API_KEY", GeminiBarista),
-        "mistral": ("MISTRAL_API_KEY", MistralBarista)
+        "mistral": ("MISTRAL_API_KEY", MistralBarista),
     }
-    
+
     cli_providers = {
         "copilot-cli": GitHubCopilotCLIBarista,
         "gemini-cli": GeminiCLIBarista,
-        "mistral-cli": MistralCLIBarista
+        "mistral-cli": MistralCLIBarista,
     }
-    
+
     # Handle simple mode
     if provider_name == "simple":
         return SimpleBarista()
-    
+
     # Handle CLI-based providers
     if provider_name in cli_providers:
+        # Optional cap on CLI processes, e.g. ai.rate_limits.copilot-cli: {max_concurrent: 2}
+        limits = config.get("ai", {}).get("rate_limits", {}).get(provider_name) or {}
         try:
             provider_class = cli_providers[provider_name]
-            return provider_class()
+            return provider_class(max_concurrent=limits.get("max_concurrent"))
         except RuntimeError as e:
             logger.warning(f"{provider_name} not available: {e}")
             return None
-    
+
     # Handle API-based providers
     if provider_name in api_providers:
         env_var, provider_class = api_providers[provider_name]
-        
+
         # Get API key from config or environment
-        api_key = config.get("ai", {}).get("api_keys", {}).get(provider_name) or os.getenv(env_var)
-        
+        api_key = config.get("ai", {}).get("api_keys", {}).get(
+            provider_name
+        ) or os.getenv(env_var)
+
         if not api_key:
             logger.warning(f"{env_var} not found")
             return None
-        
+
+        # Optional per-provider limits, e.g. ai.rate_limits.openai: {max_concurrent: 8, rpm: 500}
+        limits = config.get("ai", {}).get("rate_limits", {}).get(provider_name) or {}
+        options = {}
+        if provider_name in (
+            "openai",
+            "anthropic",
+            "mistral",
+        ) and "stream" in config.get("ai", {}):
+            options["stream"] = bool(config["ai"]["stream"])
+
         try:
-            return provider_class(api_key=api_key)
+            return provider_class(
+                api_key=api_key,
+                max_concurrent=limits.get("max_concurrent"),
+                rpm=limits.get("rpm"),
+                **options,
+            )
         except ImportError as e:
             logger.error(f"Failed to initialize {provider_name}: {e}")
             return None
-    
+
     # Unknown provider
     logger.warning(f"Unknown AI provider: {provider_name}")
     return None
@@ -574,35 +2914,58 @@ def create_ai_provider(provider_name: str, config: Dict[str, Any]) -> Optional[A
 
 def create_barista(
     provider_name: str,
-    config: Dict[str, Any],
-    keywords: list = None,
-    prompts: Dict[str, str] = None,
+    config: dict[str, Any],
+    keywords: list | None = None,
+    prompts: dict[str, str] | None = None,
     max_content_length: int = MAX_CONTENT_LENGTH,
-    max_tokens: int = MAX_TOKENS
+    max_tokens: int = MAX_TOKENS,
+    max_workers: int = BREW_MAX_WORKERS,
+    batch_size: int = BREW_BATCH_SIZE,
+    no_cache: bool = False,
+    mode: str = "interactive",
 ) -> Barista:
     """
     Factory function to create a Barista with the appropriate AI provider
-    
+
     Args:
-        provider_name: Name of AI provider ('openai', 'anthropic', 'gemini', 'mistral', 
+        provider_name: Name of AI provider ('openai', 'anthropic', 'gemini', 'mistral',
                       'copilot-cli', 'gemini-cli', 'mistral-cli', 'simple')
         config: Configuration dictionary with api_keys section
         keywords: Optional list of keywords for summary generation
         prompts: Optional dictionary with custom prompts
         max_content_length: Maximum characters of content to include
         max_tokens: Maximum tokens for AI response
-    
+        max_workers: Maximum number of articles processed concurrently
+        batch_size: Articles packed into one request for providers that support batching
+        no_cache: Disable the on-disk response cache (~/.cache/moka-news/exact.sqlite)
+        mode: "interactive" or "batch" (offline Batch API for large non-interactive runs)
+
     Returns:
         Configured Barista instance
     """
     logger.info(f"Creating barista with {provider_name} provider")
-    
+
     # Get AI provider instance
     provider = create_ai_provider(provider_name, config)
-    
+
     # Fall back to SimpleBarista if provider creation failed
     if provider is None:
         logger.warning("Falling back to simple mode")
         provider = SimpleBarista()
-    
-    return Barista(provider, keywords, prompts, max_content_length, max_tokens)
+
+    # SimpleBarista is cheaper than a cache lookup
+    exact_cache = None
+    if not no_cache and not isinstance(provider, SimpleBarista):
+        exact_cache = ExactCache()
+
+    return Barista(
+        provider,
+        keywords,
+        prompts,
+        max_content_length,
+        max_tokens,
+        max_workers,
+        batch_size,
+        exact_cache=exact_cache,
+        mode=mode,
+    )
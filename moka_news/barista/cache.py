@@ -0,0 +1,414 @@
+"""
+Response caches for The Barista
+Avoid re-summarizing articles that were already processed
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from moka_news.constants import (
+    CACHE_KEY_CONTENT_LENGTH,
+    EXACT_CACHE_MAX_AGE,
+    EXACT_CACHE_MAX_ENTRIES,
+    SEMANTIC_CACHE_ENCODE_BATCH_SIZE,
+    SEMANTIC_CACHE_MAX_ENTRIES,
+    SEMANTIC_CACHE_MODEL,
+    SEMANTIC_CACHE_THRESHOLD,
+)
+from moka_news.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the default directory for on-disk Barista caches
+
+    Returns:
+        Path to ~/.cache/moka-news
+    """
+    return Path.home() / ".cache" / "moka-news"
+
+
+def _article_text(article: dict[str, Any]) -> str:
+    """Text used to represent an article in the semantic cache"""
+    summary = article.get("summary") or ""
+    return f"{article.get('title', '')}\n{summary[:CACHE_KEY_CONTENT_LENGTH]}"
+
+
+class ExactCache:
+    """
+    Cache of AI results keyed by a hash of the article link and content
+
+    Lookups are served from memory first and then from a small SQLite
+    database, so articles re-ingested across runs skip the provider entirely.
+    Entries older than max_age are ignored and dropped on flush.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_entries: int = EXACT_CACHE_MAX_ENTRIES,
+        max_age: int | None = EXACT_CACHE_MAX_AGE,
+    ):
+        """
+        Initialize the exact-match cache
+
+        Args:
+            path: SQLite database file (defaults to ~/.cache/moka-news/exact.sqlite)
+            max_entries: Maximum stored entries; the oldest are evicted on flush
+            max_age: Seconds an entry stays valid (None to keep entries forever)
+        """
+        self.path = Path(path) if path else default_cache_dir() / "exact.sqlite"
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._entries: dict[bytes, tuple[dict[str, str], int]] = {}
+        self._pending: list[tuple] = []
+        self._db = None
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key BLOB PRIMARY KEY, title TEXT, summary TEXT, ts INTEGER)"
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open response cache {self.path}: {e}")
+            self._db = None
+
+    @staticmethod
+    def key(article: dict[str, Any], namespace: str = "") -> bytes:
+        """
+        Compute the cache key for an article
+
+        Args:
+            article: Article dictionary
+            namespace: Extra context mixed into the key (provider, keywords, ...)
+
+        Returns:
+            16-byte BLAKE2b digest
+        """
+        # The content is part of the key so an updated article is summarized again
+        identity = "\0".join(
+            (
+                namespace,
+                article.get("link") or "",
+                article.get("title", ""),
+                (article.get("summary") or "")[:CACHE_KEY_CONTENT_LENGTH],
+            )
+        )
+        return hashlib.blake2b(identity.encode("utf-8"), digest_size=16).digest()
+
+    def _cutoff(self) -> int:
+        """Oldest timestamp still considered fresh"""
+        return int(time.time()) - self.max_age if self.max_age is not None else 0
+
+    def get(self, key: bytes) -> dict[str, str] | None:
+        """
+        Look up a cached result
+
+        Args:
+            key: Key from ExactCache.key()
+
+        Returns:
+            Cached dictionary with 'title' and 'summary' keys, or None on a miss
+        """
+        cutoff = self._cutoff()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                return cached[0] if cached[1] >= cutoff else None
+            if self._db is None:
+                return None
+            try:
+                row = self._db.execute(
+                    "SELECT title, summary, ts FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not read response cache: {e}")
+                return None
+            if row is None or row[2] < cutoff:
+                return None
+            entry = {"title": row[0], "summary": row[1]}
+            self._entries[key] = (entry, row[2])
+            return entry
+
+    def put(self, key: bytes, result: dict[str, str]):
+        """
+        Store a result; it is written to disk on the next flush()
+
+        Args:
+            key: Key from ExactCache.key()
+            result: Dictionary with 'title' and 'summary' keys
+        """
+        entry = {"title": result["title"], "summary": result["summary"]}
+        now = int(time.time())
+        with self._lock:
+            self._entries[key] = (entry, now)
+            self._pending.append((key, entry["title"], entry["summary"], now))
+
+    def flush(self):
+        """Write pending entries in a single transaction and evict old rows"""
+        with self._lock:
+            if not self._pending or self._db is None:
+                self._pending = []
+                return
+            try:
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO responses (key, title, summary, ts) VALUES (?, ?, ?, ?)",
+                        self._pending,
+                    )
+                    self._db.execute(
+                        "DELETE FROM responses WHERE key IN "
+                        "(SELECT key FROM responses ORDER BY ts DESC LIMIT -1 OFFSET ?)",
+                        (self.max_entries,),
+                    )
+                    if self.max_age is not None:
+                        self._db.execute(
+                            "DELETE FROM responses WHERE ts < ?", (self._cutoff(),)
+                        )
+            except sqlite3.Error as e:
+                logger.warning(f"Could not write response cache: {e}")
+            self._pending = []
+
+    def close(self):
+        """Flush pending entries and close the database"""
+        self.flush()
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+class SemanticCache:
+    """
+    Cache of AI results keyed by article embedding
+
+    Near-duplicate articles (the same story republished by several feeds)
+    reuse a cached title and summary when the cosine similarity of their
+    embeddings reaches the configured threshold.
+    """
+
+    def __init__(
+        self,
+        model_name: str = SEMANTIC_CACHE_MODEL,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        cache_dir: Path | None = None,
+        encoder: Callable[[list[str]], Any] | None = None,
+    ):
+        """
+        Initialize the semantic cache
+
+        Args:
+            model_name: sentence-transformers model used to embed articles
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum cached entries before least recently used are evicted
+            cache_dir: Directory to persist the cache (defaults to ~/.cache/moka-news)
+            encoder: Optional callable mapping a list of texts to an (N, D) array,
+                     used instead of loading a sentence-transformers model
+                     (e.g. an ONNX Runtime export of the same model)
+        """
+        try:
+            import numpy as np
+
+            self._np = np
+        except ImportError:
+            raise ImportError(
+                "numpy is required for the semantic cache. Install with: pip install moka-news[semantic]"
+            )
+
+        if encoder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise ImportError(
+                    "sentence-transformers is required for the semantic cache. "
+                    "Install with: pip install moka-news[semantic]"
+                )
+            model = SentenceTransformer(model_name)
+
+            def encoder(texts):
+                return model.encode(
+                    texts,
+                    batch_size=SEMANTIC_CACHE_ENCODE_BATCH_SIZE,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                )
+
+        self.encoder = encoder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self._embeddings_file = self.cache_dir / "semantic_cache.npy"
+        self._results_file = self.cache_dir / "semantic_cache.json"
+
+        self._lock = threading.Lock()
+        self._matrix = None  # (capacity, D) float32, rows [0, size) are in use
+        self._results: list[dict[str, str]] = []
+        self._last_used: list[int] = []
+        self._clock = 0
+        self._dirty = False
+
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def _embed(self, texts: list[str]):
+        """Embed texts and L2-normalize the rows"""
+        np = self._np
+        vectors = np.asarray(self.encoder(texts), dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def get(self, article: dict[str, Any]) -> dict[str, str] | None:
+        """
+        Look up a cached result for an article
+
+        Args:
+            article: Article dictionary with title and summary
+
+        Returns:
+            Cached dictionary with 'title' and 'summary' keys, or None on a miss
+        """
+        return self.get_many([article])[0]
+
+    def get_many(self, articles: list[dict[str, Any]]) -> list[dict[str, str] | None]:
+        """
+        Look up cached results for several articles at once
+
+        All articles are embedded in one encoder call and scored against the
+        cache with a single (N, D) x (D, C) matrix product.
+
+        Args:
+            articles: List of article dictionaries with title and summary
+
+        Returns:
+            List with a cached result dictionary or None for each article
+        """
+        if not articles or not self._results:
+            return [None] * len(articles)
+
+        np = self._np
+        queries = self._embed([_article_text(article) for article in articles])
+        with self._lock:
+            size = len(self._results)
+            scores = queries @ self._matrix[:size].T
+            best = scores.argmax(axis=1)
+            hits = scores[np.arange(len(articles)), best] >= self.threshold
+
+            results = []
+            for row, hit in zip(best.tolist(), hits.tolist()):
+                if not hit:
+                    results.append(None)
+                    continue
+                self._last_used[row] = self._tick()
+                results.append(dict(self._results[row]))
+            return results
+
+    def put(self, article: dict[str, Any], result: dict[str, str]):
+        """
+        Store the AI result for an article
+
+        Args:
+            article: Article dictionary with title and summary
+            result: Dictionary with 'title' and 'summary' keys
+        """
+        self.put_many([article], [result])
+
+    def put_many(self, articles: list[dict[str, Any]], results: list[dict[str, str]]):
+        """
+        Store AI results for several articles, embedding them in one call
+
+        Args:
+            articles: List of article dictionaries with title and summary
+            results: Matching list of dictionaries with 'title' and 'summary' keys
+        """
+        if not articles:
+            return
+
+        vectors = self._embed([_article_text(article) for article in articles])
+        with self._lock:
+            for vector, result in zip(vectors, results):
+                entry = {"title": result["title"], "summary": result["summary"]}
+                size = len(self._results)
+                if size >= self.max_entries:
+                    # Overwrite the least recently used entry
+                    row = self._last_used.index(min(self._last_used))
+                    self._matrix[row] = vector
+                    self._results[row] = entry
+                    self._last_used[row] = self._tick()
+                else:
+                    self._grow(size + 1, vector.shape[0])
+                    self._matrix[size] = vector
+                    self._results.append(entry)
+                    self._last_used.append(self._tick())
+            self._dirty = True
+
+    def _grow(self, needed: int, dim: int):
+        """Grow the embedding matrix geometrically so appends stay amortized O(1)"""
+        np = self._np
+        if self._matrix is not None and self._matrix.shape[0] >= needed:
+            return
+        capacity = max(
+            needed, 64 if self._matrix is None else self._matrix.shape[0] * 2
+        )
+        capacity = min(capacity, max(self.max_entries, needed))
+        matrix = np.zeros((capacity, dim), dtype=np.float32)
+        if self._matrix is not None:
+            matrix[: len(self._results)] = self._matrix[: len(self._results)]
+        self._matrix = matrix
+
+    def save(self):
+        """Persist the cache to disk if it changed"""
+        with self._lock:
+            if not self._dirty or not self._results:
+                return
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._np.save(self._embeddings_file, self._matrix[: len(self._results)])
+                with open(self._results_file, "w", encoding="utf-8") as f:
+                    json.dump(self._results, f)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Could not save semantic cache: {e}")
+
+    def _load(self):
+        """Load a previously persisted cache, if any"""
+        if not (self._embeddings_file.exists() and self._results_file.exists()):
+            return
+        try:
+            matrix = self._np.load(self._embeddings_file)
+            with open(self._results_file, "r", encoding="utf-8") as f:
+                results = json.load(f)
+            if matrix.ndim != 2 or len(matrix) != len(results):
+                raise ValueError("embeddings and results are out of sync")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load semantic cache: {e}")
+            return
+
+        results = results[-self.max_entries :]
+        matrix = matrix[-self.max_entries :]
+        self._grow(len(results), matrix.shape[1])
+        self._matrix[: len(results)] = matrix
+        self._results = results
+        self._last_used = [self._tick() for _ in results]
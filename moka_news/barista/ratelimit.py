@@ -0,0 +1,102 @@
+"""
+Rate limiting for The Barista
+Keeps API providers under their concurrency and requests-per-minute limits
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+
+
+class RateLimiter:
+    """
+    Concurrency cap plus an evenly paced requests-per-minute budget
+
+    Usable from threads (``with limiter:``) and from coroutines
+    (``async with limiter:``). Requests are spaced 60/rpm seconds apart
+    instead of being released in bursts, so a full brew settles at the
+    provider's steady-state rate rather than tripping 429 responses.
+    """
+
+    def __init__(self, max_concurrent: int | None = None, rpm: int | None = None):
+        """
+        Initialize the rate limiter
+
+        Args:
+            max_concurrent: Maximum requests in flight at once (None for no cap)
+            rpm: Maximum requests started per minute (None for no limit)
+        """
+        self.max_concurrent = max_concurrent
+        self.rpm = rpm
+        self._interval = 60.0 / rpm if rpm else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+        self._semaphore = (
+            threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        )
+        # asyncio.Semaphore is bound to the loop it is first used on, so keep one per loop
+        self._async_semaphores = weakref.WeakKeyDictionary()
+
+    def _reserve(self) -> float:
+        """Reserve the next request slot and return how long to wait for it"""
+        if not self._interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        return slot - now
+
+    def _async_semaphore(self) -> asyncio.Semaphore | None:
+        if not self.max_concurrent:
+            return None
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._async_semaphores[loop] = asyncio.Semaphore(
+                self.max_concurrent
+            )
+        return semaphore
+
+    def __enter__(self):
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        try:
+            delay = self._reserve()
+            if delay > 0:
+                time.sleep(delay)
+        except BaseException:
+            # __exit__ does not run when __enter__ raises, so give the permit back here
+            if self._semaphore is not None:
+                self._semaphore.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._semaphore is not None:
+            self._semaphore.release()
+        return False
+
+    async def __aenter__(self):
+        semaphore = self._async_semaphore()
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            delay = self._reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            # Cancelled while pacing: __aexit__ will not run, so release here
+            if semaphore is not None:
+                semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        semaphore = self._async_semaphore()
+        if semaphore is not None:
+            semaphore.release()
+        return False
@@ -3,15 +3,33 @@ Configuration management for MoKa News
 Supports YAML configuration files for customization
 """
 
+from __future__ import annotations
+
 import os
-import yaml
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
 from pathlib import Path
-from moka_news.constants import DEFAULT_TECH_FEEDS, MAX_CONTENT_LENGTH, MAX_TOKENS
+from moka_news.constants import DEFAULT_TECH_FEED_URLS, MAX_CONTENT_LENGTH, MAX_TOKENS
 from moka_news.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Config files merged over DEFAULT_CONFIG, keyed by path and validated by
+# (mtime, size), so unchanged files are neither re-parsed nor re-merged
+_CONFIG_CACHE_SIZE = 16
+_merged_configs: OrderedDict[str, tuple[tuple[int, int], dict[str, Any]]] = (
+    OrderedDict()
+)
+
+# Environment variables that override ai.api_keys entries
+_ENV_API_KEYS = (
+    ("OPENAI_API_KEY", "openai"),
+    ("ANTHROPIC_API_KEY", "anthropic"),
+    ("GEMINI_API_KEY", "gemini"),
+    ("MISTRAL_API_KEY", "mistral"),
+)
+
 DEFAULT_PROMPTS = {
     "system_message": "You are a news editor creating engaging titles and summaries.",
     "user_prompt": """Given this article:
@@ -54,42 +72,78 @@ TITLE: <engaging editorial title>
 SUMMARY: <the editorial content>""",
 }
 
-DEFAULT_CONFIG = {
-    "ai": {
-        "provider": "gemini-cli",  # Default AI provider - requires gcloud CLI
-        "api_keys": {
-            "openai": None,
-            "anthropic": None,
-            "gemini": None,
-            "mistral": None,
+
+@lru_cache(maxsize=None)
+def _default_config() -> dict[str, Any]:
+    """
+    Built-in configuration, constructed on first use
+
+    Exposed as DEFAULT_CONFIG through the module __getattr__, so importing
+    this module does not build it. Callers must copy it before changing it.
+
+    Returns:
+        Default configuration dictionary (shared, do not modify)
+    """
+    return {
+        "ai": {
+            "provider": "gemini-cli",  # Default AI provider - requires gcloud CLI
+            "api_keys": {
+                "openai": None,
+                "anthropic": None,
+                "gemini": None,
+                "mistral": None,
+            },
+            "keywords": [],  # Optional keywords for summary generation
+            "prompts": DEFAULT_PROMPTS,  # External prompts with placeholders
+            "editorial_prompts": DEFAULT_EDITORIAL_PROMPTS,  # Prompts for editorial generation
+            "max_content_length": MAX_CONTENT_LENGTH,  # Maximum characters to send to AI for context
+            "max_tokens": MAX_TOKENS,  # Maximum tokens for AI response
         },
-        "keywords": [],  # Optional keywords for summary generation
-        "prompts": DEFAULT_PROMPTS,  # External prompts with placeholders
-        "editorial_prompts": DEFAULT_EDITORIAL_PROMPTS,  # Prompts for editorial generation
-        "max_content_length": MAX_CONTENT_LENGTH,  # Maximum characters to send to AI for context
-        "max_tokens": MAX_TOKENS,  # Maximum tokens for AI response
-    },
-    "feeds": {
-        "urls": [
-            feed["url"] for feed in DEFAULT_TECH_FEEDS[:3]
-        ]  # Use first 3 feeds from constants
-    },
-    "ui": {
-        "use_tui": True,
-        "theme": "rose-pine",  # Default theme (dark, relaxing)
-        "theme_light": "rose-pine-dawn",  # Light theme option
-        "theme_dark": "rose-pine",  # Dark theme option
-    },
-    "refresh": {
-        "allowed_times": ["08:00", "20:00"],  # Morning and evening refresh times
-        "max_daily_refreshes": 2,  # Maximum refreshes per day
-        "require_confirmation_outside_hours": True,  # Ask for confirmation outside allowed times
-    },
-    "editorial": {
-        "editorials_dir": None,  # Directory to save editorials (defaults to ~/.config/moka-news/editorials)
-        "opener_command": None,  # Optional command to open editorials externally (e.g., "code", "vim", "nano")
-    },
-}
+        "feeds": {
+            "urls": list(DEFAULT_TECH_FEED_URLS[:3])  # Use first 3 feeds from constants
+        },
+        "ui": {
+            "use_tui": True,
+            "theme": "rose-pine",  # Default theme (dark, relaxing)
+            "theme_light": "rose-pine-dawn",  # Light theme option
+            "theme_dark": "rose-pine",  # Dark theme option
+        },
+        "refresh": {
+            "allowed_times": ["08:00", "20:00"],  # Morning and evening refresh times
+            "max_daily_refreshes": 2,  # Maximum refreshes per day
+            "require_confirmation_outside_hours": True,  # Ask for confirmation outside allowed times
+        },
+        "editorial": {
+            "editorials_dir": None,  # Directory to save editorials (defaults to ~/.config/moka-news/editorials)
+            "opener_command": None,  # Optional command to open editorials externally (e.g., "code", "vim", "nano")
+        },
+    }
+
+
+@lru_cache(maxsize=None)
+def _yaml_loader() -> Any:
+    """libyaml's C safe loader when PyYAML has it, else the pure-Python one"""
+    # Imported on demand: runs without a config file never load PyYAML
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def _yaml_dumper() -> Any:
+    """Safe dumper matching _yaml_loader: libyaml's C one when available"""
+    import yaml
+
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def __getattr__(name: str) -> Any:
+    """Build DEFAULT_CONFIG and resolve _YAML_LOADER lazily on first access"""
+    if name == "DEFAULT_CONFIG":
+        return _default_config()
+    if name == "_YAML_LOADER":
+        return _yaml_loader()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_config_path() -> Path:
@@ -99,13 +153,16 @@ def get_config_path() -> Path:
     Returns:
         Path to config file (checks multiple locations)
     """
-    # Check in order: current directory, user home, package directory
-    config_locations = [
-        Path.cwd() / "moka-news.yaml",
-        Path.cwd() / ".moka-news.yaml",
-        Path.home() / ".config" / "moka-news" / "config.yaml",
-        Path.home() / ".moka-news.yaml",
-    ]
+    # Check in order: current directory, then user home. cwd and home are
+    # resolved once, and the search stops at the first file found.
+    cwd = Path.cwd()
+    home = Path.home()
+    config_locations = (
+        cwd / "moka-news.yaml",
+        cwd / ".moka-news.yaml",
+        home / ".config" / "moka-news" / "config.yaml",
+        home / ".moka-news.yaml",
+    )
 
     for location in config_locations:
         if location.exists():
@@ -114,7 +171,7 @@ def get_config_path() -> Path:
     return None
 
 
-def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
+def load_config(config_path: str | None = None) -> dict[str, Any]:
     """
     Load configuration from YAML file
 
@@ -124,37 +181,100 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     Returns:
         Configuration dictionary
     """
-    config = DEFAULT_CONFIG.copy()
-
     if config_path:
         config_file = Path(config_path)
+        if not config_file.exists():
+            config_file = None
     else:
+        # Only returns paths it has just seen exist
         config_file = get_config_path()
 
-    if config_file and config_file.exists():
+    config = None
+    if config_file:
         try:
-            with open(config_file, "r") as f:
-                user_config = yaml.safe_load(f)
-                if user_config:
-                    # Deep merge user config with defaults
-                    config = merge_configs(config, user_config)
+            config = _load_merged_config(config_file)
         except Exception as e:
             print(f"⚠️  Warning: Could not load config file: {e}")
 
+    # Always a fresh copy: the environment overrides below update it in
+    # place, and must never reach DEFAULT_CONFIG or the cache
+    if config is None:
+        config = _copy_tree(_default_config())
+
     # Override with environment variables
-    if os.getenv("OPENAI_API_KEY"):
-        config["ai"]["api_keys"]["openai"] = os.getenv("OPENAI_API_KEY")
-    if os.getenv("ANTHROPIC_API_KEY"):
-        config["ai"]["api_keys"]["anthropic"] = os.getenv("ANTHROPIC_API_KEY")
-    if os.getenv("GEMINI_API_KEY"):
-        config["ai"]["api_keys"]["gemini"] = os.getenv("GEMINI_API_KEY")
-    if os.getenv("MISTRAL_API_KEY"):
-        config["ai"]["api_keys"]["mistral"] = os.getenv("MISTRAL_API_KEY")
+    environ = os.environ
+    api_keys = config["ai"]["api_keys"]
+    for env_var, provider in _ENV_API_KEYS:
+        value = environ.get(env_var)
+        if value:
+            api_keys[provider] = value
 
     return config
 
 
-def merge_configs(default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
+def _load_merged_config(config_file: Path) -> dict[str, Any]:
+    """
+    Parse a YAML config file and merge it over DEFAULT_CONFIG
+
+    The merged result is cached while the file's mtime and size are
+    unchanged, so repeated loads (e.g. on TUI refresh) cost one stat()
+    and a copy of its dicts and lists. The least recently used of
+    _CONFIG_CACHE_SIZE files is evicted.
+
+    Args:
+        config_file: Path to the YAML file
+
+    Returns:
+        A copy of the merged configuration, safe for the caller to modify
+    """
+    path = str(config_file)
+    stat = config_file.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _merged_configs.get(path)
+    if cached is not None and cached[0] == signature:
+        _merged_configs.move_to_end(path)
+        return _copy_tree(cached[1])
+
+    import yaml
+
+    with open(config_file, "r") as f:
+        user_config = yaml.load(f, Loader=_yaml_loader())
+    merged = _copy_tree(_default_config())
+    if user_config:
+        # Deep merge user config with defaults
+        _deep_update(merged, user_config)
+
+    _merged_configs[path] = (signature, merged)
+    _merged_configs.move_to_end(path)
+    if len(_merged_configs) > _CONFIG_CACHE_SIZE:
+        _merged_configs.popitem(last=False)
+    return _copy_tree(merged)
+
+
+def _copy_tree(value: Any) -> Any:
+    """
+    Copy the dicts and lists of a config tree, sharing everything else
+
+    Config values are strings, numbers, booleans and None, which are
+    immutable, so unlike copy.deepcopy this needs no memo and no
+    per-object dispatch; only the containers a caller could modify are
+    duplicated.
+
+    Args:
+        value: Config tree (or any value inside one)
+
+    Returns:
+        Copy that shares no dict or list with value
+    """
+    if isinstance(value, dict):
+        return {key: _copy_tree(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(item) for item in value]
+    return value
+
+
+def merge_configs(default: dict[str, Any], user: dict[str, Any]) -> dict[str, Any]:
     """
     Deep merge user configuration with default configuration
 
@@ -163,33 +283,55 @@ def merge_configs(default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, An
         user: User configuration dictionary
 
     Returns:
-        Merged configuration dictionary
+        Merged configuration dictionary, sharing no dict or list with
+        either input
     """
-    result = default.copy()
-
-    for key, value in user.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_configs(result[key], value)
-        else:
-            result[key] = value
-
+    # Both inputs belong to the caller, so each is copied exactly once;
+    # _deep_update then moves the user's copy into the result without
+    # copying again (load_config hands over its freshly parsed document
+    # the same way, without the copy)
+    result = _copy_tree(default)
+    _deep_update(result, _copy_tree(user))
     return result
 
 
-def create_sample_config(path: str = "moka-news.yaml"):
+def _deep_update(target: dict[str, Any], updates: dict[str, Any]):
     """
-    Create a sample configuration file
+    Merge updates into target in place
+
+    Nested dictionaries are merged key by key; any other value replaces the
+    target's. Walks an explicit stack instead of recursing, so no
+    intermediate dictionaries are created, and a level sharing no keys
+    with the target is copied over with a single update().
 
     Args:
-        path: Path where to create the sample config file
+        target: Dictionary to update
+        updates: Values to merge into it
     """
-    sample_config = """# MoKa News Configuration File
+    stack = [(target, updates)]
+    while stack:
+        destination, source = stack.pop()
+        # Sections the defaults do not have (e.g. rate_limits) are taken whole
+        if destination.keys().isdisjoint(source):
+            destination.update(source)
+            continue
+        for key, value in source.items():
+            if isinstance(value, dict) and isinstance(destination.get(key), dict):
+                stack.append((destination[key], value))
+            else:
+                destination[key] = value
+
+
+# Written by create_sample_config as bytes, so the locale's encoding never applies
+_SAMPLE_CONFIG_BYTES = b"""# MoKa News Configuration File
 # Save this as 'moka-news.yaml' in your current directory or ~/.config/moka-news/config.yaml
 
 # AI Provider Configuration
 ai:
   provider: gemini-cli  # Options: openai, anthropic, gemini, mistral, copilot-cli, gemini-cli, mistral-cli
                         # Note: 'simple' mode is for demo/testing only (no AI summaries)
+                        # Comma-separate providers (e.g. openai,anthropic) to spread articles across them
+  # strategy: round_robin  # With several providers: round_robin, least_loaded or failover
   
   # API Keys (can also be set via environment variables)
   # Only needed for API-based providers (not CLI providers)
@@ -299,7 +441,13 @@ editorial:
     # opener_command: "xdg-open"    # Open with default app (Linux)
 """
 
-    with open(path, "w") as f:
-        f.write(sample_config)
 
+def create_sample_config(path: str = "moka-news.yaml"):
+    """
+    Create a sample configuration file
+
+    Args:
+        path: Path where to create the sample config file
+    """
+    Path(path).write_bytes(_SAMPLE_CONFIG_BYTES)
     print(f"✓ Sample configuration created at: {path}")
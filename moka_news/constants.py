@@ -3,7 +3,7 @@ Constants and configuration values for MoKa News
 """
 
 # Default RSS feeds for tech news
-DEFAULT_TECH_FEEDS = [
+DEFAULT_TECH_FEEDS = (
     {
         "url": "https://news.ycombinator.com/rss",
         "title": "Hacker News",
@@ -28,8 +28,11 @@ DEFAULT_TECH_FEEDS = [
         "url": "https://feeds.arstechnica.com/arstechnica/index",
         "title": "Ars Technica",
         "htmlUrl": "https://arstechnica.com"
-    }
-]
+    },
+)
+
+# Feed URLs alone, for callers that only need those
+DEFAULT_TECH_FEED_URLS = tuple(feed["url"] for feed in DEFAULT_TECH_FEEDS)
 
 # AI model names
 DEFAULT_AI_MODELS = {
@@ -43,8 +46,55 @@ DEFAULT_AI_MODELS = {
 MAX_CONTENT_LENGTH = 1500  # Maximum characters of article content to process
 MAX_TOKENS = 250  # Maximum tokens for AI response
 SUMMARY_TRUNCATE_LENGTH = 200  # Length to truncate summaries for fallback
+NO_SUMMARY_TEXT = "No summary available."  # Shown for articles whose feed has no summary
 TITLE_MAX_LENGTH = 80  # Maximum length for titles
+PASSTHROUGH_MIN_SUMMARY_LENGTH = 40  # Shortest feed summary reused without calling the AI provider
+TRACKING_QUERY_PARAMS = ("fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src")  # Dropped from links (with utm_*) when matching duplicates
+SIMPLE_SUMMARY_CACHE_SIZE = 4096  # Memoized SimpleBarista results
+PROMPT_SUFFIX_CACHE_SIZE = 64  # Memoized keyword/format prompt sections
 
 # Subprocess timeouts
-CLI_VERSION_CHECK_TIMEOUT = 5  # Seconds to wait for CLI version checks
 CLI_GENERATION_TIMEOUT = 30  # Seconds to wait for AI generation via CLI
+CLI_BATCH_TIMEOUT_PER_ARTICLE = 10  # Extra seconds allowed per article in a batched CLI invocation
+CLI_MAX_PARALLEL = 4  # CLI processes running at once (override with MOKA_CLI_PARALLEL)
+
+# HTTP connection pooling for API providers
+HTTP_TIMEOUT = 30.0  # Seconds to wait for an API response
+HTTP_MAX_CONNECTIONS = 128  # Maximum open connections in the shared pool
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 64  # Idle connections kept alive for reuse
+SDK_CLIENT_CACHE_SIZE = 8  # SDK clients shared per API key across provider instances
+
+# Retries for transient API errors (rate limits, timeouts, dropped connections)
+API_MAX_ATTEMPTS = 4  # Total attempts per request, including the first
+API_RETRY_INITIAL_DELAY = 1.0  # Seconds of backoff after the first failure
+API_RETRY_MAX_DELAY = 16.0  # Upper bound on a single backoff delay
+API_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)  # HTTP statuses worth retrying
+
+# Multi-provider fan-out (MultiBarista)
+MULTI_PROVIDER_STRATEGIES = ("round_robin", "least_loaded", "failover")
+MULTI_PROVIDER_COOLDOWN = 60.0  # Seconds a failing provider is skipped without a Retry-After header
+
+# Concurrency
+BREW_MAX_WORKERS = 8  # Maximum articles summarized in parallel by Barista.brew
+BREW_BATCH_SIZE = 8  # Articles packed into a single request by batching providers
+GRIND_MAX_WORKERS = 8  # Maximum feeds fetched in parallel by Grinder.stream
+
+# Offline provider Batch APIs (Barista mode="batch")
+OFFLINE_BATCH_MIN_ARTICLES = 50  # Smaller runs use real-time requests
+OFFLINE_BATCH_MAX_ARTICLES = 10000  # Larger runs are split over several batches
+OFFLINE_BATCH_POLL_INTERVAL = 30.0  # Seconds between batch status checks
+OFFLINE_BATCH_TIMEOUT = 24 * 3600  # Seconds to wait for a batch (provider SLA)
+
+# Response caching
+CACHE_KEY_CONTENT_LENGTH = 500  # Characters of article content used to key caches
+EXACT_CACHE_MAX_ENTRIES = 50000  # Rows kept in the exact-match response cache
+EXACT_CACHE_MAX_AGE = 7 * 24 * 3600  # Seconds before a cached response is regenerated
+SEMANTIC_CACHE_MODEL = "all-MiniLM-L6-v2"  # sentence-transformers embedding model
+SEMANTIC_CACHE_THRESHOLD = 0.87  # Minimum cosine similarity for a semantic cache hit
+SEMANTIC_CACHE_ENCODE_BATCH_SIZE = 32  # Texts per forward pass when embedding articles
+SEMANTIC_CACHE_MAX_ENTRIES = 10000  # Entries kept before LRU eviction
+
+# TUI
+AUTO_REFRESH_RECHECK_INTERVAL = 300  # Max seconds between wall-clock checks while waiting for a refresh slot
+EDITORIAL_CACHE_SIZE = 32  # Past editorials kept in memory for re-opening from history
+EDITORIAL_METADATA_CACHE_SIZE = 1024  # Parsed history entries (title, date); above the archive size to avoid LRU thrash
@@ -3,27 +3,92 @@ The Cup - Textual TUI Interface
 Displays the news digest in a beautiful terminal interface
 """
 
+from __future__ import annotations
+
 from textual.app import App, ComposeResult
-from textual.containers import ScrollableContainer, VerticalScroll, Vertical, Horizontal
+from textual.containers import ScrollableContainer, Vertical, Horizontal
 from textual.widgets import (
     Header,
     Footer,
     Static,
     Label,
     Markdown,
-    ListView,
-    ListItem,
+    OptionList,
     Button,
 )
+from textual.widgets.option_list import Option
 from textual.binding import Binding
 from textual.screen import Screen, ModalScreen
-from typing import List, Dict, Any, Callable, Optional
+from typing import Any, Callable
 from pathlib import Path
-from datetime import datetime, time
-import webbrowser
+from datetime import datetime, time, timedelta
+from functools import lru_cache
 import asyncio
 import subprocess
 
+from moka_news.constants import AUTO_REFRESH_RECHECK_INTERVAL
+
+
+@lru_cache(maxsize=8)
+def _subtitle(last_update: datetime) -> str:
+    """Subtitle for a last update time, rendered by a single strftime call"""
+    return last_update.strftime("Your Morning Persona News | Editorial View | Last update: %d/%m/%Y at %H:%M:%S")
+
+
+def _next_refresh_at(after: datetime, allowed_times: list[time]) -> datetime:
+    """
+    First allowed refresh time strictly after a given moment
+
+    Args:
+        after: Naive local datetime to search from
+        allowed_times: Times of day (hour and minute are used)
+
+    Returns:
+        Naive local datetime of the next refresh, today or tomorrow
+    """
+    candidates = [
+        datetime.combine(day, time(refresh_time.hour, refresh_time.minute))
+        for day in (after.date(), after.date() + timedelta(days=1))
+        for refresh_time in allowed_times
+    ]
+    return min(candidate for candidate in candidates if candidate > after)
+
+
+async def _sleep_until(target: datetime) -> None:
+    """
+    Sleep until the wall clock reaches a naive local time
+
+    Sleeps in bounded steps and re-reads the clock after each one, so a
+    suspend/resume or clock change while waiting is noticed within
+    AUTO_REFRESH_RECHECK_INTERVAL seconds instead of after a full-day sleep.
+
+    Args:
+        target: Local time to wake at
+    """
+    while True:
+        # timestamp() resolves each naive local time with its own UTC
+        # offset, so a DST change before the target is accounted for
+        remaining = target.timestamp() - datetime.now().timestamp()
+        if remaining <= 0:
+            return
+        await asyncio.sleep(min(remaining, AUTO_REFRESH_RECHECK_INTERVAL))
+
+
+@lru_cache(maxsize=1)
+def _browser():
+    """
+    The default browser controller, resolved on the first link opened
+
+    webbrowser.open() looks the browser up again on every call; the
+    controller is resolved once here. A failed lookup is not cached.
+
+    Raises:
+        webbrowser.Error: If no runnable browser is found
+    """
+    import webbrowser
+
+    return webbrowser.get()
+
 
 class ConfirmationDialog(ModalScreen):
     """Modal dialog for confirming actions"""
@@ -90,34 +155,37 @@ class ConfirmationDialog(ModalScreen):
 class ArticleCard(Static):
     """Widget to display a single article"""
 
-    def __init__(self, article: Dict[str, Any], *args, **kwargs):
+    def __init__(self, article: dict[str, Any], *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.article = article
         self.border_title = article.get("source", "Unknown Source")
 
     def compose(self) -> ComposeResult:
         """Create the article card layout"""
-        title = self.article.get("ai_title", self.article.get("title", "No Title"))
-        summary = self.article.get(
-            "ai_summary", self.article.get("summary", "No summary available.")
+        article = self.article
+        # Fallbacks are only looked up when the AI field is missing
+        title = article["ai_title"] if "ai_title" in article else article.get("title", "No Title")
+        summary = (
+            article["ai_summary"] if "ai_summary" in article
+            else article.get("summary", "No summary available.")
         )
-        link = self.article.get("link", "")
-        published = self.article.get("published", "")
+        published = article.get("published")
 
-        yield Label(f"[bold cyan]{title}[/bold cyan]")
-        yield Label(f"\n{summary}")
+        # One Label holding every line, rather than one widget per line
+        lines = [f"[bold cyan]{title}[/bold cyan]", f"\n{summary}"]
         if published:
-            yield Label(f"\n[dim]{published}[/dim]")
-        if link:
+            lines.append(f"\n[dim]{published}[/dim]")
+        if article.get("link"):
             # Display simplified link - click the article card to open
-            yield Label("[dim]🔗 Click card to open link[/dim]")
+            lines.append("[dim]🔗 Click card to open link[/dim]")
+        yield Label("\n".join(lines))
 
     def on_click(self) -> None:
         """Open article link in browser when clicked"""
         link = self.article.get("link")
         if link:
             try:
-                webbrowser.open(link)
+                _browser().open(link)
             except Exception as e:
                 self.app.notify(f"Could not open link: {e}", severity="error")
 
@@ -133,6 +201,25 @@ class EditorialView(Static):
         """Create the editorial view layout"""
         yield Markdown(self.editorial_content)
 
+    def update_content(self, editorial_content: str) -> None:
+        """Show new editorial content, re-parsing the Markdown only if it changed"""
+        if editorial_content != self.editorial_content:
+            self.editorial_content = editorial_content
+            self.query_one(Markdown).update(editorial_content)
+
+
+@lru_cache(maxsize=None)
+def _editorial_date(timestamp: datetime) -> str:
+    """Date line for a past editorial, formatted once per timestamp"""
+    return timestamp.strftime("%A, %B %d, %Y at %H:%M")
+
+
+def _editorial_option(editorial: dict[str, Any]) -> Option:
+    """List entry for a past editorial"""
+    title = editorial.get("title", "Untitled")
+    date_str = _editorial_date(editorial["timestamp"])
+    return Option(f"[bold]{title}[/bold]\n[dim]{date_str}[/dim]\n")
+
 
 class EditorialListScreen(Screen):
     """Screen for browsing past editorials"""
@@ -155,20 +242,13 @@ class EditorialListScreen(Screen):
         padding: 1;
     }
     
-    ListView {
+    OptionList {
         height: 100%;
-    }
-    
-    ListItem {
-        padding: 1 2;
-    }
-    
-    ListItem:hover {
-        background: $boost;
+        padding: 0 1;
     }
     """
 
-    def __init__(self, editorials: List[Dict[str, Any]], *args, **kwargs):
+    def __init__(self, editorials: list[dict[str, Any]], *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.editorials = editorials
         self.selected_editorial = None
@@ -177,19 +257,11 @@ class EditorialListScreen(Screen):
         """Create the editorial list layout"""
         yield Header()
 
-        with VerticalScroll(id="editorial-list-container"):
+        with Vertical(id="editorial-list-container"):
             if self.editorials:
-                list_view = ListView()
-                for editorial in self.editorials:
-                    timestamp = editorial["timestamp"]
-                    date_str = timestamp.strftime("%A, %B %d, %Y at %H:%M")
-                    title = editorial.get("title", "Untitled")
-                    item = ListItem(
-                        Label(f"[bold]{title}[/bold]\n[dim]{date_str}[/dim]")
-                    )
-                    item.editorial_data = editorial
-                    list_view.append(item)
-                yield list_view
+                # A single OptionList renders only the visible rows, where a
+                # ListView would mount two widgets per past editorial
+                yield OptionList(*[_editorial_option(editorial) for editorial in self.editorials])
             else:
                 yield Static(
                     "[bold]No past editorials found[/bold]\n\n"
@@ -199,11 +271,10 @@ class EditorialListScreen(Screen):
 
         yield Footer()
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle editorial selection"""
-        if hasattr(event.item, "editorial_data"):
-            self.selected_editorial = event.item.editorial_data
-            self.dismiss(self.selected_editorial)
+        self.selected_editorial = self.editorials[event.option_index]
+        self.dismiss(self.selected_editorial)
 
     def action_dismiss(self) -> None:
         """Dismiss the screen"""
@@ -219,7 +290,7 @@ class Cup(App):
     }
     
     #content-container {
-        height: 100%;
+        height: 1fr;
         padding: 1;
     }
     
@@ -252,7 +323,8 @@ class Cup(App):
         color: $text-muted;
     }
     
-    #update-info {
+    #refresh-status {
+        width: 100%;
         padding: 0 2;
         text-align: right;
         color: $text-muted;
@@ -270,20 +342,18 @@ class Cup(App):
 
     def __init__(
         self,
-        articles: List[Dict[str, Any]] = None,
-        last_update: Optional[datetime] = None,
-        refresh_callback: Optional[
-            Callable[[], tuple[List[Dict[str, Any]], datetime]]
-        ] = None,
-        auto_refresh_time: Optional[time] = time(8, 0),  # Default 8:00 AM
-        editorial_content: Optional[str] = None,
-        editorial_generator: Optional[Any] = None,
+        articles: list[dict[str, Any]] = None,
+        last_update: datetime | None = None,
+        refresh_callback: Callable[[], tuple[list[dict[str, Any]], datetime]] | None = None,
+        auto_refresh_time: time | None = time(8, 0),  # Default 8:00 AM
+        editorial_content: str | None = None,
+        editorial_generator: Any | None = None,
         theme: str = "rose-pine",
         theme_light: str = "rose-pine-dawn",
         theme_dark: str = "rose-pine",
-        refresh_manager: Optional[Any] = None,
-        opener_command: Optional[str] = None,
-        current_editorial_path: Optional[Path] = None,
+        refresh_manager: Any | None = None,
+        opener_command: str | None = None,
+        current_editorial_path: Path | None = None,
     ):
         super().__init__()
         self.articles = articles or []
@@ -296,6 +366,8 @@ class Cup(App):
         self.title = "☕ MoKa News"
         self.sub_title = self._format_subtitle()
         self._auto_refresh_task = None
+        # Set while a fetch runs in the executor, so refreshes never overlap
+        self._refreshing = False
         self.theme_light = theme_light
         self.theme_dark = theme_dark
         self.theme = theme
@@ -305,26 +377,40 @@ class Cup(App):
 
     def _format_subtitle(self) -> str:
         """Format the subtitle with last update time"""
-        time_str = self.last_update.strftime("%H:%M:%S")
-        date_str = self.last_update.strftime("%d/%m/%Y")
-        return f"Your Morning Persona News | Editorial View | Last update: {date_str} at {time_str}"
+        return _subtitle(self.last_update)
 
     def compose(self) -> ComposeResult:
         """Create the application layout"""
         yield Header(show_clock=True)
 
         with ScrollableContainer(id="content-container"):
-            if self.editorial_content:
-                yield EditorialView(self.editorial_content, id="editorial-container")
-            else:
-                yield Static(
-                    "[bold]No editorial available[/bold]\n\n"
-                    "An editorial will be generated from your RSS feeds.",
-                    id="empty-state",
-                )
+            yield self._content_widget()
 
+        yield Label("", id="refresh-status")
         yield Footer()
 
+    def _content_widget(self) -> Static:
+        """The editorial view, or the empty state when there is no editorial"""
+        if self.editorial_content:
+            return EditorialView(self.editorial_content, id="editorial-container")
+        return Static(
+            "[bold]No editorial available[/bold]\n\n"
+            "An editorial will be generated from your RSS feeds.",
+            id="empty-state",
+        )
+
+    def _show_refresh_status(self, message: str) -> None:
+        """
+        Show refresh progress in the status line
+
+        Routine progress replaces the previous status in place instead of
+        stacking a toast per step; warnings and errors still use notify.
+
+        Args:
+            message: Status text to display
+        """
+        self.query_one("#refresh-status", Label).update(message)
+
     async def on_mount(self) -> None:
         """Start the auto-refresh timer when the app mounts"""
         # If refresh manager is available, use its configured times
@@ -334,60 +420,34 @@ class Cup(App):
 
     async def _auto_refresh_loop(self) -> None:
         """Background task that triggers refresh at specified times"""
-        from datetime import timedelta
+        last_target = None
 
         while True:
-            now = datetime.now()
-
             # Get refresh times - either from refresh manager or default
             if self.refresh_manager:
                 allowed_times = self.refresh_manager.get_allowed_refresh_times()
             elif self.auto_refresh_time:
                 allowed_times = [self.auto_refresh_time]
             else:
+                allowed_times = []
+
+            if not allowed_times:
                 # No refresh times configured
                 await asyncio.sleep(3600)
                 continue
 
-            # Find the next refresh time
-            target = None
-            for refresh_time in allowed_times:
-                potential_target = now.replace(
-                    hour=refresh_time.hour,
-                    minute=refresh_time.minute,
-                    second=0,
-                    microsecond=0,
-                )
-
-                # If this time hasn't passed today
-                if now < potential_target:
-                    if target is None or potential_target < target:
-                        target = potential_target
-
-            # If all times have passed today, schedule for first time tomorrow
-            if target is None:
-                tomorrow = now + timedelta(days=1)
-                first_time = allowed_times[0]
-                target = tomorrow.replace(
-                    hour=first_time.hour,
-                    minute=first_time.minute,
-                    second=0,
-                    microsecond=0,
-                )
-
-            # Calculate seconds until target time
-            seconds_until_target = (target - now).total_seconds()
+            # Strictly after the slot just served, so waking a little early
+            # cannot fire the same slot twice
+            now = datetime.now()
+            target = _next_refresh_at(max(now, last_target) if last_target else now, allowed_times)
 
-            # Wait until target time
-            await asyncio.sleep(seconds_until_target)
+            await _sleep_until(target)
 
             # Trigger automatic refresh (no confirmation needed)
             await self._perform_auto_refresh()
+            last_target = target
 
-            # Wait a bit to avoid multiple triggers
-            await asyncio.sleep(60)
-
-    def _update_with_new_articles(
+    async def _update_with_new_articles(
         self, new_articles, new_update_time, notify_editorial: bool = False
     ):
         """
@@ -405,35 +465,45 @@ class Cup(App):
         # Generate new editorial
         if self.editorial_generator:
             if notify_editorial:
-                self.notify("Generating editorial...", severity="information")
+                self._show_refresh_status("Generating editorial...")
             try:
-                editorial = self.editorial_generator.generate_editorial(new_articles)
-                editorial_path = self.editorial_generator.save_editorial(editorial)
-                self.current_editorial_path = editorial_path  # Track current editorial
-                self.editorial_content = self.editorial_generator.load_editorial(
-                    editorial_path
+                # The AI call and file I/O run in a worker thread so the
+                # TUI keeps redrawing and handling keys meanwhile
+                editorial_path, content = await asyncio.get_running_loop().run_in_executor(
+                    None, self._write_editorial, new_articles
                 )
+                self.current_editorial_path = editorial_path  # Track current editorial
+                self.editorial_content = content
                 if notify_editorial:
-                    self.notify("✓ Editorial generated", severity="information")
+                    self._show_refresh_status("✓ Editorial generated")
             except Exception as e:
                 self.notify(f"Error generating editorial: {e}", severity="error")
 
         # Rebuild the UI
         self._rebuild_view()
 
+    def _write_editorial(self, articles: list[dict[str, Any]]) -> tuple:
+        """Generate and save an editorial, returning its path and saved content"""
+        editorial = self.editorial_generator.generate_editorial(articles)
+        editorial_path = self.editorial_generator.save_editorial(editorial)
+        return editorial_path, self.editorial_generator.load_editorial(editorial_path)
+
     async def _perform_auto_refresh(self) -> None:
         """Perform automatic refresh without user confirmation"""
-        if not self.refresh_callback:
+        if not self.refresh_callback or self._refresh_in_progress():
             return
 
-        self.notify("Automatic refresh starting...", severity="information")
+        self._refreshing = True
+        self._show_refresh_status("Automatic refresh starting...")
 
         try:
-            # Call the refresh callback to fetch new articles
-            new_articles, new_update_time = self.refresh_callback()
+            # Fetching and summarizing blocks for a while, so keep it off the event loop
+            new_articles, new_update_time = await asyncio.get_running_loop().run_in_executor(
+                None, self.refresh_callback
+            )
 
             if new_articles:
-                self._update_with_new_articles(
+                await self._update_with_new_articles(
                     new_articles, new_update_time, notify_editorial=False
                 )
 
@@ -441,20 +511,21 @@ class Cup(App):
                 if self.refresh_manager:
                     self.refresh_manager.log_refresh(auto=True)
 
-                self.notify(
-                    f"✓ Auto-refreshed {len(new_articles)} articles",
-                    severity="information",
-                )
+                self._show_refresh_status(f"✓ Auto-refreshed {len(new_articles)} articles")
             else:
-                self.notify("No new articles found", severity="information")
+                self._show_refresh_status("No new articles found")
         except Exception as e:
             self.notify(f"Error during auto-refresh: {e}", severity="error")
+        finally:
+            self._refreshing = False
 
     async def action_refresh(self) -> None:
         """Refresh the news feed"""
         if not self.refresh_callback:
             self.notify("Refresh functionality not available", severity="warning")
             return
+        if self._refresh_in_progress():
+            return
 
         # Check if refresh manager is available
         if self.refresh_manager:
@@ -469,20 +540,27 @@ class Cup(App):
                 confirmed = await self.push_screen_wait(dialog)
 
                 if not confirmed:
-                    self.notify("Refresh cancelled", severity="information")
+                    self._show_refresh_status("Refresh cancelled")
                     return
 
                 # User confirmed, proceed with manual refresh
-                self.notify("Manual refresh confirmed", severity="information")
+                self._show_refresh_status("Manual refresh confirmed")
 
-        self.notify("Refreshing news feeds...", severity="information")
+        # Another refresh may have started while the dialog was open
+        if self._refresh_in_progress():
+            return
+
+        self._refreshing = True
+        self._show_refresh_status("Refreshing news feeds...")
 
         try:
-            # Call the refresh callback to fetch new articles
-            new_articles, new_update_time = self.refresh_callback()
+            # Fetching and summarizing blocks for a while, so keep it off the event loop
+            new_articles, new_update_time = await asyncio.get_running_loop().run_in_executor(
+                None, self.refresh_callback
+            )
 
             if new_articles:
-                self._update_with_new_articles(
+                await self._update_with_new_articles(
                     new_articles, new_update_time, notify_editorial=True
                 )
 
@@ -490,13 +568,19 @@ class Cup(App):
                 if self.refresh_manager:
                     self.refresh_manager.log_refresh(auto=False)
 
-                self.notify(
-                    f"✓ Refreshed {len(new_articles)} articles", severity="information"
-                )
+                self._show_refresh_status(f"✓ Refreshed {len(new_articles)} articles")
             else:
                 self.notify("No articles found during refresh", severity="warning")
         except Exception as e:
             self.notify(f"Error refreshing: {e}", severity="error")
+        finally:
+            self._refreshing = False
+
+    def _refresh_in_progress(self) -> bool:
+        """Whether a refresh is already running; says so in the status line if it is"""
+        if self._refreshing:
+            self._show_refresh_status("Refresh already in progress")
+        return self._refreshing
 
     def action_quit(self) -> None:
         """Quit the application"""
@@ -587,37 +671,33 @@ class Cup(App):
     def _rebuild_view(self) -> None:
         """Rebuild the view to show the editorial"""
         container = self.query_one("#content-container")
-        container.remove_children()
+        current = container.children[0] if container.children else None
 
-        if self.editorial_content:
-            container.mount(
-                EditorialView(self.editorial_content, id="editorial-container")
-            )
-        else:
-            container.mount(
-                Static(
-                    "[bold]No editorial available[/bold]\n\n"
-                    "An editorial will be generated from your RSS feeds.",
-                    id="empty-state",
-                )
-            )
+        # Keep the mounted widget when it already shows the right kind of
+        # content, so a refresh does not tear down and re-compose the view
+        if self.editorial_content and isinstance(current, EditorialView):
+            current.update_content(self.editorial_content)
+            return
+        if not self.editorial_content and current is not None and current.id == "empty-state":
+            return
+
+        container.remove_children()
+        container.mount(self._content_widget())
 
 
 def serve(
-    articles: List[Dict[str, Any]],
-    last_update: Optional[datetime] = None,
-    refresh_callback: Optional[
-        Callable[[], tuple[List[Dict[str, Any]], datetime]]
-    ] = None,
-    auto_refresh_time: Optional[time] = time(8, 0),
-    editorial_content: Optional[str] = None,
-    editorial_generator: Optional[Any] = None,
+    articles: list[dict[str, Any]],
+    last_update: datetime | None = None,
+    refresh_callback: Callable[[], tuple[list[dict[str, Any]], datetime]] | None = None,
+    auto_refresh_time: time | None = time(8, 0),
+    editorial_content: str | None = None,
+    editorial_generator: Any | None = None,
     theme: str = "rose-pine",
     theme_light: str = "rose-pine-dawn",
     theme_dark: str = "rose-pine",
-    refresh_manager: Optional[Any] = None,
-    opener_command: Optional[str] = None,
-    current_editorial_path: Optional[Path] = None,
+    refresh_manager: Any | None = None,
+    opener_command: str | None = None,
+    current_editorial_path: Path | None = None,
 ):
     """
     Display articles in the TUI
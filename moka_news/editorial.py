@@ -3,10 +3,47 @@ Editorial Generator - Creates AI-powered morning news editorials
 Combines multiple articles into a single coherent editorial with source links
 """
 
+from __future__ import annotations
+
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Any
 from moka_news.barista import AIProvider
+from moka_news.constants import EDITORIAL_CACHE_SIZE, EDITORIAL_METADATA_CACHE_SIZE
+
+# One entry of the editorial prompt: index, title, source, summary
+_ARTICLE_TEMPLATE = "{0}. {1}\n   Source: {2}\n   {3}\n\n"
+
+
+@lru_cache(maxsize=EDITORIAL_CACHE_SIZE)
+def _read_editorial(path: str, mtime_ns: int, size: int) -> str:
+    """Read an editorial file; the stat signature in the key drops stale entries"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=EDITORIAL_METADATA_CACHE_SIZE)
+def _editorial_metadata(path: str, mtime_ns: int, size: int) -> tuple[str, datetime]:
+    """
+    Title and timestamp of a saved editorial, parsed once per file version
+
+    Args:
+        path: Path to the editorial markdown file
+        mtime_ns: File modification time, so a rewritten file is parsed again
+        size: File size, for the same reason
+
+    Returns:
+        Tuple of (title, timestamp)
+    """
+    # Parse filename to get timestamp
+    timestamp = datetime.strptime(Path(path).stem, "%Y-%m-%d_%H-%M")
+
+    # Read first line as title
+    with open(path, "r", encoding="utf-8") as f:
+        first_line = f.readline().strip()
+    title = first_line.replace("# ", "") if first_line.startswith("# ") else "Untitled"
+    return title, timestamp
 
 
 class EditorialGenerator:
@@ -15,9 +52,9 @@ class EditorialGenerator:
     def __init__(
         self,
         ai_provider: AIProvider,
-        keywords: Optional[List[str]] = None,
-        editorials_dir: Optional[Path] = None,
-        editorial_prompts: Optional[Dict[str, str]] = None
+        keywords: list[str] | None = None,
+        editorials_dir: Path | None = None,
+        editorial_prompts: dict[str, str] | None = None
     ):
         """
         Initialize the Editorial Generator
@@ -42,7 +79,7 @@ class EditorialGenerator:
         # Create editorials directory if it doesn't exist
         self.editorials_dir.mkdir(parents=True, exist_ok=True)
     
-    def generate_editorial(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def generate_editorial(self, articles: list[dict[str, Any]]) -> dict[str, Any]:
         """
         Generate an editorial from a list of articles
         
@@ -103,7 +140,7 @@ class EditorialGenerator:
             "article_count": len(articles)
         }
     
-    def _build_editorial_prompt(self, articles: List[Dict[str, Any]]) -> str:
+    def _build_editorial_prompt(self, articles: list[dict[str, Any]]) -> str:
         """
         Build a prompt for editorial generation
         
@@ -115,19 +152,17 @@ class EditorialGenerator:
         """
         # Use all articles - they are already filtered by date
         # Use full AI summaries (already optimized) instead of truncating
-        articles_text = ""
-        for i, article in enumerate(articles, 1):
-            title = article.get("ai_title", article.get("title", ""))
-            summary = article.get("ai_summary", article.get("summary", ""))
-            source = article.get("source", "Unknown")
-            
-            articles_text += f"{i}. {title}\n"
-            articles_text += f"   Source: {source}\n"
-            articles_text += f"   {summary}\n\n"
-        
-        return articles_text
+        return "".join([
+            _ARTICLE_TEMPLATE.format(
+                i,
+                article.get("ai_title", article.get("title", "")),
+                article.get("source", "Unknown"),
+                article.get("ai_summary", article.get("summary", "")),
+            )
+            for i, article in enumerate(articles, 1)
+        ])
     
-    def _get_editorial_prompts(self) -> Dict[str, str]:
+    def _get_editorial_prompts(self) -> dict[str, str]:
         """
         Get custom prompts for editorial generation
         
@@ -142,7 +177,7 @@ class EditorialGenerator:
         from moka_news.config import DEFAULT_EDITORIAL_PROMPTS
         return DEFAULT_EDITORIAL_PROMPTS
     
-    def _create_simple_editorial(self, articles: List[Dict[str, Any]]) -> str:
+    def _create_simple_editorial(self, articles: list[dict[str, Any]]) -> str:
         """
         Create a simple editorial without AI (fallback)
         
@@ -152,17 +187,19 @@ class EditorialGenerator:
         Returns:
             Simple editorial text
         """
-        content = "## Your Morning News Digest\n\n"
-        content += f"Here are the top stories from {len(articles)} articles:\n\n"
+        parts = [
+            "## Your Morning News Digest\n\n",
+            f"Here are the top stories from {len(articles)} articles:\n\n",
+        ]
         
         for i, article in enumerate(articles[:5], 1):
             title = article.get("ai_title", article.get("title", "Untitled"))
             summary = article.get("ai_summary", article.get("summary", ""))[:150]
-            content += f"**{i}. {title}**\n{summary}\n\n"
+            parts.append(f"**{i}. {title}**\n{summary}\n\n")
         
-        return content
+        return "".join(parts)
     
-    def save_editorial(self, editorial: Dict[str, Any]) -> Path:
+    def save_editorial(self, editorial: dict[str, Any]) -> Path:
         """
         Save editorial to markdown file
         
@@ -185,7 +222,7 @@ class EditorialGenerator:
         
         return filepath
     
-    def _format_editorial_markdown(self, editorial: Dict[str, Any]) -> str:
+    def _format_editorial_markdown(self, editorial: dict[str, Any]) -> str:
         """
         Format editorial as markdown
         
@@ -198,27 +235,29 @@ class EditorialGenerator:
         timestamp = editorial["timestamp"]
         date_str = timestamp.strftime("%A, %B %d, %Y at %H:%M")
         
-        md = f"# {editorial['title']}\n\n"
-        md += f"*{date_str}*\n\n"
-        md += "---\n\n"
-        md += editorial['content']
-        md += "\n\n---\n\n"
-        md += "## Sources\n\n"
+        parts = [
+            f"# {editorial['title']}\n\n",
+            f"*{date_str}*\n\n",
+            "---\n\n",
+            editorial['content'],
+            "\n\n---\n\n",
+            "## Sources\n\n",
+        ]
         
         for source in editorial['sources']:
             title = source['title']
             url = source['url']
             source_name = source['source']
             if url:
-                md += f"- **{title}** - *{source_name}*  \n  [{url}]({url})\n\n"
+                parts.append(f"- **{title}** - *{source_name}*  \n  [{url}]({url})\n\n")
             else:
-                md += f"- **{title}** - *{source_name}*\n\n"
+                parts.append(f"- **{title}** - *{source_name}*\n\n")
         
-        md += f"\n*Editorial generated from {editorial['article_count']} articles*\n"
+        parts.append(f"\n*Editorial generated from {editorial['article_count']} articles*\n")
         
-        return md
+        return "".join(parts)
     
-    def list_editorials(self) -> List[Dict[str, Any]]:
+    def list_editorials(self) -> list[dict[str, Any]]:
         """
         List all saved editorials
         
@@ -232,14 +271,8 @@ class EditorialGenerator:
         
         for filepath in sorted(self.editorials_dir.glob("*.md"), reverse=True):
             try:
-                # Parse filename to get timestamp
-                filename = filepath.stem
-                timestamp = datetime.strptime(filename, "%Y-%m-%d_%H-%M")
-                
-                # Read first line as title
-                with open(filepath, "r", encoding="utf-8") as f:
-                    first_line = f.readline().strip()
-                    title = first_line.replace("# ", "") if first_line.startswith("# ") else "Untitled"
+                stat = filepath.stat()
+                title, timestamp = _editorial_metadata(str(filepath), stat.st_mtime_ns, stat.st_size)
                 
                 editorials.append({
                     "title": title,
@@ -262,5 +295,7 @@ class EditorialGenerator:
         Returns:
             Editorial content as markdown string
         """
-        with open(filepath, "r", encoding="utf-8") as f:
-            return f.read()
+        # Re-opening an editorial from history is a cache hit unless the
+        # file has been rewritten since
+        stat = Path(filepath).stat()
+        return _read_editorial(str(filepath), stat.st_mtime_ns, stat.st_size)
@@ -6,9 +6,9 @@ Handles AI provider selection and OPML feed initialization
 import os
 import sys
 import shutil
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
+from moka_news.config import DEFAULT_PROMPTS, _yaml_dumper, get_config_path
 from moka_news.opml_manager import OPMLManager
 from moka_news.constants import DEFAULT_TECH_FEEDS
 
@@ -70,18 +70,7 @@ def is_first_run() -> bool:
     Returns:
         True if this is the first run, False otherwise
     """
-    config_locations = [
-        Path.cwd() / "moka-news.yaml",
-        Path.cwd() / ".moka-news.yaml",
-        Path.home() / ".config" / "moka-news" / "config.yaml",
-        Path.home() / ".moka-news.yaml",
-    ]
-    
-    for location in config_locations:
-        if location.exists():
-            return False
-    
-    return True
+    return get_config_path() is None
 
 
 def check_cli_available(command: str) -> bool:
@@ -308,9 +297,6 @@ def save_config(config_data: Dict[str, Any], config_path: Optional[Path] = None)
     # Ensure directory exists
     config_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Load default prompts
-    from moka_news.config import DEFAULT_PROMPTS
-    
     # Prepare config content
     config_content = {
         "ai": {
@@ -329,9 +315,11 @@ def save_config(config_data: Dict[str, Any], config_path: Optional[Path] = None)
         }
     }
     
-    # Save to file
+    # Only the wizard writes YAML, so PyYAML is imported here
+    import yaml
+
     with open(config_path, 'w') as f:
-        yaml.dump(config_content, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(config_content, f, Dumper=_yaml_dumper(), default_flow_style=False, sort_keys=False)
     
     return config_path
 
@@ -3,12 +3,15 @@ The Grinder - RSS Feed Parser
 Extracts data from RSS feeds using feedparser
 """
 
+from __future__ import annotations
+
 import feedparser
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, Any
 from datetime import datetime
 from email.utils import parsedate_to_datetime
 from moka_news.logger import get_logger
-from moka_news.constants import DEFAULT_TECH_FEEDS
+from moka_news.constants import DEFAULT_TECH_FEED_URLS, GRIND_MAX_WORKERS
 
 logger = get_logger(__name__)
 
@@ -16,7 +19,7 @@ logger = get_logger(__name__)
 class Grinder:
     """RSS feed parser and aggregator"""
 
-    def __init__(self, feed_urls: List[str], since: Optional[datetime] = None):
+    def __init__(self, feed_urls: list[str], since: datetime | None = None):
         """
         Initialize the Grinder with a list of RSS feed URLs
 
@@ -27,7 +30,7 @@ class Grinder:
         self.feed_urls = feed_urls
         self.since = since
 
-    def grind(self) -> tuple[List[Dict[str, Any]], datetime]:
+    def grind(self) -> tuple[list[dict[str, Any]], datetime]:
         """
         Parse all RSS feeds and extract articles
 
@@ -40,52 +43,90 @@ class Grinder:
         last_update = datetime.now()
 
         for feed_url in self.feed_urls:
-            try:
-                feed = feedparser.parse(feed_url)
-
-                for entry in feed.entries:
-                    # Parse published date if available
-                    published_str = entry.get("published", entry.get("updated", ""))
-                    published_dt = None
-                    
-                    if published_str:
+            articles.extend(self._grind_feed(feed_url))
+
+        return articles, last_update
+
+    def stream(self, max_workers: int = GRIND_MAX_WORKERS) -> Iterator[list[dict[str, Any]]]:
+        """
+        Fetch feeds concurrently and yield each feed's articles as soon as it is parsed
+
+        Lets a consumer (e.g. Barista.brew_stream) start working on the first
+        feeds while the remaining ones are still downloading.
+
+        Args:
+            max_workers: Maximum number of feeds fetched at the same time
+
+        Yields:
+            List of article dictionaries for one feed, in completion order
+        """
+        if not self.feed_urls:
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="grinder") as executor:
+            futures = [executor.submit(self._grind_feed, feed_url) for feed_url in self.feed_urls]
+            for future in as_completed(futures):
+                articles = future.result()
+                if articles:
+                    yield articles
+
+    def _grind_feed(self, feed_url: str) -> list[dict[str, Any]]:
+        """
+        Parse a single RSS feed
+
+        Args:
+            feed_url: RSS feed URL
+
+        Returns:
+            List of article dictionaries (empty if the feed could not be parsed)
+        """
+        articles = []
+        try:
+            feed = feedparser.parse(feed_url)
+
+            for entry in feed.entries:
+                # Parse published date if available
+                published_str = entry.get("published", entry.get("updated", ""))
+                published_dt = None
+                
+                if published_str:
+                    try:
+                        # Try to parse the date using email.utils (handles RFC 2822 format)
+                        published_dt = parsedate_to_datetime(published_str)
+                    except Exception:
                         try:
-                            # Try to parse the date using email.utils (handles RFC 2822 format)
-                            published_dt = parsedate_to_datetime(published_str)
+                            # Fallback: try feedparser's parsed date
+                            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                                import time
+                                published_dt = datetime.fromtimestamp(time.mktime(entry.published_parsed))
                         except Exception:
-                            try:
-                                # Fallback: try feedparser's parsed date
-                                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                                    import time
-                                    published_dt = datetime.fromtimestamp(time.mktime(entry.published_parsed))
-                            except Exception:
-                                pass
-                    
-                    # Filter by date if since parameter is provided
-                    if self.since and published_dt:
-                        if published_dt < self.since:
-                            continue  # Skip articles older than the since timestamp
-                    
-                    article = {
-                        "title": entry.get("title", "No Title"),
-                        "link": entry.get("link", ""),
-                        "summary": entry.get("summary", entry.get("description", "")),
-                        "published": published_str,
-                        "published_dt": published_dt,
-                        "source": feed.feed.get("title", feed_url),
-                    }
-                    articles.append(article)
-            except Exception as e:
-                logger.error(f"Error parsing feed {feed_url}: {e}", exc_info=True)
+                            pass
+                
+                # Filter by date if since parameter is provided
+                if self.since and published_dt:
+                    if published_dt < self.since:
+                        continue  # Skip articles older than the since timestamp
+                
+                article = {
+                    "title": entry.get("title", "No Title"),
+                    "link": entry.get("link", ""),
+                    "summary": entry.get("summary", entry.get("description", "")),
+                    "published": published_str,
+                    "published_dt": published_dt,
+                    "source": feed.feed.get("title", feed_url),
+                }
+                articles.append(article)
+        except Exception as e:
+            logger.error(f"Error parsing feed {feed_url}: {e}", exc_info=True)
 
-        return articles, last_update
+        return articles
 
 
-def get_default_feeds() -> List[str]:
+def get_default_feeds() -> list[str]:
     """
     Get a list of default RSS feeds
     
     Returns:
         List of default RSS feed URLs
     """
-    return [feed["url"] for feed in DEFAULT_TECH_FEEDS]
+    return list(DEFAULT_TECH_FEED_URLS)
@@ -5,18 +5,19 @@ Orchestrates The Grinder (RSS extraction), The Editorial Generator (AI focus), a
 
 import argparse
 from datetime import time
-from dotenv import load_dotenv
-from moka_news.grinder import Grinder
 from moka_news.barista import create_ai_provider, SimpleBarista
-from moka_news.cup import serve
-from moka_news.config import load_config, create_sample_config
+from moka_news.config import load_config, create_sample_config, get_config_path
 from moka_news.opml_manager import OPMLManager
-from moka_news.first_run_setup import is_first_run, run_first_run_setup
+from moka_news.first_run_setup import run_first_run_setup
 from moka_news.download_tracker import DownloadTracker
 from moka_news.refresh_manager import RefreshManager
 from moka_news.editorial import EditorialGenerator
 from moka_news.logger import get_logger, setup_logger
 
+# moka_news.grinder (feedparser) and moka_news.cup (textual) are imported where
+# they are used, so feed-management commands start without loading them; dotenv
+# is imported in main() so importing this module does not load it
+
 # Setup logger for console output
 setup_logger("moka_news")
 logger = get_logger(__name__)
@@ -47,6 +48,8 @@ def fetch_and_brew(feed_urls, config, ai_provider, download_tracker=None):
     logger.info(f"Grinding {len(feed_urls)} feeds...")
 
     # Step 1: The Grinder - Extract articles from RSS feeds
+    from moka_news.grinder import Grinder
+
     grinder = Grinder(feed_urls, since=since)
     articles, last_update = grinder.grind()
 
@@ -71,6 +74,8 @@ def fetch_and_brew(feed_urls, config, ai_provider, download_tracker=None):
 def main():
     """Main entry point for MoKa News"""
     # Load environment variables from .env file
+    from dotenv import load_dotenv
+
     load_dotenv()
 
     # Parse command line arguments
@@ -165,7 +170,10 @@ Feed Management:
         args.create_config or args.add_feed or args.remove_feed or args.list_feeds
     )
 
-    if is_first_run() and not skip_setup:
+    # Search the default locations once; the result also feeds load_config below
+    found_config = get_config_path()
+
+    if found_config is None and not skip_setup:
         run_first_run_setup(opml_manager)
         # After setup, user needs to run moka-news again
         return
@@ -208,7 +216,7 @@ Feed Management:
         return
 
     # Load configuration
-    config = load_config(args.config)
+    config = load_config(args.config or found_config)
 
     # CLI arguments override config file
     ai_provider = args.ai if args.ai else config["ai"]["provider"]
@@ -291,6 +299,8 @@ Feed Management:
     else:
         print("☕ Serving your news...\n")
 
+        from moka_news.cup import serve
+
         # Create refresh callback for the TUI
         def refresh_callback():
             return fetch_and_brew(feed_urls, config, ai_provider, download_tracker)
@@ -3,15 +3,16 @@ Tests for The Barista component
 """
 
 import pytest
+
 from moka_news.barista import (
-    Barista,
-    SimpleBarista,
     AIProvider,
+    Barista,
     GeminiBarista,
-    MistralBarista,
-    GitHubCopilotCLIBarista,
     GeminiCLIBarista,
+    GitHubCopilotCLIBarista,
+    MistralBarista,
     MistralCLIBarista,
+    SimpleBarista,
 )
 
 
@@ -84,6 +85,16 @@ def test_barista_brew_with_keywords():
     assert barista.keywords == keywords
 
 
+def test_barista_normalizes_keywords_but_keeps_their_order():
+    """Test that keywords are cleaned up in configured order, with an order-free cache key"""
+    first = Barista(SimpleBarista(), ["python ", "AI", "python", ""])
+    second = Barista(SimpleBarista(), ["AI", "python"])
+
+    assert first.keywords == ["python", "AI"]
+    assert second.keywords == ["AI", "python"]
+    assert first._cache_namespace() == second._cache_namespace()
+
+
 def test_barista_handles_empty_list():
     """Test that Barista handles empty article list"""
     barista = Barista(SimpleBarista())
@@ -145,3 +156,1300 @@ def test_mistral_cli_barista_checks_mistral():
     except RuntimeError as e:
         # Expected if mistral CLI is not available
         assert "mistral" in str(e).lower()
+
+
+class _SlowProvider(AIProvider):
+    """Provider that records the threads it runs on"""
+
+    def __init__(self):
+        self.threads = set()
+
+    def generate_summary(
+        self,
+        article,
+        keywords=None,
+        prompts=None,
+        max_content_length=1500,
+        max_tokens=250,
+    ):
+        import threading
+        import time
+
+        self.threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+        return {"title": article["title"].upper(), "summary": article["summary"]}
+
+    def _call_llm(self, prompt, prompts, max_tokens):
+        raise AssertionError("generate_summary is overridden")
+
+
+def test_barista_brew_runs_provider_concurrently_and_preserves_order():
+    """Test that brew dispatches articles to a thread pool and keeps input order"""
+    provider = _SlowProvider()
+    barista = Barista(provider, max_workers=4)
+    articles = [{"title": f"article {i}", "summary": f"summary {i}"} for i in range(8)]
+
+    processed = barista.brew(articles)
+    barista.close()
+
+    assert [a["ai_title"] for a in processed] == [f"ARTICLE {i}" for i in range(8)]
+    assert len(provider.threads) > 1
+
+
+def test_parse_batch_response_maps_results_by_id():
+    """Test that batched JSON responses are mapped back to their articles"""
+    from moka_news.barista import _parse_batch_response
+
+    articles = [{"title": "A", "summary": "a"}, {"title": "B", "summary": "b"}]
+    content = 'Sure!\n{"articles": [{"id": 1, "title": "Second", "summary": "S2"}, {"id": 0, "title": "First", "summary": "S1"}]}'
+
+    results = _parse_batch_response(content, articles)
+
+    assert results == [
+        {"title": "First", "summary": "S1"},
+        {"title": "Second", "summary": "S2"},
+    ]
+
+
+def test_parse_batch_response_ignores_code_fence_and_trailing_text():
+    """Test that text after the JSON payload does not fail the batch"""
+    from moka_news.barista import _parse_batch_response
+
+    articles = [{"title": "A", "summary": "a"}]
+    content = '```json\n{"articles": [{"id": 0, "title": "First", "summary": "S1"}]}\n```\nLet me know if you need more.'
+
+    assert _parse_batch_response(content, articles) == [
+        {"title": "First", "summary": "S1"}
+    ]
+
+
+def test_parse_batch_response_rejects_missing_articles():
+    """Test that an incomplete batch response raises ValueError"""
+    from moka_news.barista import _parse_batch_response
+
+    articles = [{"title": "A", "summary": "a"}, {"title": "B", "summary": "b"}]
+    with pytest.raises(ValueError):
+        _parse_batch_response(
+            '{"articles": [{"id": 0, "title": "T", "summary": "S"}]}', articles
+        )
+
+
+class _BatchProvider(AIProvider):
+    """Provider that answers whole batches and records their sizes"""
+
+    supports_batch = True
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def generate_summary(
+        self,
+        article,
+        keywords=None,
+        prompts=None,
+        max_content_length=1500,
+        max_tokens=250,
+    ):
+        return {"title": article["title"], "summary": article["summary"]}
+
+    def generate_summary_batch(
+        self,
+        articles,
+        keywords=None,
+        prompts=None,
+        max_content_length=1500,
+        max_tokens=250,
+    ):
+        self.batch_sizes.append(len(articles))
+        return [
+            {"title": f"batched {a['title']}", "summary": a["summary"]}
+            for a in articles
+        ]
+
+    def _call_llm(self, prompt, prompts, max_tokens):
+        raise AssertionError("generate_summary is overridden")
+
+
+def test_barista_brew_batches_articles_for_batching_providers():
+    """Test that brew groups articles into batch_size chunks"""
+    provider = _BatchProvider()
+    barista = Barista(provider, batch_size=3)
+    articles = [{"title": str(i), "summary": "s"} for i in range(7)]
+
+    processed = barista.brew(articles)
+    barista.close()
+
+    assert sorted(provider.batch_sizes) == [1, 3, 3]
+    assert [a["ai_title"] for a in processed] == [f"batched {i}" for i in range(7)]
+
+
+def test_barista_custom_user_prompt_reaches_the_request():
+    """Test that a custom user_prompt is not replaced by the batch instructions"""
+    from moka_news.config import DEFAULT_PROMPTS
+
+    class _RecordingProvider(_BatchProvider):
+        def __init__(self):
+            super().__init__()
+            self.prompts = []
+
+        def generate_summary(
+            self,
+            article,
+            keywords=None,
+            prompts=None,
+            max_content_length=1500,
+            max_tokens=250,
+        ):
+            self.prompts.append(prompts["user_prompt"])
+            return super().generate_summary(
+                article, keywords, prompts, max_content_length, max_tokens
+            )
+
+    provider = _RecordingProvider()
+    prompts = dict(
+        DEFAULT_PROMPTS, user_prompt="Summarize in pirate speak: {title}\n{content}"
+    )
+    barista = Barista(provider, batch_size=3, prompts=prompts)
+
+    processed = barista.brew([{"title": str(i), "summary": "s"} for i in range(4)])
+    barista.close()
+
+    assert provider.batch_sizes == []
+    assert provider.prompts == [prompts["user_prompt"]] * 4
+    assert len(processed) == 4
+
+
+def test_cli_barista_answers_a_batch_with_one_invocation(monkeypatch):
+    """Test that CLI providers run the CLI once per batch of articles"""
+    import subprocess
+
+    from moka_news.constants import CLI_GENERATION_TIMEOUT
+
+    calls = []
+
+    timeouts = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        timeouts.append(kwargs["timeout"])
+        stdout = b'{"articles": [{"id": 0, "title": "T0", "summary": "S0"}, {"id": 1, "title": "T1", "summary": "S1"}]}'
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr=b"")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr("moka_news.barista._cli_available", lambda name: True)
+    barista = MistralCLIBarista()
+
+    results = barista.generate_summary_batch(
+        [{"title": "A", "summary": "a"}, {"title": "B", "summary": "b"}]
+    )
+
+    assert len(calls) == 1
+    assert [r["title"] for r in results] == ["T0", "T1"]
+    assert timeouts[-1] > CLI_GENERATION_TIMEOUT  # one invocation answers both articles
+
+
+def test_cli_barista_probes_path_without_spawning(monkeypatch):
+    """Test that CLI availability is checked with PATH lookups, cached per executable"""
+    import shutil
+    import subprocess
+
+    from moka_news import barista as barista_module
+
+    lookups = []
+    monkeypatch.setattr(shutil, "which", lambda name: lookups.append(name))
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda *args, **kwargs: pytest.fail("probe spawned a process"),
+    )
+    barista_module._cli_available.cache_clear()
+    try:
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="gcloud"):
+                GeminiCLIBarista()
+    finally:
+        barista_module._cli_available.cache_clear()
+
+    assert lookups == ["gcloud"]
+
+
+def test_parse_ai_response_extracts_title_and_summary():
+    """Test that TITLE:/SUMMARY: markers are parsed from the response"""
+    from moka_news.barista import _parse_ai_response
+
+    content = "Here you go:\nTITLE:  A better title \r\nSUMMARY: A short summary.\n"
+    result = _parse_ai_response(
+        content, {"title": "Original", "summary": "Original summary"}
+    )
+
+    assert result == {"title": "A better title", "summary": "A short summary."}
+
+
+def test_parse_ai_response_only_matches_markers_at_line_start():
+    """Test that markers are read in any order and only at the start of a line"""
+    from moka_news.barista import _parse_ai_response
+
+    content = (
+        "The TITLE: field comes later.\nSUMMARY: Summary first\n  TITLE: Indented title"
+    )
+    result = _parse_ai_response(
+        content, {"title": "Original", "summary": "Original summary"}
+    )
+
+    assert result == {"title": "Indented title", "summary": "Summary first"}
+
+
+def test_parse_ai_response_falls_back_to_article():
+    """Test that missing markers fall back to the original article fields"""
+    from moka_news.barista import _parse_ai_response
+
+    result = _parse_ai_response(
+        "no markers here", {"title": "Original", "summary": "x" * 300}
+    )
+
+    assert result["title"] == "Original"
+    assert result["summary"] == "x" * 200
+
+
+def test_barista_brew_summarizes_duplicate_links_once():
+    """Test that articles sharing a link only hit the provider once"""
+    provider = _SlowProvider()
+    calls = []
+    original = provider.generate_summary
+
+    def counting(article, *args, **kwargs):
+        calls.append(article["title"])
+        return original(article, *args, **kwargs)
+
+    provider.generate_summary = counting
+    barista = Barista(provider, max_workers=1)
+    articles = [
+        {
+            "title": "story",
+            "summary": "s",
+            "link": "https://example.com/a?utm_source=feed1",
+            "source": "Feed 1",
+        },
+        {"title": "other", "summary": "s", "link": "https://example.com/b"},
+        {
+            "title": "story",
+            "summary": "s",
+            "link": "http://example.com/a/",
+            "source": "Feed 2",
+        },
+    ]
+
+    processed = barista.brew(articles)
+
+    assert calls == ["story", "other"]
+    assert [a["ai_title"] for a in processed] == ["STORY", "OTHER", "STORY"]
+    assert processed[2]["source"] == "Feed 2"
+
+
+def test_barista_brew_keeps_articles_with_different_query_ids_apart():
+    """Test that links differing only in their item query parameter are not merged"""
+    calls = []
+
+    class RecordingProvider(AIProvider):
+        def generate_summary(
+            self,
+            article,
+            keywords=None,
+            prompts=None,
+            max_content_length=1500,
+            max_tokens=250,
+        ):
+            calls.append(article["link"])
+            return {"title": f"AI {article['title']}", "summary": "AI summary"}
+
+        def _call_llm(self, prompt, prompts, max_tokens):
+            raise AssertionError("generate_summary is overridden")
+
+    articles = [
+        {
+            "title": "Video",
+            "summary": "s",
+            "link": "https://www.youtube.com/watch?v=aaa",
+        },
+        {
+            "title": "Video",
+            "summary": "s",
+            "link": "https://www.youtube.com/watch?v=bbb",
+        },
+        {
+            "title": "Post",
+            "summary": "s",
+            "link": "https://example.com/article.php?id=1",
+        },
+        {
+            "title": "Post",
+            "summary": "s",
+            "link": "https://example.com/article.php?id=2&utm_medium=rss",
+        },
+    ]
+
+    processed = Barista(RecordingProvider(), max_workers=1).brew(articles)
+
+    assert calls == [article["link"] for article in articles]
+    assert [a["link"] for a in processed] == [article["link"] for article in articles]
+
+
+def test_read_stream_stops_after_title_and_summary():
+    """Test that streaming stops once TITLE and SUMMARY lines are complete"""
+    from moka_news.barista import _read_stream
+
+    consumed = []
+
+    def pieces():
+        for piece in [
+            "TITLE: Hello",
+            "\nSUMMARY: World",
+            "\n",
+            "extra tokens",
+            " never read",
+        ]:
+            consumed.append(piece)
+            yield piece
+
+    content = _read_stream(pieces())
+
+    assert content == "TITLE: Hello\nSUMMARY: World\n"
+    assert "extra tokens" not in consumed
+
+
+def test_openai_barista_streams_completion():
+    """Test that OpenAIBarista parses a streamed completion"""
+    from types import SimpleNamespace
+
+    from moka_news.barista import OpenAIBarista
+
+    closed = []
+
+    class FakeStream:
+        def __iter__(self):
+            for text in ["TITLE: Streamed\n", "SUMMARY: Fast summary\n", "ignored"]:
+                yield SimpleNamespace(
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content=text))]
+                )
+
+        def close(self):
+            closed.append(True)
+
+    barista = OpenAIBarista(api_key="test-key")
+    barista.client = SimpleNamespace(
+        chat=SimpleNamespace(
+            completions=SimpleNamespace(create=lambda **kwargs: FakeStream())
+        )
+    )
+
+    result = barista.generate_summary({"title": "Original", "summary": "Body"})
+
+    assert result == {"title": "Streamed", "summary": "Fast summary"}
+    assert closed == [True]
+
+
+def test_openai_barista_without_streaming_reads_full_completion():
+    """Test that stream=False falls back to a plain completion request"""
+    from types import SimpleNamespace
+
+    from moka_news.barista import OpenAIBarista
+
+    requests = []
+
+    def create(**kwargs):
+        requests.append(kwargs)
+        message = SimpleNamespace(content="TITLE: Whole\nSUMMARY: Complete response")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    barista = OpenAIBarista(api_key="test-key", stream=False)
+    barista.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+
+    result = barista.generate_summary({"title": "Original", "summary": "Body"})
+
+    assert result == {"title": "Whole", "summary": "Complete response"}
+    assert requests[0]["stream"] is False
+
+
+def test_barista_brew_passes_through_concise_articles():
+    """Test that articles already within the length limits skip the provider"""
+    provider = _SlowProvider()
+    barista = Barista(provider)
+    concise = {
+        "title": "Short title",
+        "summary": "A feed summary that is already concise enough.",
+    }
+    long_summary = {"title": "Long one", "summary": "word " * 100}
+
+    processed = barista.brew([concise, long_summary])
+
+    assert processed[0]["ai_title"] == "Short title"
+    assert processed[0]["ai_summary"] == concise["summary"]
+    assert processed[1]["ai_title"] == "LONG ONE"
+    assert len(provider.threads) == 1
+    assert barista.passed_through == 1
+
+
+def test_barista_brew_skips_articles_without_summary():
+    """Test that articles with nothing to summarize never reach the provider"""
+    provider = _SlowProvider()
+    barista = Barista(provider, keywords=["python"])
+
+    processed = barista.brew([{"title": "Headline only", "summary": "  "}])
+
+    assert processed[0]["ai_title"] == "Headline only"
+    assert processed[0]["ai_summary"] == "No summary available."
+    assert not provider.threads
+    assert barista.passed_through == 1
+
+
+def test_barista_brew_passthrough_disabled_with_keywords():
+    """Test that keyword-focused summaries always go through the provider"""
+    article = {
+        "title": "Short title",
+        "summary": "A feed summary that is already concise enough.",
+    }
+
+    processed = Barista(_SlowProvider(), keywords=["ai"]).brew([article])
+    assert processed[0]["ai_title"] == "SHORT TITLE"
+
+    processed = Barista(_SlowProvider(), passthrough_short=False).brew([article])
+    assert processed[0]["ai_title"] == "SHORT TITLE"
+
+
+def test_call_with_retries_retries_transient_errors(monkeypatch):
+    """Test that transient errors are retried with backoff and others are not"""
+    from moka_news import barista as barista_module
+
+    sleeps = []
+    monkeypatch.setattr(barista_module.time, "sleep", sleeps.append)
+
+    class Transient(Exception):
+        pass
+
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise Transient("rate limited")
+        return "ok"
+
+    assert barista_module._call_with_retries(flaky, (Transient,)) == "ok"
+    assert len(attempts) == 3
+    assert len(sleeps) == 2
+
+    def broken():
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        barista_module._call_with_retries(broken, (Transient,))
+    assert len(sleeps) == 2
+
+
+def test_openai_barista_retries_server_errors_only():
+    """Test that 5xx responses are retried but client errors are not"""
+    import openai
+
+    from moka_news.barista import OpenAIBarista
+
+    retryable = OpenAIBarista(api_key="test-key")._retryable
+
+    assert openai.InternalServerError in retryable
+    assert openai.BadRequestError not in retryable
+
+
+def test_retry_delay_honors_retry_after_header():
+    """Test that a Retry-After header overrides exponential backoff"""
+    from types import SimpleNamespace
+
+    from moka_news.barista import _retry_delay
+
+    error = Exception("429")
+    error.response = SimpleNamespace(headers={"retry-after": "2"})
+
+    assert _retry_delay(error, 1) == 2.0
+    assert 0 <= _retry_delay(Exception("timeout"), 3) <= 4.0
+
+
+def test_retry_after_reads_milliseconds_and_http_dates():
+    """Test that retry-after-ms and date-valued Retry-After headers are understood"""
+    import time
+    from email.utils import formatdate
+    from types import SimpleNamespace
+
+    from moka_news.barista import _retry_after
+
+    def error_with(headers):
+        error = Exception("429")
+        error.response = SimpleNamespace(headers=headers)
+        return error
+
+    assert (
+        _retry_after(error_with({"retry-after-ms": "1500", "retry-after": "2"})) == 1.5
+    )
+    assert (
+        0
+        < _retry_after(
+            error_with({"retry-after": formatdate(time.time() + 30, usegmt=True)})
+        )
+        <= 30
+    )
+    assert _retry_after(error_with({"retry-after": "soon"})) is None
+    assert _retry_after(Exception("no response")) is None
+
+
+def test_barista_brew_stream_yields_one_result_per_batch():
+    """Test that brew_stream processes each incoming batch lazily"""
+    barista = Barista(SimpleBarista())
+    batches = iter([[{"title": "A", "summary": "a"}], [{"title": "B", "summary": "b"}]])
+
+    stream = barista.brew_stream(batches)
+    first = next(stream)
+
+    assert [a["ai_title"] for a in first] == ["A"]
+    assert [a["ai_title"] for a in next(stream)] == ["B"]
+
+
+class _AsyncProvider(AIProvider):
+    """Provider with a native coroutine that records peak concurrency"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    def generate_summary(
+        self,
+        article,
+        keywords=None,
+        prompts=None,
+        max_content_length=1500,
+        max_tokens=250,
+    ):
+        raise AssertionError("brew_async should use generate_summary_async")
+
+    async def generate_summary_async(
+        self,
+        article,
+        keywords=None,
+        prompts=None,
+        max_content_length=1500,
+        max_tokens=250,
+    ):
+        import asyncio
+
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return {"title": article["title"].upper(), "summary": article["summary"]}
+
+    def _call_llm(self, prompt, prompts, max_tokens):
+        raise AssertionError("generate_summary is overridden")
+
+
+def test_barista_brew_async_gathers_provider_coroutines():
+    """Test that brew_async awaits provider calls concurrently and keeps order"""
+    import asyncio
+
+    provider = _AsyncProvider()
+    articles = [{"title": f"article {i}", "summary": f"summary {i}"} for i in range(6)]
+
+    processed = asyncio.run(Barista(provider).brew_async(articles))
+
+    assert [a["ai_title"] for a in processed] == [f"ARTICLE {i}" for i in range(6)]
+    assert provider.peak > 1
+
+
+def test_barista_brew_async_shares_inflight_calls_between_brews():
+    """Test that overlapping brew_async calls summarize a shared article once"""
+    import asyncio
+
+    provider = _AsyncProvider()
+    barista = Barista(provider, max_workers=4)
+    shared = {"title": "shared", "summary": "shared summary"}
+
+    async def run():
+        return await asyncio.gather(
+            barista.brew_async(
+                [shared, {"title": "first", "summary": "only in first"}]
+            ),
+            barista.brew_async(
+                [{"title": "second", "summary": "only in second"}, shared]
+            ),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert first[0]["ai_title"] == second[1]["ai_title"] == "SHARED"
+    assert second[0]["ai_title"] == "SECOND"
+    assert provider.calls == 3
+    assert barista._inflight == {}
+
+
+def test_provider_generate_summary_async_defaults_to_executor():
+    """Test that providers without an async client still work from brew_async"""
+    import asyncio
+
+    processed = asyncio.run(
+        Barista(_SlowProvider()).brew_async([{"title": "a", "summary": "b"}])
+    )
+
+    assert processed[0]["ai_title"] == "A"
+
+
+def test_anthropic_batch_reads_forced_tool_call():
+    """Test that Anthropic batches are parsed from the forced tool_use block"""
+    from types import SimpleNamespace
+
+    from moka_news.barista import AnthropicBarista
+
+    requests = []
+
+    def create(**kwargs):
+        requests.append(kwargs)
+        block = SimpleNamespace(
+            type="tool_use",
+            input={
+                "articles": [
+                    {"id": 0, "title": "T0", "summary": "S0"},
+                    {"id": 1, "title": "T1", "summary": "S1"},
+                ]
+            },
+        )
+        return SimpleNamespace(content=[block])
+
+    barista = AnthropicBarista(api_key="test-key")
+    barista.client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+    results = barista.generate_summary_batch(
+        [{"title": "A", "summary": "a"}, {"title": "B", "summary": "b"}]
+    )
+
+    assert results == [
+        {"title": "T0", "summary": "S0"},
+        {"title": "T1", "summary": "S1"},
+    ]
+    assert requests[0]["tool_choice"]["name"] == "submit_summaries"
+
+
+def test_anthropic_barista_caches_stable_prompt_prefix():
+    """Test that the system and format instructions go in a cached system block"""
+    from types import SimpleNamespace
+
+    from moka_news.barista import AnthropicBarista
+
+    requests = []
+
+    def create(**kwargs):
+        requests.append(kwargs)
+        usage = SimpleNamespace(
+            cache_read_input_tokens=120, cache_creation_input_tokens=0
+        )
+        return SimpleNamespace(
+            content=[SimpleNamespace(text="TITLE: Cached\nSUMMARY: Prefix")],
+            usage=usage,
+        )
+
+    barista = AnthropicBarista(api_key="test-key", stream=False)
+    barista.client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+    result = barista.generate_summary(
+        {"title": "Original", "summary": "Article body"}, keywords=["python"]
+    )
+
+    assert result == {"title": "Cached", "summary": "Prefix"}
+    system = requests[0]["system"][0]
+    assert system["cache_control"] == {"type": "ephemeral"}
+    assert "python" in system["text"] and "TITLE: <title>" in system["text"]
+    assert "Article body" in requests[0]["messages"][0]["content"]
+    assert "python" not in requests[0]["messages"][0]["content"]
+
+
+def test_openai_offline_batch_round_trip():
+    """Test that offline batches upload JSONL and map results back by custom_id"""
+    import json
+    from types import SimpleNamespace
+
+    from moka_news.barista import OpenAIBarista
+
+    uploads = []
+
+    def files_create(file, purpose):
+        uploads.append(file[1].decode("utf-8"))
+        return SimpleNamespace(id="file-in")
+
+    output = "\n".join(
+        [
+            json.dumps(
+                {
+                    "custom_id": "1",
+                    "response": {
+                        "status_code": 200,
+                        "body": {
+                            "choices": [
+                                {"message": {"content": "TITLE: T1\nSUMMARY: S1"}}
+                            ]
+                        },
+                    },
+                }
+            ),
+            json.dumps(
+                {"custom_id": "0", "response": {"status_code": 500, "body": {}}}
+            ),
+        ]
+    )
+    batch = SimpleNamespace(id="batch-1", status="completed", output_file_id="file-out")
+
+    barista = OpenAIBarista(api_key="test-key")
+    barista.client = SimpleNamespace(
+        files=SimpleNamespace(
+            create=files_create, content=lambda file_id: SimpleNamespace(text=output)
+        ),
+        batches=SimpleNamespace(
+            create=lambda **kwargs: batch, retrieve=lambda batch_id: batch
+        ),
+    )
+    barista.generate_summary = lambda article, *args: {
+        "title": "retried",
+        "summary": "retried",
+    }
+
+    articles = [{"title": "A", "summary": "a"}, {"title": "B", "summary": "b"}]
+    results = barista.generate_summary_offline(articles)
+
+    assert [json.loads(line)["custom_id"] for line in uploads[0].splitlines()] == [
+        "0",
+        "1",
+    ]
+    assert results == [
+        {"title": "retried", "summary": "retried"},
+        {"title": "T1", "summary": "S1"},
+    ]
+
+
+def test_incomplete_providers_fail_at_construction():
+    """Test that providers missing _call_llm or a CLI command cannot be instantiated"""
+    from moka_news.barista import _CLIBarista
+
+    class NoModel(AIProvider):
+        pass
+
+    class NoCommand(_CLIBarista):
+        pass
+
+    with pytest.raises(TypeError):
+        NoModel()
+    with pytest.raises(TypeError):
+        NoCommand()
+
+
+def test_generate_summary_offline_without_batch_api_answers_online():
+    """Test that providers without an offline Batch API never reach its hooks"""
+
+    class OnlineProvider(AIProvider):
+        def _call_llm(self, prompt, prompts, max_tokens):
+            return "TITLE: online\nSUMMARY: s"
+
+    results = OnlineProvider().generate_summary_offline(
+        [{"title": "t", "summary": "s"}] * 2
+    )
+
+    assert [r["title"] for r in results] == ["online", "online"]
+
+
+def test_generate_summary_offline_splits_large_runs(monkeypatch):
+    """Test that runs above OFFLINE_BATCH_MAX_ARTICLES are submitted as several batches"""
+    from moka_news import barista as barista_module
+
+    events = []
+
+    class ChunkedProvider(AIProvider):
+        supports_offline_batch = True
+
+        def _call_llm(self, prompt, prompts, max_tokens):
+            raise AssertionError("every article is answered by the batch")
+
+        def submit_batch(self, articles, *args):
+            events.append(("submit", len(articles)))
+            return f"batch-{len(events)}"
+
+        def poll_batch(self, batch_id, *args):
+            events.append(("poll", batch_id))
+
+        def collect_results(self, batch_id, articles):
+            return [{"title": batch_id, "summary": a["summary"]} for a in articles]
+
+    monkeypatch.setattr(barista_module, "OFFLINE_BATCH_MAX_ARTICLES", 2)
+    articles = [{"title": str(i), "summary": str(i)} for i in range(5)]
+
+    results = ChunkedProvider().generate_summary_offline(articles)
+
+    assert events[:3] == [("submit", 2), ("submit", 2), ("submit", 1)]
+    assert [r["title"] for r in results] == [
+        "batch-1",
+        "batch-1",
+        "batch-2",
+        "batch-2",
+        "batch-3",
+    ]
+    assert [r["summary"] for r in results] == ["0", "1", "2", "3", "4"]
+
+
+def test_barista_batch_mode_uses_offline_batch_api(monkeypatch):
+    """Test that mode='batch' routes large runs through generate_summary_offline"""
+    from moka_news import barista as barista_module
+
+    class OfflineProvider(_SlowProvider):
+        supports_offline_batch = True
+
+        def generate_summary_offline(self, articles, *args):
+            return [{"title": "offline", "summary": a["summary"]} for a in articles]
+
+    monkeypatch.setattr(barista_module, "OFFLINE_BATCH_MIN_ARTICLES", 2)
+    articles = [{"title": str(i), "summary": "word " * 60} for i in range(3)]
+
+    processed = Barista(OfflineProvider(), mode="batch").brew(articles)
+
+    assert [a["ai_title"] for a in processed] == ["offline"] * 3
+
+
+def test_cli_barista_async_runs_cli_without_blocking():
+    """Test that CLI providers await a subprocess in async mode"""
+    import asyncio
+    import sys
+
+    from moka_news.barista import _CLIBarista
+
+    class EchoCLI(_CLIBarista):
+        display_name = "Echo CLI"
+
+        def _command(self, prompt):
+            return [
+                sys.executable,
+                "-c",
+                "print('TITLE: Echoed'); print('SUMMARY: From a subprocess')",
+            ]
+
+    result = asyncio.run(
+        EchoCLI().generate_summary_async({"title": "t", "summary": "s"})
+    )
+
+    assert result == {"title": "Echoed", "summary": "From a subprocess"}
+
+
+def test_cli_barista_caps_parallel_processes(monkeypatch):
+    """Test that async CLI calls run concurrently up to MOKA_CLI_PARALLEL processes"""
+    import asyncio
+    import sys
+
+    from moka_news.barista import _CLIBarista
+
+    class SleepyCLI(_CLIBarista):
+        def _command(self, prompt):
+            return [
+                sys.executable,
+                "-c",
+                "import time; time.sleep(0.2); print('TITLE: Done')",
+            ]
+
+    monkeypatch.setenv("MOKA_CLI_PARALLEL", "2")
+    provider = SleepyCLI()
+    assert provider.rate_limiter.max_concurrent == 2
+
+    running = []
+    peak = []
+    original = asyncio.create_subprocess_exec
+
+    async def tracking_exec(*args, **kwargs):
+        running.append(1)
+        peak.append(len(running))
+        process = await original(*args, **kwargs)
+        wait = process.communicate
+
+        async def communicate():
+            try:
+                return await wait()
+            finally:
+                running.pop()
+
+        process.communicate = communicate
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", tracking_exec)
+
+    async def brew():
+        return await asyncio.gather(
+            *(
+                provider.generate_summary_async({"title": f"t{i}", "summary": "s"})
+                for i in range(4)
+            )
+        )
+
+    results = asyncio.run(brew())
+
+    assert [r["title"] for r in results] == ["Done"] * 4
+    assert max(peak) == 2
+
+
+def test_parse_ai_response_ignores_empty_markers():
+    """Test that an empty marker line does not blank out the result"""
+    from moka_news.barista import _parse_ai_response
+
+    content = "TITLE:   \r\nSUMMARY:  A summary with trailing spaces  \r\n"
+    result = _parse_ai_response(
+        content, {"title": "Original", "summary": "Original summary"}
+    )
+
+    assert result == {"title": "Original", "summary": "A summary with trailing spaces"}
+
+
+def test_provider_only_needs_call_llm():
+    """Test that a provider implementing _call_llm gets prompt building, parsing and fallback"""
+    import asyncio
+
+    class EchoProvider(AIProvider):
+        def _call_llm(self, prompt, prompts, max_tokens):
+            if "fail" in prompt:
+                raise RuntimeError("boom")
+            return "TITLE: Called\nSUMMARY: Through the shared path"
+
+    provider = EchoProvider()
+    article = {"title": "Original", "summary": "Body text"}
+
+    assert provider.generate_summary(article) == {
+        "title": "Called",
+        "summary": "Through the shared path",
+    }
+    assert asyncio.run(provider.generate_summary_async(article))["title"] == "Called"
+    assert (
+        provider.generate_summary({"title": "fail", "summary": "Body"})["title"]
+        == "fail"
+    )
+
+
+def test_mistral_barista_streams_and_stops_after_summary():
+    """Test that Mistral responses are streamed and the stream is closed once SUMMARY ends"""
+    from types import SimpleNamespace
+
+    from moka_news.barista import MistralBarista
+
+    sent = []
+
+    def chat_stream(**request):
+        try:
+            for text in ["TITLE: Streamed\n", "SUMMARY: Short one\n", "never read"]:
+                sent.append(text)
+                yield SimpleNamespace(
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content=text))]
+                )
+        finally:
+            sent.append("closed")
+
+    # The mistralai SDK is optional, so skip __init__ and wire a fake client
+    barista = MistralBarista.__new__(MistralBarista)
+    barista.stream = True
+    barista.rate_limiter = None
+    barista.client = SimpleNamespace(chat_stream=chat_stream)
+    barista._retryable = ()
+
+    result = barista.generate_summary({"title": "t", "summary": "s"})
+
+    assert result == {"title": "Streamed", "summary": "Short one"}
+    assert sent == ["TITLE: Streamed\n", "SUMMARY: Short one\n", "closed"]
+
+
+def test_mistral_barista_retries_rate_limits_and_server_errors_only(monkeypatch):
+    """Test that Mistral API errors are retried for 429/5xx statuses but not 4xx"""
+    import sys
+    from types import ModuleType
+
+    from moka_news import barista as barista_module
+    from moka_news.barista import MistralBarista
+
+    # Mirrors mistralai.exceptions, which is not installed with the test extras
+    exceptions = ModuleType("mistralai.exceptions")
+
+    class MistralException(Exception):
+        pass
+
+    class MistralAPIException(MistralException):
+        def __init__(self, message=None, http_status=None, headers=None):
+            super().__init__(message)
+            self.http_status = http_status
+            self.headers = headers or {}
+
+    class MistralAPIStatusException(MistralAPIException):
+        pass
+
+    class MistralConnectionException(MistralException):
+        pass
+
+    exceptions.MistralAPIException = MistralAPIException
+    exceptions.MistralAPIStatusException = MistralAPIStatusException
+    exceptions.MistralConnectionException = MistralConnectionException
+    monkeypatch.setitem(sys.modules, "mistralai.exceptions", exceptions)
+    sleeps = []
+    monkeypatch.setattr(barista_module.time, "sleep", sleeps.append)
+
+    retryable = MistralBarista.__new__(MistralBarista)._retryable
+
+    def failing(*errors):
+        remaining = list(errors)
+
+        def call():
+            if remaining:
+                raise remaining.pop(0)
+            return "ok"
+
+        return call
+
+    flaky = failing(
+        MistralAPIStatusException("rate limited", 429, {"retry-after": "3"}),
+        MistralAPIException("unavailable", 503),
+        MistralConnectionException("reset"),
+    )
+    assert barista_module._call_with_retries(flaky, retryable) == "ok"
+    assert sleeps[0] == 3.0
+    assert len(sleeps) == 3
+
+    with pytest.raises(MistralAPIException):
+        barista_module._call_with_retries(
+            failing(MistralAPIException("bad request", 400)), retryable
+        )
+    assert len(sleeps) == 3
+
+
+def test_api_providers_share_sdk_client_per_key():
+    """Test that providers built with the same key reuse one SDK client"""
+    from moka_news.barista import OpenAIBarista
+
+    first = OpenAIBarista(api_key="shared-key")
+    second = OpenAIBarista(api_key="shared-key")
+    other = OpenAIBarista(api_key="other-key")
+
+    assert first.client is second.client
+    assert first.client is not other.client
+
+
+def test_api_provider_builds_sdk_client_on_first_use(monkeypatch):
+    """Test that providers defer SDK client construction until a request needs it"""
+    from moka_news import barista as barista_module
+
+    built = []
+    monkeypatch.setattr(
+        barista_module,
+        "_openai_client",
+        lambda api_key: built.append(api_key) or object(),
+    )
+
+    barista = barista_module.OpenAIBarista(api_key="lazy-key")
+    assert built == []
+
+    assert barista.client is barista.client
+    assert built == ["lazy-key"]
+
+
+def test_api_provider_reports_missing_sdk_at_construction(monkeypatch):
+    """Test that a missing SDK still raises ImportError when the provider is created"""
+    from moka_news import barista as barista_module
+
+    monkeypatch.setattr(barista_module.importlib.util, "find_spec", lambda name: None)
+
+    with pytest.raises(ImportError, match="pip install anthropic"):
+        barista_module.AnthropicBarista(api_key="test-key")
+
+
+def test_barista_brew_fallback_leaves_input_articles_untouched():
+    """Test that a provider error yields a fallback copy instead of mutating the article"""
+
+    class FailingProvider(AIProvider):
+        def generate_summary(
+            self,
+            article,
+            keywords=None,
+            prompts=None,
+            max_content_length=2000,
+            max_tokens=300,
+        ):
+            raise RuntimeError("provider down")
+
+        def _call_llm(self, prompt, prompts, max_tokens):
+            raise AssertionError("generate_summary is overridden")
+
+    articles = [{"title": f"Title {i}", "summary": "x" * 500} for i in range(3)]
+    barista = Barista(FailingProvider(), max_workers=2, passthrough_short=False)
+    processed = barista.brew(articles)
+    barista.close()
+
+    assert [a["ai_title"] for a in processed] == ["Title 0", "Title 1", "Title 2"]
+    assert all(len(a["ai_summary"]) < 500 for a in processed)
+    assert all("ai_title" not in a for a in articles)
+
+
+def test_provider_falls_back_for_article_without_summary_key():
+    """Test that a malformed article falls back instead of raising"""
+
+    class EchoProvider(AIProvider):
+        def _call_llm(self, prompt, prompts, max_tokens):
+            return "TITLE: Unused\nSUMMARY: Unused"
+
+    result = EchoProvider().generate_summary({"title": "No body"})
+
+    assert result == {"title": "No body", "summary": ""}
+
+
+def test_multi_barista_stripes_articles_and_skips_failing_provider():
+    """Test that MultiBarista rotates providers and fails over on errors"""
+    from moka_news.barista import MultiBarista
+
+    class NamedProvider(AIProvider):
+        _retryable = (RuntimeError,)
+
+        def __init__(self, name, fail=False):
+            self.name = name
+            self.fail = fail
+            self.calls = 0
+
+        def _call_llm(self, prompt, prompts, max_tokens):
+            self.calls += 1
+            if self.fail:
+                raise RuntimeError("rate limited")
+            return f"TITLE: {self.name}\nSUMMARY: from {self.name}"
+
+    first, second = NamedProvider("first"), NamedProvider("second")
+    multi = MultiBarista([first, second])
+    titles = [
+        multi.generate_summary({"title": "t", "summary": "s"})["title"]
+        for _ in range(4)
+    ]
+
+    assert titles == ["first", "second", "first", "second"]
+
+    broken, healthy = NamedProvider("broken", fail=True), NamedProvider("healthy")
+    multi = MultiBarista([broken, healthy], strategy="failover")
+    titles = [
+        multi.generate_summary({"title": "t", "summary": "s"})["title"]
+        for _ in range(3)
+    ]
+
+    assert titles == ["healthy"] * 3
+    assert broken.calls == 1  # cooling down after the first failure
+
+
+def test_multi_barista_raises_permanent_errors_without_failing_over():
+    """Test that only a provider's retryable errors send the article elsewhere"""
+    from moka_news.barista import MultiBarista
+
+    class RejectingProvider(AIProvider):
+        _retryable = (ConnectionError,)
+
+        def __init__(self):
+            self.calls = 0
+
+        def _call_llm(self, prompt, prompts, max_tokens):
+            self.calls += 1
+            raise ValueError("invalid request")
+
+    class HealthyProvider(AIProvider):
+        def _call_llm(self, prompt, prompts, max_tokens):
+            return "TITLE: healthy\nSUMMARY: s"
+
+    rejecting = RejectingProvider()
+    multi = MultiBarista([rejecting, HealthyProvider()], strategy="failover")
+
+    with pytest.raises(ValueError):
+        multi._call_llm("prompt", None, 100)
+    with pytest.raises(ValueError):
+        multi._call_llm("prompt", None, 100)
+
+    assert rejecting.calls == 2  # not cooled down
+    assert multi._in_flight == [0, 0]
+
+
+def test_multi_barista_rejects_providers_that_bypass_call_llm():
+    """Test that providers overriding generate_summary cannot be combined"""
+    from moka_news.barista import MultiBarista
+
+    class EchoProvider(AIProvider):
+        def _call_llm(self, prompt, prompts, max_tokens):
+            return "TITLE: t\nSUMMARY: s"
+
+    with pytest.raises(ValueError):
+        MultiBarista([EchoProvider(), SimpleBarista()])
+
+
+def test_multi_barista_rejects_unknown_strategy():
+    """Test that an unknown strategy is reported at construction"""
+    from moka_news.barista import MultiBarista
+
+    with pytest.raises(ValueError):
+        MultiBarista([SimpleBarista()], strategy="random")
+
+
+def test_barista_brew_async_bounds_concurrency_by_max_workers():
+    """Test that brew_async awaits at most max_workers provider calls at once"""
+    import asyncio
+
+    provider = _AsyncProvider()
+    articles = [{"title": f"article {i}", "summary": f"summary {i}"} for i in range(8)]
+
+    asyncio.run(Barista(provider, max_workers=2).brew_async(articles))
+
+    assert provider.peak == 2
+
+
+def test_sdk_clients_share_one_http_pool(monkeypatch):
+    """Test that SDK clients for different keys and providers share one HTTP client"""
+    from moka_news import barista as barista_module
+
+    built = []
+    monkeypatch.setattr(barista_module, "_build_http_client", lambda: built.append(1))
+    barista_module._shared_http_client.cache_clear()
+    try:
+        barista_module._shared_http_client()
+        barista_module._shared_http_client()
+    finally:
+        barista_module._shared_http_client.cache_clear()
+
+    assert built == [1]
+
+
+def test_create_barista_default_cache_retries_failed_articles(tmp_path, monkeypatch):
+    """Test that the default-on response cache does not persist a failed call's fallback"""
+    import moka_news.barista as barista_module
+    from moka_news.barista import create_barista
+
+    class FlakyProvider(AIProvider):
+        display_name = "Flaky"
+
+        def __init__(self):
+            self.calls = 0
+
+        def _call_llm(self, prompt, prompts, max_tokens):
+            self.calls += 1
+            if self.calls == 1:
+                raise TimeoutError("provider timed out")
+            return "TITLE: AI Story\nSUMMARY: AI summary"
+
+    provider = FlakyProvider()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(
+        barista_module, "create_ai_provider", lambda name, config: provider
+    )
+    articles = [
+        {"title": "Story", "summary": "text", "link": "https://example.com/story"}
+    ]
+
+    barista = create_barista("openai", {}, max_workers=1)
+    assert barista.exact_cache is not None
+    barista.brew(articles)
+
+    # A later run opens the same on-disk cache and must ask the provider again
+    processed = create_barista("openai", {}, max_workers=1).brew(articles)
+
+    assert processed[0]["ai_title"] == "AI Story"
+    assert provider.calls == 2
@@ -0,0 +1,276 @@
+"""
+Tests for The Barista response caches
+"""
+
+import pytest
+
+from moka_news.barista import AIProvider, Barista
+
+np = pytest.importorskip("numpy")
+
+from moka_news.barista.cache import SemanticCache
+
+
+def _bag_of_words(texts):
+    """Tiny deterministic encoder: hashed bag of lowercase words"""
+    vectors = np.zeros((len(texts), 64), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for word in text.lower().split():
+            vectors[row, hash(word) % 64] += 1.0
+    return vectors
+
+
+class _CountingProvider(AIProvider):
+    """Provider that counts how often it is called"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_summary(
+        self,
+        article,
+        keywords=None,
+        prompts=None,
+        max_content_length=1500,
+        max_tokens=250,
+    ):
+        self.calls += 1
+        return {"title": f"AI {article['title']}", "summary": "AI summary"}
+
+    def _call_llm(self, prompt, prompts, max_tokens):
+        raise AssertionError("generate_summary is overridden")
+
+
+def test_semantic_cache_hit_for_identical_article(tmp_path):
+    """Test that an identical article is served from the cache"""
+    cache = SemanticCache(cache_dir=tmp_path, encoder=_bag_of_words)
+    article = {"title": "Python released", "summary": "A new Python version is out"}
+
+    assert cache.get(article) is None
+    cache.put(article, {"title": "T", "summary": "S"})
+
+    assert cache.get(article) == {"title": "T", "summary": "S"}
+
+
+def test_semantic_cache_miss_below_threshold(tmp_path):
+    """Test that unrelated articles do not hit the cache"""
+    cache = SemanticCache(cache_dir=tmp_path, encoder=_bag_of_words)
+    cache.put(
+        {"title": "Python released", "summary": "new version"},
+        {"title": "T", "summary": "S"},
+    )
+
+    assert (
+        cache.get({"title": "Quantum error correction", "summary": "qubits improve"})
+        is None
+    )
+
+
+def test_semantic_cache_evicts_least_recently_used(tmp_path):
+    """Test that the cache stays within max_entries"""
+    cache = SemanticCache(cache_dir=tmp_path, encoder=_bag_of_words, max_entries=2)
+    first = {"title": "alpha", "summary": "one"}
+    second = {"title": "beta", "summary": "two"}
+    third = {"title": "gamma", "summary": "three"}
+
+    cache.put(first, {"title": "1", "summary": "1"})
+    cache.put(second, {"title": "2", "summary": "2"})
+    cache.get(first)  # first is now more recently used than second
+    cache.put(third, {"title": "3", "summary": "3"})
+
+    assert len(cache) == 2
+    assert cache.get(first) is not None
+    assert cache.get(second) is None
+
+
+def test_semantic_cache_persists_to_disk(tmp_path):
+    """Test that saved entries are reloaded by a new cache instance"""
+    article = {"title": "Persisted story", "summary": "kept on disk"}
+    cache = SemanticCache(cache_dir=tmp_path, encoder=_bag_of_words)
+    cache.put(article, {"title": "T", "summary": "S"})
+    cache.save()
+
+    reloaded = SemanticCache(cache_dir=tmp_path, encoder=_bag_of_words)
+
+    assert reloaded.get(article) == {"title": "T", "summary": "S"}
+
+
+def test_barista_brew_uses_semantic_cache(tmp_path):
+    """Test that brew skips the provider for cached articles"""
+    provider = _CountingProvider()
+    cache = SemanticCache(cache_dir=tmp_path, encoder=_bag_of_words)
+    barista = Barista(provider, cache=cache, max_workers=1)
+    articles = [{"title": "Same story", "summary": "identical text"}]
+
+    first = barista.brew(articles)
+    second = barista.brew(articles)
+
+    assert provider.calls == 1
+    assert first[0]["ai_title"] == second[0]["ai_title"] == "AI Same story"
+
+
+def test_exact_cache_round_trip(tmp_path):
+    """Test that exact cache entries survive a flush and reopen"""
+    from moka_news.barista.cache import ExactCache
+
+    article = {"title": "T", "summary": "S", "link": "https://example.com/a"}
+    cache = ExactCache(tmp_path / "exact.sqlite")
+    key = ExactCache.key(article)
+    assert cache.get(key) is None
+
+    cache.put(key, {"title": "AI T", "summary": "AI S"})
+    cache.close()
+
+    reopened = ExactCache(tmp_path / "exact.sqlite")
+    assert reopened.get(key) == {"title": "AI T", "summary": "AI S"}
+
+
+def test_exact_cache_evicts_oldest_rows(tmp_path):
+    """Test that the exact cache keeps at most max_entries rows on disk"""
+    from moka_news.barista.cache import ExactCache
+
+    cache = ExactCache(tmp_path / "exact.sqlite", max_entries=2)
+    for i in range(3):
+        cache.put(
+            ExactCache.key({"link": f"https://example.com/{i}"}),
+            {"title": str(i), "summary": ""},
+        )
+    cache.flush()
+
+    (count,) = cache._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+    assert count == 2
+
+
+def test_barista_brew_uses_exact_cache(tmp_path):
+    """Test that brew answers repeated links from the exact cache"""
+    from moka_news.barista.cache import ExactCache
+
+    provider = _CountingProvider()
+    barista = Barista(
+        provider, exact_cache=ExactCache(tmp_path / "exact.sqlite"), max_workers=1
+    )
+    articles = [
+        {"title": "Story", "summary": "text", "link": "https://example.com/story"}
+    ]
+
+    barista.brew(articles)
+    processed = barista.brew(articles)
+
+    assert provider.calls == 1
+    assert processed[0]["ai_title"] == "AI Story"
+
+
+def test_barista_brew_does_not_cache_provider_failures(tmp_path):
+    """Test that a fallback from a failed call is retried instead of served from the caches"""
+    from moka_news.barista.cache import ExactCache
+
+    class _FlakyProvider(AIProvider):
+        display_name = "Flaky"
+
+        def __init__(self):
+            self.calls = 0
+
+        def _call_llm(self, prompt, prompts, max_tokens):
+            self.calls += 1
+            if self.calls == 1:
+                raise ConnectionError("provider unavailable")
+            return "TITLE: AI Story\nSUMMARY: AI summary"
+
+    provider = _FlakyProvider()
+    barista = Barista(
+        provider,
+        exact_cache=ExactCache(tmp_path / "exact.sqlite"),
+        cache=SemanticCache(cache_dir=tmp_path, encoder=_bag_of_words),
+        max_workers=1,
+    )
+    articles = [
+        {"title": "Story", "summary": "text", "link": "https://example.com/story"}
+    ]
+
+    failed = barista.brew(articles)
+    recovered = barista.brew(articles)
+    cached = barista.brew(articles)
+
+    assert failed[0]["ai_title"] == "Story"
+    assert recovered[0]["ai_title"] == "AI Story"
+    assert cached[0]["ai_title"] == "AI Story"
+    assert provider.calls == 2
+
+
+def test_semantic_cache_get_many_embeds_in_one_call(tmp_path):
+    """Test that batched lookups call the encoder once for all articles"""
+    calls = []
+
+    def encoder(texts):
+        calls.append(len(texts))
+        return _bag_of_words(texts)
+
+    cache = SemanticCache(cache_dir=tmp_path, encoder=encoder)
+    known = {"title": "Known story", "summary": "seen before"}
+    cache.put_many([known], [{"title": "T", "summary": "S"}])
+    calls.clear()
+
+    results = cache.get_many([known, {"title": "Fresh news", "summary": "never seen"}])
+
+    assert calls == [2]
+    assert results == [{"title": "T", "summary": "S"}, None]
+
+
+def test_exact_cache_ignores_expired_entries(tmp_path):
+    """Test that entries older than max_age are treated as misses"""
+    from moka_news.barista.cache import ExactCache
+
+    cache = ExactCache(tmp_path / "exact.sqlite")
+    key = ExactCache.key(
+        {"link": "https://example.com/a", "title": "A", "summary": "a"}
+    )
+    cache.put(key, {"title": "T", "summary": "S"})
+    cache.close()
+
+    assert ExactCache(tmp_path / "exact.sqlite").get(key) == {
+        "title": "T",
+        "summary": "S",
+    }
+    assert ExactCache(tmp_path / "exact.sqlite", max_age=-1).get(key) is None
+
+
+def test_exact_cache_key_changes_with_content():
+    """Test that an updated article under the same link gets a new key"""
+    from moka_news.barista.cache import ExactCache
+
+    original = {
+        "link": "https://example.com/a",
+        "title": "A",
+        "summary": "first version",
+    }
+    updated = dict(original, summary="second version")
+
+    assert ExactCache.key(original) != ExactCache.key(updated)
+
+
+def test_exact_cache_namespace_covers_request_settings(tmp_path):
+    """Test that the exact cache misses when prompts or limits change, not keyword order"""
+    from moka_news.barista.cache import ExactCache
+
+    provider = _CountingProvider()
+    cache = ExactCache(tmp_path / "exact.sqlite")
+    articles = [
+        {"title": "Story", "summary": "text", "link": "https://example.com/story"}
+    ]
+
+    Barista(provider, keywords=["ai", "python"], exact_cache=cache, max_workers=1).brew(
+        articles
+    )
+    Barista(provider, keywords=["python", "ai"], exact_cache=cache, max_workers=1).brew(
+        articles
+    )
+    assert provider.calls == 1
+
+    Barista(
+        provider,
+        keywords=["ai", "python"],
+        exact_cache=cache,
+        max_workers=1,
+        max_tokens=100,
+    ).brew(articles)
+    assert provider.calls == 2
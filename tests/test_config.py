@@ -137,3 +137,99 @@ def test_merge_configs_preserves_editorial_settings():
     assert result["editorial"]["editorials_dir"] == "/custom/path"
     assert result["editorial"]["opener_command"] == "code"
     assert result["ai"]["provider"] == "simple"  # Preserved from default
+
+
+def test_load_config_reparses_file_after_change(tmp_path):
+    """Test that cached parses are reused only while the file is unchanged"""
+    import os
+
+    config_path = tmp_path / "moka-news.yaml"
+    config_path.write_text("ai:\n  provider: openai\n")
+
+    first = load_config(str(config_path))
+    first["ai"]["provider"] = "modified by caller"
+    assert load_config(str(config_path))["ai"]["provider"] == "openai"
+
+    config_path.write_text("ai:\n  provider: anthropic\n")
+    stat = config_path.stat()
+    os.utime(config_path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert load_config(str(config_path))["ai"]["provider"] == "anthropic"
+
+
+def test_load_config_notices_same_mtime_size_change(tmp_path):
+    """Test that a rewrite keeping the mtime but changing the size is picked up"""
+    import os
+
+    config_path = tmp_path / "moka-news.yaml"
+    config_path.write_text("ai:\n  provider: openai\n")
+    mtime = config_path.stat().st_mtime_ns
+    assert load_config(str(config_path))["ai"]["provider"] == "openai"
+
+    config_path.write_text("ai:\n  provider: mistral-cli\n")
+    os.utime(config_path, ns=(mtime, mtime))
+
+    assert load_config(str(config_path))["ai"]["provider"] == "mistral-cli"
+
+
+def test_load_config_does_not_modify_defaults(monkeypatch):
+    """Test that environment overrides never leak into DEFAULT_CONFIG"""
+    monkeypatch.setenv("OPENAI_API_KEY", "env-key")
+
+    config = load_config("/nonexistent/path/config.yaml")
+
+    assert config["ai"]["api_keys"]["openai"] == "env-key"
+    assert DEFAULT_CONFIG["ai"]["api_keys"]["openai"] is None
+
+
+def test_load_config_returns_independent_lists():
+    """Test that lists in a loaded config can be changed without affecting later loads"""
+    config = load_config("/nonexistent/path/config.yaml")
+    config["feeds"]["urls"].append("https://example.com/feed")
+    config["refresh"]["allowed_times"].clear()
+
+    fresh = load_config("/nonexistent/path/config.yaml")
+
+    assert fresh["feeds"]["urls"] == DEFAULT_CONFIG["feeds"]["urls"]
+    assert "https://example.com/feed" not in fresh["feeds"]["urls"]
+    assert fresh["refresh"]["allowed_times"] == ["08:00", "20:00"]
+
+
+def test_merge_configs_leaves_inputs_untouched():
+    """Test that merge_configs returns a new dictionary"""
+    default = {"ai": {"provider": "simple", "api_keys": {"openai": None}}}
+
+    result = merge_configs(default, {"ai": {"api_keys": {"openai": "key"}}})
+
+    assert result["ai"]["api_keys"]["openai"] == "key"
+    assert default["ai"]["api_keys"]["openai"] is None
+
+
+def test_merge_configs_result_does_not_alias_user_config():
+    """Test that changing the merged config leaves the user's dictionary alone"""
+    user = {
+        "feeds": {"urls": ["https://example.com/rss"]},
+        "extra": {"nested": {"value": 1}},
+    }
+
+    result = merge_configs({"feeds": {"urls": []}}, user)
+    result["feeds"]["urls"].append("https://example.org/rss")
+    result["extra"]["nested"]["value"] = 2
+
+    assert user == {
+        "feeds": {"urls": ["https://example.com/rss"]},
+        "extra": {"nested": {"value": 1}},
+    }
+
+
+def test_load_config_does_not_copy_config_to_cache_dir(tmp_path, monkeypatch):
+    """Test that loading a config with API keys writes nothing to the cache directory"""
+    home = tmp_path / "home"
+    monkeypatch.setenv("HOME", str(home))
+    config_path = tmp_path / "moka-news.yaml"
+    config_path.write_text(
+        "ai:\n  provider: openai\n  api_keys:\n    openai: sk-secret\n"
+    )
+
+    assert load_config(str(config_path))["ai"]["api_keys"]["openai"] == "sk-secret"
+    assert not (home / ".cache").exists()
@@ -2,10 +2,11 @@
 Tests for The Cup component
 """
 
-from moka_news.cup import Cup, ArticleCard
 from datetime import datetime
 from unittest.mock import MagicMock
 
+from moka_news.cup import ArticleCard, Cup
+
 
 def test_cup_initialization():
     """Test that Cup can be initialized"""
@@ -117,3 +118,50 @@ def test_cup_theme_toggle_from_custom():
     # Toggle again should switch to dark
     app.action_toggle_theme()
     assert app.theme == "rose-pine", "Second toggle should switch to dark"
+
+
+def test_cup_rebuild_view_updates_editorial_in_place():
+    """Test that a new editorial reuses the mounted view instead of re-mounting it"""
+    import asyncio
+
+    from textual.widgets import Markdown
+
+    from moka_news.cup import EditorialView
+
+    async def run():
+        app = Cup(editorial_content="# Monday")
+        async with app.run_test() as pilot:
+            view = app.query_one(EditorialView)
+
+            app.editorial_content = "# Tuesday"
+            app._rebuild_view()
+            await pilot.pause()
+
+            assert app.query_one(EditorialView) is view
+            assert app.query_one(Markdown).source == "# Tuesday"
+
+    asyncio.run(run())
+
+
+def test_editorial_list_screen_returns_selected_editorial():
+    """Test that choosing an entry in the history list dismisses with that editorial"""
+    import asyncio
+
+    from moka_news.cup import EditorialListScreen
+
+    editorials = [
+        {"title": f"Editorial {day}", "timestamp": datetime(2024, 1, day, 8), "filepath": f"{day}.md"}
+        for day in (1, 2, 3)
+    ]
+
+    async def run():
+        app = Cup(editorial_content="# Today")
+        selected = []
+        async with app.run_test() as pilot:
+            app.push_screen(EditorialListScreen(editorials), selected.append)
+            await pilot.pause()
+            await pilot.press("down", "enter")
+            await pilot.pause()
+        return selected
+
+    assert asyncio.run(run()) == [editorials[1]]
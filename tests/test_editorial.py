@@ -196,3 +196,60 @@ def test_editorial_generator_default_directory():
     
     expected_dir = Path.home() / ".config" / "moka-news" / "editorials"
     assert generator.editorials_dir == expected_dir
+
+
+def test_load_editorial_rereads_rewritten_file(monkeypatch):
+    """Test that re-opening an editorial is cached until the file changes"""
+    import builtins
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        generator = EditorialGenerator(ai_provider=SimpleBarista(), editorials_dir=tmpdir)
+        filepath = Path(tmpdir) / "2026-02-13_08-00.md"
+        filepath.write_text("# First\n", encoding="utf-8")
+
+        opened = []
+        real_open = builtins.open
+
+        def counting_open(file, *args, **kwargs):
+            if str(file) == str(filepath):
+                opened.append(file)
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", counting_open)
+
+        assert generator.load_editorial(filepath) == "# First\n"
+        assert generator.load_editorial(filepath) == "# First\n"
+        assert len(opened) == 1
+
+        filepath.write_text("# Second edition\n", encoding="utf-8")
+        assert generator.load_editorial(filepath) == "# Second edition\n"
+
+
+def test_list_editorials_parses_each_file_once(monkeypatch):
+    """Test that listing history again reuses parsed titles for unchanged files"""
+    import moka_news.editorial as editorial_module
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        generator = EditorialGenerator(ai_provider=SimpleBarista(), editorials_dir=tmpdir)
+        filepath = Path(tmpdir) / "2026-02-13_08-00.md"
+        filepath.write_text("# Morning Brew\n\nBody\n", encoding="utf-8")
+
+        parsed = []
+        real_strptime = editorial_module.datetime.strptime
+
+        class CountingDatetime(datetime):
+            @classmethod
+            def strptime(cls, value, fmt):
+                parsed.append(value)
+                return real_strptime(value, fmt)
+
+        monkeypatch.setattr(editorial_module, "datetime", CountingDatetime)
+
+        first = generator.list_editorials()
+        second = generator.list_editorials()
+        assert first == second
+        assert first[0]["title"] == "Morning Brew"
+        assert parsed == ["2026-02-13_08-00"]
+
+        filepath.write_text("# Evening Brew, revised\n", encoding="utf-8")
+        assert generator.list_editorials()[0]["title"] == "Evening Brew, revised"
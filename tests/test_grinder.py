@@ -38,3 +38,19 @@ def test_grinder_grind_returns_tuple():
     articles, last_update = result
     assert isinstance(articles, list)
     assert isinstance(last_update, datetime)
+
+
+def test_grinder_stream_yields_articles_per_feed(monkeypatch):
+    """Test that stream() yields each feed's articles and skips empty feeds"""
+    grinder = Grinder(["feed-a", "feed-b", "feed-empty"])
+    monkeypatch.setattr(
+        grinder,
+        "_grind_feed",
+        lambda url: (
+            [] if url == "feed-empty" else [{"title": url, "summary": "", "link": url}]
+        ),
+    )
+
+    batches = list(grinder.stream(max_workers=2))
+
+    assert sorted(batch[0]["title"] for batch in batches) == ["feed-a", "feed-b"]
@@ -2,10 +2,12 @@
 Additional tests for refresh and auto-refresh functionality
 """
 
-from moka_news.cup import Cup
 from datetime import datetime, time
+
 import pytest
 
+from moka_news.cup import Cup
+
 
 def test_cup_with_last_update():
     """Test that Cup properly stores and formats last update time"""
@@ -71,3 +73,136 @@ def test_format_subtitle_with_different_times():
     app3 = Cup([], evening)
     assert "20:45:30" in app3.sub_title
     assert "25/12/2026" in app3.sub_title
+
+
+def test_next_refresh_at_picks_the_following_slot():
+    """Test that the next auto-refresh is the earliest allowed time strictly ahead"""
+    from moka_news.cup import _next_refresh_at
+
+    allowed = [time(20, 0), time(8, 0)]
+
+    assert _next_refresh_at(datetime(2026, 2, 13, 7, 0), allowed) == datetime(2026, 2, 13, 8, 0)
+    assert _next_refresh_at(datetime(2026, 2, 13, 8, 0), allowed) == datetime(2026, 2, 13, 20, 0)
+    # After the last slot of the day, the earliest slot tomorrow (not allowed[0])
+    assert _next_refresh_at(datetime(2026, 2, 13, 21, 0), allowed) == datetime(2026, 2, 14, 8, 0)
+
+
+def test_sleep_until_rechecks_the_clock_in_bounded_steps(monkeypatch):
+    """Test that the auto-refresh wait re-reads the wall clock instead of one long sleep"""
+    import asyncio
+    from datetime import timedelta
+
+    from moka_news import cup
+
+    clock = [datetime(2026, 2, 13, 7, 0)]
+    sleeps = []
+
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock[0]
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += timedelta(seconds=seconds)
+        if len(sleeps) == 2:
+            # Laptop suspended: the wall clock jumps ahead of the monotonic sleep
+            clock[0] += timedelta(minutes=40)
+
+    monkeypatch.setattr(cup, "datetime", FakeDatetime)
+    monkeypatch.setattr(cup.asyncio, "sleep", fake_sleep)
+
+    asyncio.run(cup._sleep_until(datetime(2026, 2, 13, 8, 0)))
+
+    assert all(s <= cup.AUTO_REFRESH_RECHECK_INTERVAL for s in sleeps)
+    assert sum(sleeps) == 20 * 60
+
+
+def test_refresh_runs_callback_off_the_event_loop_thread():
+    """Test that a manual refresh fetches in a worker thread and then updates the app"""
+    import asyncio
+    import threading
+
+    callback_threads = []
+    refreshed_at = datetime(2026, 2, 13, 9, 0)
+
+    def refresh():
+        callback_threads.append(threading.current_thread())
+        return [{"title": "Fresh"}], refreshed_at
+
+    async def run():
+        app = Cup([], refresh_callback=refresh, auto_refresh_time=None)
+        async with app.run_test() as pilot:
+            await app.action_refresh()
+            await pilot.pause()
+        return app
+
+    app = asyncio.run(run())
+
+    assert callback_threads and callback_threads[0] is not threading.main_thread()
+    assert app.articles == [{"title": "Fresh"}]
+    assert app.last_update == refreshed_at
+
+
+def test_refresh_progress_updates_status_line_instead_of_toasts():
+    """Test that routine refresh progress is shown in the status line, not as notifications"""
+    import asyncio
+
+    from textual.widgets import Label
+
+    def refresh():
+        return [{"title": "Fresh"}], datetime(2026, 2, 13, 9, 0)
+
+    async def run():
+        app = Cup([], refresh_callback=refresh, auto_refresh_time=None)
+        async with app.run_test() as pilot:
+            notifications = []
+            app.notify = lambda *args, **kwargs: notifications.append(args)
+            await app.action_refresh()
+            await pilot.pause()
+            status = str(app.query_one("#refresh-status", Label).render())
+        return status, notifications
+
+    status, notifications = asyncio.run(run())
+
+    assert "Refreshed 1 articles" in status
+    assert notifications == []
+
+
+def test_format_subtitle_is_memoized_per_update_time():
+    """Test that repeated subtitle formatting for one update time reuses the cached string"""
+    last_update = datetime(2026, 2, 13, 8, 0, 0)
+    app = Cup([], last_update)
+
+    assert app._format_subtitle() is app._format_subtitle()
+    assert app._format_subtitle() is Cup([], last_update)._format_subtitle()
+
+
+def test_overlapping_refreshes_run_the_callback_once():
+    """Test that a refresh requested while another is running is skipped"""
+    import asyncio
+    import threading
+
+    calls = []
+    release = threading.Event()
+
+    def refresh():
+        calls.append(1)
+        release.wait(5)
+        return [{"title": "Fresh"}], datetime(2026, 2, 13, 9, 0)
+
+    async def run():
+        app = Cup([], refresh_callback=refresh, auto_refresh_time=None)
+        async with app.run_test() as pilot:
+            manual = asyncio.ensure_future(app.action_refresh())
+            await pilot.pause()
+            # Second key press and a scheduled refresh while the first is fetching
+            await app.action_refresh()
+            await app._perform_auto_refresh()
+            release.set()
+            await manual
+            await pilot.pause()
+
+    asyncio.run(run())
+
+    assert calls == [1]